@@ -0,0 +1,86 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark of the memory held by bulk member and group listings.
+
+Compares keeping the validated models of every member and group of a large
+organization with keeping their compact records, by the memory still
+allocated per entry.
+
+Usage: python dev/benchmarks/compact_records.py [--members N] [--groups N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List
+
+import payloads
+
+from lightdash_ai_tools.lightdash.api.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1,
+)
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.compact import (
+    compact_groups,
+    compact_members,
+)
+
+
+def retained(build: Callable[[], List[object]]) -> int:
+    """Bytes still allocated by the list `build` returns."""
+    gc.collect()
+    tracemalloc.start()
+    entries = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entries
+    return size
+
+
+def report(name: str, count: int, models: int, records: int) -> None:
+    print(f"{name:<8} models {models / count:>7.0f}B  records {records / count:>7.0f}B  reduced by {1 - records / models:.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=50000, help="Number of members of the organization")
+    parser.add_argument("--groups", type=int, default=20000, help="Number of groups of the organization")
+    args = parser.parse_args()
+
+    client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark")
+    members_call = ListOrganizationMembersV1(lightdash_client=client)
+    groups_call = ListGroupsInOrganizationV1(lightdash_client=client)
+    members_body = payloads.to_body(payloads.organization_members, args.members)
+    groups_body = payloads.to_body(payloads.groups, args.groups)
+
+    def parse_members():
+        return members_call._parse_response(members_body).results.data
+
+    def parse_groups():
+        return groups_call._parse_response(groups_body).results.data
+
+    print("memory retained per entry")
+    report("members", args.members, retained(parse_members), retained(lambda: compact_members(parse_members())))
+    report("groups", args.groups, retained(parse_groups), retained(lambda: compact_groups(parse_groups())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark of the cost of the drift monitor, and of skipping validation.
+
+Times parsing member and group listings with the regular validators, with the
+drift monitor at several sample rates, on the fast path of trusted endpoints,
+and by building the models with `model_construct` from the decoded body,
+which skips validation.
+
+Usage: python dev/benchmarks/drift_monitor.py [--entries N] [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Type
+
+import payloads
+from pydantic import BaseModel, SecretStr
+
+from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from lightdash_ai_tools.lightdash.api.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1,
+)
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.drift import DriftMonitor
+from lightdash_ai_tools.lightdash.models.list_groups_in_organization_v1 import (
+    Group,
+    GroupPagination,
+    ListGroupsInOrganizationV1Response,
+    ListGroupsInOrganizationV1Results,
+)
+from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
+    ListOrganizationMembersV1Response,
+    ListOrganizationMembersV1Results,
+    OrganizationMemberModel,
+    PaginationModel,
+)
+
+
+def construct_listing(
+    body: bytes,
+    response_model: Type[BaseModel],
+    results_model: Type[BaseModel],
+    pagination_model: Type[BaseModel],
+    build_item: Callable[[Dict[str, Any]], BaseModel],
+) -> BaseModel:
+    """Build a listing response without validating it."""
+    document = json.loads(body)
+    results = document["results"]
+    return response_model.model_construct(
+        status=document["status"],
+        results=results_model.model_construct(
+            pagination=pagination_model.model_construct(**results["pagination"]),
+            data=[build_item(item) for item in results["data"]],
+        ),
+    )
+
+
+def construct_members(body: bytes) -> BaseModel:
+    """Build a member listing without validating it."""
+    return construct_listing(
+        body,
+        ListOrganizationMembersV1Response,
+        ListOrganizationMembersV1Results,
+        PaginationModel,
+        lambda item: OrganizationMemberModel.model_construct(**{**item, "email": SecretStr(item["email"])}),
+    )
+
+
+def construct_groups(body: bytes) -> BaseModel:
+    """Build a group listing without validating it, leaving dates as strings."""
+    return construct_listing(
+        body,
+        ListGroupsInOrganizationV1Response,
+        ListGroupsInOrganizationV1Results,
+        GroupPagination,
+        lambda item: Group.model_construct(**item),
+    )
+
+
+def best_of_each(functions: List[Callable[[], object]], repeat: int) -> List[float]:
+    """
+    Best time of one call of every function, in seconds.
+
+    The rounds of the functions alternate, so that load on the machine
+    weighs on all of them instead of skewing their comparison.
+    """
+    timers = [timeit.Timer(function) for function in functions]
+    number, _ = timers[0].autorange()
+    best = [float("inf")] * len(timers)
+    for _ in range(repeat):
+        for index, timer in enumerate(timers):
+            best[index] = min(best[index], timer.timeit(number=number) / number)
+    return best
+
+
+def parse_with(api_class: Type[BaseLightdashApiCaller], monitor: Optional[DriftMonitor], body: bytes) -> Callable[[], object]:
+    """Parsing of a body by an API caller of a client using `monitor`."""
+    client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark", drift_monitor=monitor)
+    api_call = api_class(lightdash_client=client)
+    return lambda: api_call._parse(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=10000, help="Number of members and groups of the listings")
+    parser.add_argument("--repeat", type=int, default=9, help="Number of timed rounds per case")
+    args = parser.parse_args()
+
+    cases = [
+        (ListOrganizationMembersV1, payloads.to_body(payloads.organization_members, args.entries), construct_members),
+        (ListGroupsInOrganizationV1, payloads.to_body(payloads.groups, args.entries), construct_groups),
+    ]
+    print(f"{'endpoint':<28} {'parsing':<24} {'time':>10}")
+    for api_class, body, construct in cases:
+        endpoint = api_class.__name__
+        labelled = [
+            ("validated", parse_with(api_class, None, body)),
+            ("validated, 1% checked", parse_with(api_class, DriftMonitor(sample_rate=0.01, seed=0), body)),
+            ("validated, all checked", parse_with(api_class, DriftMonitor(sample_rate=1.0), body)),
+            (
+                "trusted, 1% checked",
+                parse_with(api_class, DriftMonitor(sample_rate=0.01, seed=0, trusted_endpoints=[endpoint]), body),
+            ),
+            ("model_construct", lambda construct=construct, body=body: construct(body)),
+        ]
+        timings = best_of_each([function for _, function in labelled], args.repeat)
+        for (label, _), elapsed in zip(labelled, timings, strict=True):
+            print(f"{endpoint:<28} {label:<24} {elapsed * 1000:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
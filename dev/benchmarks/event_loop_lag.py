@@ -0,0 +1,93 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark of the event-loop blocking caused by parsing large responses.
+
+Parses large responses the way asynchronous calls do, while a probe coroutine
+measures how late its 1ms sleeps wake up. Compares parsing on the event loop
+with parsing above the client's offload threshold on a worker thread.
+
+Usage: python dev/benchmarks/event_loop_lag.py [--fields N] [--members N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List, Tuple
+
+import payloads
+
+from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import GetExploreV1
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+
+PROBE_INTERVAL = 0.001
+# Wake-ups later than this count as time the event loop was blocked.
+STALL_THRESHOLD = 0.002
+
+
+async def probe(stop: asyncio.Event, delays: List[float]) -> None:
+    """Record how late every sleep of the probe wakes up."""
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        delays.append(time.perf_counter() - started_at - PROBE_INTERVAL)
+
+
+async def measure(api_call: BaseLightdashApiCaller, body: bytes, rounds: int) -> Tuple[float, float, float]:
+    """Longest stall, blocked time and wall time of a parse, in seconds."""
+    stop = asyncio.Event()
+    delays: List[float] = []
+    probe_task = asyncio.create_task(probe(stop, delays))
+    await asyncio.sleep(0.01)
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        await api_call._aparse(body)
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    await probe_task
+    blocked = sum(delay for delay in delays if delay > STALL_THRESHOLD)
+    return max(delays), blocked / rounds, elapsed / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=5000, help="Number of fields of the explore")
+    parser.add_argument("--members", type=int, default=20000, help="Number of members of the listing")
+    parser.add_argument("--rounds", type=int, default=5, help="Number of parses per case")
+    args = parser.parse_args()
+
+    cases = [
+        ("explore", GetExploreV1, payloads.to_body(payloads.explore, args.fields, 10, True)),
+        ("members", ListOrganizationMembersV1, payloads.to_body(payloads.organization_members, args.members)),
+    ]
+    print(f"{'response':<9} {'body':>8} {'parsing':<12} {'longest stall':>14} {'blocked':>10} {'wall':>10}")
+    for name, api_class, body in cases:
+        for label, threshold in (("event loop", None), ("thread", 1024 * 1024)):
+            client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark", parse_offload_threshold=threshold)
+            stall, blocked, elapsed = asyncio.run(measure(api_class(lightdash_client=client), body, args.rounds))
+            print(
+                f"{name:<9} {len(body) / 1024 / 1024:>6.1f}MB {label:<12}"
+                f" {stall * 1000:>12.1f}ms {blocked * 1000:>8.1f}ms {elapsed * 1000:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
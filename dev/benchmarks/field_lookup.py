@@ -0,0 +1,75 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark of resolving field references in an explore.
+
+Compares scanning the dimensions and metrics of an explore, as field lookups
+did before the explore had an index, with the explore's reference index.
+
+Usage: python dev/benchmarks/field_lookup.py [--fields N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from typing import Callable, List, Optional, Union
+
+import payloads
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import GetExploreV1
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Results,
+    Metric,
+)
+
+
+def scan(explore: GetExploreV1Results, reference: str) -> Optional[Union[Dimension, Metric]]:
+    """Find a field by scanning the dimensions and metrics."""
+    for fields in (explore.dimensions or {}, explore.metrics or {}):
+        for field_id, field in fields.items():
+            if field_id == reference or field.reference == reference:
+                return field
+    return None
+
+
+def best_of(function: Callable[[], object], repeat: int) -> float:
+    """Best time of one call, in seconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=5000, help="Number of fields of the explore")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed rounds per case")
+    args = parser.parse_args()
+
+    client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark")
+    explore = GetExploreV1(lightdash_client=client)._parse_response(payloads.to_body(payloads.explore, args.fields)).results
+    references: List[str] = [*explore.dimensions, *explore.metrics][:: max(1, args.fields // 100)]
+    assert all(scan(explore, reference) is explore.get_field(reference) for reference in references)
+
+    before = best_of(lambda: [scan(explore, reference) for reference in references], args.repeat) / len(references)
+    after = best_of(lambda: [explore.get_field(reference) for reference in references], args.repeat) / len(references)
+    print(f"explore of {args.fields} fields, {len(references)} lookups")
+    print(f"scan  {before * 1e6:>10.2f}us per lookup")
+    print(f"index {after * 1e6:>10.2f}us per lookup ({before / after:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark of the memory saved by interning repeated explore strings.
+
+Compares the memory retained by a 5,000-field explore parsed with the
+explore models, whose table, tableLabel, fieldType, type and groups are
+interned, and with copies of the models declaring them as plain strings.
+Both the JSON body and the decoded document are parsed.
+
+Usage: python dev/benchmarks/interned_strings.py [--fields N]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import payloads
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Response,
+    GetExploreV1Results,
+    Metric,
+)
+
+INTERNED_FIELDS = ("table", "tableLabel", "fieldType", "type")
+
+
+def plain_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Copy of a field model declaring the interned fields as plain strings."""
+    fields: Dict[str, Any] = {name: (Optional[str], None) for name in INTERNED_FIELDS}
+    fields["groups"] = (Optional[List[str]], None)
+    return create_model(model.__name__, __base__=model, **fields)
+
+
+def plain_response_model() -> Type[BaseModel]:
+    """Copy of the explore response model without interning."""
+    results = create_model(
+        GetExploreV1Results.__name__,
+        __base__=GetExploreV1Results,
+        dimensions=(Optional[Dict[str, plain_model(Dimension)]], None),
+        metrics=(Optional[Dict[str, plain_model(Metric)]], None),
+    )
+    return create_model(GetExploreV1Response.__name__, __base__=GetExploreV1Response, results=(results, None))
+
+
+def measure(parse: Callable[[], object]) -> Tuple[int, float]:
+    """Retained bytes and duration of a parse."""
+    parse()
+    gc.collect()
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    response = parse()
+    elapsed = time.perf_counter() - started_at
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return retained, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=5000, help="Number of fields of the explore")
+    args = parser.parse_args()
+
+    body = payloads.to_body(payloads.explore, args.fields)
+    adapters = {"plain": TypeAdapter(plain_response_model()), "interned": TypeAdapter(GetExploreV1Response)}
+    print(f"explore of {args.fields} fields, {len(body) / 1024:.0f}KB")
+    for source, parse in (
+        ("JSON body", lambda adapter: adapter.validate_json(body)),
+        ("decoded document", lambda adapter: adapter.validate_python(json.loads(body))),
+    ):
+        results = {name: measure(lambda parse=parse, adapter=adapter: parse(adapter)) for name, adapter in adapters.items()}
+        for name, (retained, elapsed) in results.items():
+            print(f"{source:<17} {name:<9} retained {retained / 1024 / 1024:>6.2f}MB  parsed in {elapsed * 1000:>7.2f}ms")
+        print(f"{source:<17} retained memory reduced by {1 - results['interned'][0] / results['plain'][0]:.0%}")
+
+
+if __name__ == "__main__":
+    main()
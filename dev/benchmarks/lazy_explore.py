@@ -0,0 +1,65 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of listing the fields of a large explore.
+
+Compares parsing the explore eagerly with parsing it lazily and listing its
+field IDs, the path of tools that only need field names.
+
+Usage: python dev/benchmarks/lazy_explore.py [--fields N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+import payloads
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import (
+    GetExploreV1,
+    GetLazyExploreV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=5000, help="Number of fields of the explore")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed rounds per case")
+    args = parser.parse_args()
+
+    client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark")
+    body = payloads.to_body(payloads.explore, args.fields)
+    eager_api_call = GetExploreV1(lightdash_client=client)
+    lazy_api_call = GetLazyExploreV1(lightdash_client=client)
+
+    def eager() -> int:
+        explore = eager_api_call._parse_response(body).results
+        return len([*explore.dimensions, *explore.metrics])
+
+    def lazy() -> int:
+        return len(lazy_api_call._parse_response(body).results.field_ids())
+
+    print(f"explore of {args.fields} fields, {len(body) / 1024:.0f}KB")
+    timings = {}
+    for name, function in (("eager", eager), ("lazy", lazy)):
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        timings[name] = min(timer.repeat(repeat=args.repeat, number=number)) / number
+        print(f"{name:<6} {timings[name] * 1000:>10.3f}ms")
+    print(f"speed-up {timings['eager'] / timings['lazy']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark of filter and count queries over the members of an organization.
+
+Compares looping over the member models with querying the columnar member
+table built from them.
+
+Usage: python dev/benchmarks/member_table.py [--members N] [--repeat N]
+"""
+
+import argparse
+import time
+import timeit
+from typing import Callable
+
+import payloads
+
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.member_table import MemberTable
+
+
+def best_of(function: Callable[[], object], repeat: int) -> float:
+    """Best time of one call, in seconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=100000, help="Number of members of the organization")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed rounds per query")
+    args = parser.parse_args()
+
+    client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark")
+    body = payloads.to_body(payloads.organization_members, args.members)
+    members = ListOrganizationMembersV1(lightdash_client=client)._parse_response(body).results.data
+
+    started_at = time.perf_counter()
+    table = MemberTable(members)
+    print(f"{args.members} members, table built in {(time.perf_counter() - started_at) * 1000:.1f}ms")
+
+    queries = [
+        (
+            "count active admins",
+            lambda: sum(1 for member in members if member.role == "admin" and member.isActive),
+            lambda: table.count(role="admin", is_active=True),
+        ),
+        (
+            "count editors or developers",
+            lambda: sum(1 for member in members if member.role in ("editor", "developer")),
+            lambda: table.count(role=["editor", "developer"]),
+        ),
+        (
+            "filter inactive members",
+            lambda: [member.userUuid for member in members if not member.isActive],
+            lambda: table.filter(is_active=False),
+        ),
+        (
+            "count active members by role",
+            lambda: {role: sum(1 for member in members if member.role == role and member.isActive) for role in payloads.ROLES},
+            lambda: table.count_by_role(is_active=True),
+        ),
+    ]
+    print(f"{'query':<30} {'models':>10} {'table':>10} {'speed-up':>9}")
+    for name, loop, query in queries:
+        assert loop() == query(), name
+        before = best_of(loop, args.repeat)
+        after = best_of(query, args.repeat)
+        print(f"{name:<30} {before * 1000:>8.3f}ms {after * 1000:>8.3f}ms {before / after:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
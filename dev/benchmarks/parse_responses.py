@@ -0,0 +1,112 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the parsing of API responses.
+
+Compares, for every response model, decoding the JSON body into a dictionary
+and expanding it into the model's constructor with validating the body
+directly with the API caller's cached validator.
+
+Usage: python dev/benchmarks/parse_responses.py [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Callable, List, Tuple, Type
+
+import payloads
+
+from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from lightdash_ai_tools.lightdash.api.compile_query_v1 import CompileQueryV1
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import GetExploreV1
+from lightdash_ai_tools.lightdash.api.get_explores_v1 import GetExploresV1
+from lightdash_ai_tools.lightdash.api.get_group_v1 import GetGroupV1
+from lightdash_ai_tools.lightdash.api.get_project_access_list_v1 import (
+    GetProjectAccessListV1,
+)
+from lightdash_ai_tools.lightdash.api.get_project_v1 import GetProjectV1
+from lightdash_ai_tools.lightdash.api.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1,
+)
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from lightdash_ai_tools.lightdash.api.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1,
+)
+from lightdash_ai_tools.lightdash.api.list_spaces_in_project_v1 import (
+    ListSpacesInProjectV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+
+CASES: List[Tuple[Type[BaseLightdashApiCaller], Callable[[], bytes]]] = [
+    (GetExploreV1, lambda: payloads.to_body(payloads.explore, 5000)),
+    (GetExploresV1, lambda: payloads.to_body(payloads.explores, 2000)),
+    (ListOrganizationMembersV1, lambda: payloads.to_body(payloads.organization_members, 1000)),
+    (ListGroupsInOrganizationV1, lambda: payloads.to_body(payloads.groups, 1000)),
+    (GetGroupV1, lambda: payloads.to_body(payloads.group, 1000)),
+    (ListOrganizationProjectsV1, lambda: payloads.to_body(payloads.organization_projects, 1000)),
+    (GetProjectAccessListV1, lambda: payloads.to_body(payloads.project_access_list, 1000)),
+    (ListSpacesInProjectV1, lambda: payloads.to_body(payloads.spaces, 1000)),
+    (GetProjectV1, lambda: payloads.to_body(payloads.project)),
+    (CompileQueryV1, lambda: payloads.to_body(payloads.compiled_query, 500)),
+]
+
+
+def best_of_both(
+    before: Callable[[], object], after: Callable[[], object], repeat: int
+) -> Tuple[float, float]:
+    """
+    Best time of one call of each function, in seconds.
+
+    The rounds of both functions alternate, so that load on the machine
+    weighs on both sides instead of skewing the ratio.
+    """
+    before_timer = timeit.Timer(before)
+    after_timer = timeit.Timer(after)
+    number, _ = before_timer.autorange()
+    before_best = after_best = float("inf")
+    for _ in range(repeat):
+        before_best = min(before_best, before_timer.timeit(number=number) / number)
+        after_best = min(after_best, after_timer.timeit(number=number) / number)
+    return before_best, after_best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=9, help="Number of timed rounds per case")
+    args = parser.parse_args()
+
+    client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark")
+    print(f"{'endpoint':<28} {'body':>10} {'dict + Model(**)':>18} {'validate_json':>15} {'speed-up':>9}")
+    for api_class, build_body in CASES:
+        body = build_body()
+        api_call = api_class(lightdash_client=client)
+        model = type(api_call._parse_response(body))
+
+        before, after = best_of_both(
+            lambda model=model, body=body: model(**json.loads(body)),
+            lambda api_call=api_call, body=body: api_call._parse_response(body),
+            args.repeat,
+        )
+        print(
+            f"{api_class.__name__:<28} {len(body) / 1024:>8.0f}KB"
+            f" {before * 1000:>15.3f}ms {after * 1000:>12.3f}ms {before / after:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Synthetic Lightdash API responses shaped like the ones of large deployments.
+
+The benchmarks use them as JSON bodies, the way the API callers receive them.
+"""
+
+import json
+from typing import Any, Callable, Dict
+
+ORGANIZATION_UUID = "6b4a3f2e-9d1c-4e8b-a7f5-0c2d1e3f4a5b"
+PROJECT_UUID = "0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b"
+ROLES = ["viewer", "interactive_viewer", "editor", "developer", "admin"]
+FIELD_TYPES = ["string", "number", "date", "timestamp", "boolean"]
+METRIC_TYPES = ["count", "count_distinct", "sum", "average", "max"]
+
+
+def _uuid(prefix: str, index: int) -> str:
+    return f"{prefix}-{index:08d}-0000-4000-8000-{index:012d}"
+
+
+def _table(name: str) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "label": name.replace("_", " ").title(),
+        "originalName": name,
+        "database": "analytics",
+        "schema": "marts",
+        "sqlTable": f"`analytics`.`marts`.`{name}`",
+        "description": f"One row per {name[:-1]}, deduplicated and enriched with its attributes.",
+        "orderFieldsBy": "LABEL",
+        "hidden": False,
+        "groupDetails": {},
+        "requiredAttributes": {},
+        "source": {
+            "path": f"models/marts/{name}.yml",
+            "content": "version: 2\nmodels:\n" + "  - name: column\n    description: A column of the table.\n" * 80,
+            "range": {"start": {"line": 1, "character": 0}, "end": {"line": 240, "character": 0}},
+        },
+        "lineageGraph": {name: [{"type": "model", "name": f"stg_{name}"}]},
+    }
+
+
+def _field_extras(table: str, index: int) -> Dict[str, Any]:
+    """Keys compiled explores carry on every field besides the modelled ones."""
+    return {
+        "source": {
+            "path": f"models/marts/{table}.yml",
+            "range": {"start": {"line": index, "character": 6}, "end": {"line": index + 12, "character": 0}},
+            "content": f"      - name: column_{index}\n        description: Value of column {index}.\n"
+                       "        meta:\n          dimension:\n            type: string\n            format: usd\n" * 4,
+        },
+        "format": "usd",
+        "round": 2,
+        "compact": None,
+        "urls": [{"label": "Open in CRM", "url": f"https://crm.example.com/${{{table}.column_{index}}}"}],
+        "requiredAttributes": None,
+    }
+
+
+def explore(num_fields: int, num_tables: int = 10, heavy: bool = False) -> Dict[str, Any]:
+    """
+    Response of GetExploreV1 with `num_fields` dimensions and metrics spread over `num_tables` tables.
+
+    A heavy explore also carries, like the compiled explores of large dbt
+    projects, the source of every field and long compiled SQL.
+    """
+    table_names = [f"table_{index}" for index in range(num_tables)]
+    dimensions: Dict[str, Any] = {}
+    metrics: Dict[str, Any] = {}
+    for index in range(num_fields):
+        table = table_names[index % num_tables]
+        compiled_sql = f"\"{table}\".column_{index}"
+        if heavy:
+            compiled_sql = (
+                f"CASE WHEN {compiled_sql} IS NULL THEN NULL WHEN {compiled_sql} < 0 THEN 'negative' "
+                f"WHEN {compiled_sql} = 0 THEN 'zero' ELSE CAST(ROUND({compiled_sql}, 2) AS STRING) END"
+            )
+        if index % 4 == 3:
+            name = f"metric_{index}"
+            metrics[f"{table}_{name}"] = {
+                "name": name,
+                "label": f"Metric {index}",
+                "table": table,
+                "tableLabel": table.replace("_", " ").title(),
+                "fieldType": "metric",
+                "type": METRIC_TYPES[index % len(METRIC_TYPES)],
+                "sql": f"${{TABLE}}.column_{index}",
+                "compiledSql": f"SUM({compiled_sql})",
+                "tablesReferences": [table],
+                "groups": ["kpis"],
+                "hidden": False,
+                "index": index,
+                "filters": [],
+                "isAutoGenerated": False,
+                "description": f"Aggregated value of column {index}.",
+                **(_field_extras(table, index) if heavy else {}),
+            }
+        else:
+            name = f"dimension_{index}"
+            dimensions[f"{table}_{name}"] = {
+                "name": name,
+                "label": f"Dimension {index}",
+                "table": table,
+                "tableLabel": table.replace("_", " ").title(),
+                "fieldType": "dimension",
+                "type": FIELD_TYPES[index % len(FIELD_TYPES)],
+                "sql": f"${{TABLE}}.column_{index}",
+                "compiledSql": compiled_sql,
+                "tablesReferences": [table],
+                "groups": ["attributes"],
+                "hidden": False,
+                "index": index,
+                "description": f"Value of column {index}.",
+                **(_field_extras(table, index) if heavy else {}),
+            }
+    return {
+        "status": "ok",
+        "results": {
+            "name": table_names[0],
+            "label": "Orders",
+            "type": "default",
+            "baseTable": table_names[0],
+            "tags": ["finance", "core"],
+            "groupLabel": "Sales",
+            "targetDatabase": "bigquery",
+            "warehouse": "bigquery",
+            "sqlPath": f"models/marts/{table_names[0]}.sql",
+            "ymlPath": f"models/marts/{table_names[0]}.yml",
+            "tables": {name: _table(name) for name in table_names},
+            "joinedTables": [
+                {"table": name, "sqlOn": f"${{{table_names[0]}.id}} = ${{{name}.id}}", "type": "left", "hidden": False}
+                for name in table_names[1:]
+            ],
+            "dimensions": dimensions,
+            "metrics": metrics,
+            "compiledSql": "SELECT * FROM `analytics`.`marts`.`table_0`",
+        },
+    }
+
+
+def explores(count: int) -> Dict[str, Any]:
+    """Response of GetExploresV1 with `count` explores."""
+    return {
+        "status": "ok",
+        "results": [
+            {
+                "name": f"explore_{index}",
+                "label": f"Explore {index}",
+                "groupLabel": "Sales",
+                "type": "default",
+                "tags": ["finance"],
+                "databaseName": "analytics",
+                "schemaName": "marts",
+                "description": f"Explore number {index}.",
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def organization_members(count: int) -> Dict[str, Any]:
+    """Response of ListOrganizationMembersV1 with a page of `count` members."""
+    return {
+        "status": "ok",
+        "results": {
+            "pagination": {"page": 1, "pageSize": count, "totalResults": count, "totalPageCount": 1},
+            "data": [
+                {
+                    "userUuid": _uuid("user", index),
+                    "userCreatedAt": "2024-03-01T09:30:00.000Z",
+                    "userUpdatedAt": "2025-01-15T17:45:12.000Z",
+                    "firstName": f"First{index}",
+                    "lastName": f"Last{index}",
+                    "email": f"user{index}@example.com",
+                    "organizationUuid": ORGANIZATION_UUID,
+                    "role": ROLES[index % len(ROLES)],
+                    "isActive": index % 10 != 0,
+                    "isPending": False,
+                    "isInviteExpired": False,
+                }
+                for index in range(count)
+            ],
+        },
+    }
+
+
+def groups(count: int) -> Dict[str, Any]:
+    """Response of ListGroupsInOrganizationV1 with a page of `count` groups."""
+    return {
+        "status": "ok",
+        "results": {
+            "pagination": {"page": 1, "pageSize": count, "totalResults": count, "totalPageCount": 1},
+            "data": [
+                {
+                    "uuid": _uuid("group", index),
+                    "name": f"Group {index}",
+                    "organizationUuid": ORGANIZATION_UUID,
+                    "createdAt": "2024-03-01T09:30:00.000Z",
+                    "createdByUserUuid": _uuid("user", 0),
+                    "updatedAt": "2025-01-15T17:45:12.000Z",
+                    "updatedByUserUuid": _uuid("user", 1),
+                }
+                for index in range(count)
+            ],
+        },
+    }
+
+
+def group(num_members: int) -> Dict[str, Any]:
+    """Response of GetGroupV1 with `num_members` members."""
+    return {
+        "status": "ok",
+        "results": {
+            "uuid": _uuid("group", 0),
+            "name": "Group 0",
+            "organizationUuid": ORGANIZATION_UUID,
+            "createdAt": "2024-03-01T09:30:00.000Z",
+            "updatedAt": "2025-01-15T17:45:12.000Z",
+            "memberUuids": [_uuid("user", index) for index in range(num_members)],
+            "members": [
+                {
+                    "userUuid": _uuid("user", index),
+                    "firstName": f"First{index}",
+                    "lastName": f"Last{index}",
+                    "role": ROLES[index % len(ROLES)],
+                    "isActive": True,
+                }
+                for index in range(num_members)
+            ],
+        },
+    }
+
+
+def organization_projects(count: int) -> Dict[str, Any]:
+    """Response of ListOrganizationProjectsV1 with `count` projects."""
+    return {
+        "status": "ok",
+        "results": [
+            {
+                "projectUuid": _uuid("project", index),
+                "name": f"Project {index}",
+                "type": "DEFAULT",
+                "warehouseType": "bigquery",
+                "createdByUserUuid": _uuid("user", 0),
+                "upstreamProjectUuid": None,
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def project_access_list(count: int) -> Dict[str, Any]:
+    """Response of GetProjectAccessListV1 with `count` entries."""
+    return {
+        "status": "ok",
+        "results": [
+            {
+                "userUuid": _uuid("user", index),
+                "projectUuid": PROJECT_UUID,
+                "firstName": f"First{index}",
+                "lastName": f"Last{index}",
+                "email": f"user{index}@example.com",
+                "role": ROLES[index % len(ROLES)],
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def spaces(count: int) -> Dict[str, Any]:
+    """Response of ListSpacesInProjectV1 with `count` spaces."""
+    return {
+        "status": "ok",
+        "results": [
+            {
+                "uuid": _uuid("space", index),
+                "name": f"Space {index}",
+                "projectUuid": PROJECT_UUID,
+                "organizationUuid": ORGANIZATION_UUID,
+                "pinnedListUuid": None,
+                "pinnedListOrder": None,
+                "slug": f"space-{index}",
+                "isPrivate": index % 3 == 0,
+                "dashboardCount": 12,
+                "chartCount": 48,
+                "access": [_uuid("user", index)],
+                "userAccess": {
+                    "userUuid": _uuid("user", index),
+                    "firstName": f"First{index}",
+                    "lastName": f"Last{index}",
+                    "email": f"user{index}@example.com",
+                    "role": "editor",
+                    "projectRole": "editor",
+                    "inheritedRole": "viewer",
+                    "inheritedFrom": "organization",
+                    "hasDirectAccess": True,
+                },
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def project() -> Dict[str, Any]:
+    """Response of GetProjectV1."""
+    return {
+        "status": "ok",
+        "results": {
+            "projectUuid": PROJECT_UUID,
+            "organizationUuid": ORGANIZATION_UUID,
+            "name": "Analytics",
+            "type": "DEFAULT",
+            "dbtVersion": "v1.8",
+            "schedulerTimezone": "UTC",
+            "createdByUserUuid": _uuid("user", 0),
+            "upstreamProjectUuid": None,
+            "pinnedListUuid": None,
+        },
+    }
+
+
+def compiled_query(num_columns: int) -> Dict[str, Any]:
+    """Response of CompileQueryV1 selecting `num_columns` columns."""
+    columns = ",\n  ".join(f"\"table_0\".column_{index} AS \"table_0_dimension_{index}\"" for index in range(num_columns))
+    return {"status": "ok", "results": f"SELECT\n  {columns}\nFROM `analytics`.`marts`.`table_0` AS \"table_0\"\nLIMIT 500"}
+
+
+def to_body(build: Callable[..., Dict[str, Any]], *args: Any) -> bytes:
+    """JSON body of a synthetic response, as the API callers receive it."""
+    return json.dumps(build(*args)).encode("utf-8")
@@ -0,0 +1,97 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark of building a project catalog with the explores parsed in worker processes.
+
+Builds the catalog of a project of heavy explores served from memory, parsing
+on the fetching threads, then on a process pool. Besides the wall time, it
+reports the CPU time of the parent process, which runs on a single core
+under the GIL: what the workers take off it is what spreads across cores.
+
+Usage: python dev/benchmarks/process_pool_catalog.py [--explores N] [--fields N] [--workers N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import payloads
+
+from lightdash_ai_tools.lightdash.client import LightdashClient, RequestType
+from lightdash_ai_tools.lightdash.services.project_catalog import ProjectCatalogService
+
+PROJECT_UUID = payloads.PROJECT_UUID
+
+
+class InMemoryLightdashClient(LightdashClient):
+    """Lightdash client serving response bodies from memory"""
+
+    bodies: Dict[str, bytes]
+
+    def call_raw(
+        self,
+        request_type: RequestType,
+        path: str,
+        parameters: Optional[Dict[str, Union[str, int]]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        return self.bodies[path]
+
+
+def build_client(num_explores: int, num_fields: int) -> InMemoryLightdashClient:
+    explores = payloads.explores(num_explores)
+    bodies = {f"/api/v1/projects/{PROJECT_UUID}/explores": payloads.to_body(lambda: explores)}
+    for summary in explores["results"]:
+        bodies[f"/api/v1/projects/{PROJECT_UUID}/explores/{summary['name']}"] = payloads.to_body(payloads.explore, num_fields, 10, True)
+    return InMemoryLightdashClient(base_url="https://lightdash.example.com", token="benchmark", bodies=bodies)
+
+
+def measure(build: Callable[[], Any]) -> Tuple[float, float]:
+    """Wall time and CPU time of the current process of a build, in seconds."""
+    started_at, cpu_started_at = time.perf_counter(), time.process_time()
+    build()
+    return time.perf_counter() - started_at, time.process_time() - cpu_started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--explores", type=int, default=16, help="Number of explores of the project")
+    parser.add_argument("--fields", type=int, default=2000, help="Number of fields of every explore")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    args = parser.parse_args()
+
+    client = build_client(args.explores, args.fields)
+    service = ProjectCatalogService(lightdash_client=client)
+    body_size = sum(len(body) for body in client.bodies.values())
+    print(f"{args.explores} explores of {args.fields} fields, {body_size / 1024 / 1024:.0f}MB, {args.workers} workers")
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("forkserver")) as executor:
+        # Starts the workers and imports the models in them before measuring.
+        service.build_summaries(PROJECT_UUID, executor=executor)
+        cases = (
+            ("threads", lambda: service.build(PROJECT_UUID)),
+            ("processes", lambda: service.build_in_processes(PROJECT_UUID, executor=executor)),
+            ("summaries", lambda: service.build_summaries(PROJECT_UUID, executor=executor)),
+        )
+        for name, build in cases:
+            elapsed, cpu = measure(build)
+            print(f"{name:<10} wall {elapsed * 1000:>8.0f}ms  parent CPU {cpu * 1000:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the memory retained by a parsed explore.
+
+Compares parsing a heavy explore with the full models and with the slim
+parse profile, by the memory still allocated once parsing is over.
+
+Usage: python dev/benchmarks/slim_explore.py [--fields N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Tuple
+
+import payloads
+
+from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import (
+    GetExploreV1,
+    GetSlimExploreV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+
+
+def measure(api_call: BaseLightdashApiCaller, body: bytes) -> Tuple[int, float]:
+    """Retained bytes and duration of parsing the body."""
+    api_call._parse_response(body)
+    gc.collect()
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    response = api_call._parse_response(body)
+    elapsed = time.perf_counter() - started_at
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return retained, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=5000, help="Number of fields of the explore")
+    args = parser.parse_args()
+
+    client = LightdashClient(base_url="https://lightdash.example.com", token="benchmark")
+    body = payloads.to_body(payloads.explore, args.fields, 10, True)
+    print(f"explore of {args.fields} fields, {len(body) / 1024:.0f}KB")
+    results = {}
+    for name, api_call in (("full", GetExploreV1(lightdash_client=client)), ("slim", GetSlimExploreV1(lightdash_client=client))):
+        results[name] = measure(api_call, body)
+        retained, elapsed = results[name]
+        print(f"{name:<5} retained {retained / 1024 / 1024:>7.2f}MB  parsed in {elapsed * 1000:>8.3f}ms")
+    print(f"retained memory reduced by {1 - results['slim'][0] / results['full'][0]:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import asyncio
+import os
+import sys
+from typing import List, Optional
+
+import httpx
+
+from lightdash_ai_tools.lightdash.cache import ApiResponseCache
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.services.cache_warmer import (
+    CacheWarmer,
+    CacheWarmingProgress,
+)
+from lightdash_ai_tools.lightdash.services.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1Service,
+)
+from lightdash_ai_tools.lightdash.services.organization_crawler import (
+    CrawlProgress,
+    OrganizationCrawler,
+)
+from lightdash_ai_tools.lightdash.services.project_catalog import ProjectCatalogService
+from lightdash_ai_tools.lightdash.storage.catalog_snapshot import write_catalog_snapshot
+
+LIGHTDASH_URL_ENV = "LIGHTDASH_URL"
+LIGHTDASH_API_KEY_ENV = "LIGHTDASH_API_KEY"
+
+
+def build_client_from_env(cache: Optional[ApiResponseCache] = None) -> LightdashClient:
+    """Build a Lightdash client from the LIGHTDASH_URL and LIGHTDASH_API_KEY environment variables."""
+    lightdash_url = os.getenv(LIGHTDASH_URL_ENV)
+    lightdash_api_key = os.getenv(LIGHTDASH_API_KEY_ENV)
+    if not lightdash_url or not lightdash_api_key:
+        raise ValueError(f"Environment variables {LIGHTDASH_URL_ENV} and {LIGHTDASH_API_KEY_ENV} must be set.")
+    return LightdashClient(base_url=lightdash_url, token=lightdash_api_key, cache=cache)
+
+
+def _print_progress(progress: CacheWarmingProgress) -> None:
+    status = "failed" if progress.error else "ok"
+    line = f"[{progress.completed}/{progress.scheduled}] {status} {progress.resource}"
+    if progress.error:
+        line = f"{line}: {progress.error}"
+    print(line, file=sys.stderr, flush=True)
+
+
+async def _write_snapshots(client: LightdashClient, project_uuids: List[str], snapshot_dir: str, concurrency: int) -> int:
+    """Write a catalog snapshot per project, building the projects concurrently, and return the number of failures."""
+    os.makedirs(snapshot_dir, exist_ok=True)
+    service = ProjectCatalogService(lightdash_client=client)
+    # Projects in flight share the concurrency, so that it still bounds the requests in flight.
+    projects_in_flight = max(1, min(concurrency, len(project_uuids)))
+    explores_in_flight = max(1, concurrency // projects_in_flight)
+    semaphore = asyncio.Semaphore(projects_in_flight)
+
+    async def write_snapshot(project_uuid: str) -> bool:
+        async with semaphore:
+            try:
+                catalog = await service.abuild(project_uuid, max_concurrency=explores_in_flight)
+            except (httpx.HTTPError, ValueError) as e:  # A single project must not abort the others
+                print(f"Failed to build the catalog of project {project_uuid}: {type(e).__name__}: {e}", file=sys.stderr)
+                return False
+        path = os.path.join(snapshot_dir, f"{project_uuid}.ldcat")
+        await asyncio.to_thread(write_catalog_snapshot, catalog, path)
+        print(f"Wrote catalog snapshot of {len(catalog.explore_details)} explores to {path}")
+        return True
+
+    written = await asyncio.gather(*(write_snapshot(project_uuid) for project_uuid in project_uuids))
+    return written.count(False)
+
+
+async def _warm(args: argparse.Namespace) -> int:
+    cache = ApiResponseCache(ttl=args.ttl, max_entries=args.max_entries, max_bytes=args.max_bytes)
+    try:
+        client = build_client_from_env(cache=cache)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    warmer = CacheWarmer(
+        lightdash_client=client,
+        max_concurrency=args.concurrency,
+        on_progress=None if args.quiet else _print_progress,
+    )
+    try:
+        summary = await warmer.awarm(project_uuids=args.project)
+        print(
+            f"Warmed {summary.projects} projects: {summary.fetched} fetched, {summary.failed} failed "
+            f"in {summary.elapsed_seconds:.2f}s ({summary.fetches_per_second:.1f} fetches/s)"
+        )
+        weight = "retained" if cache.max_bytes is not None else "of response bodies"
+        for endpoint, size in sorted(cache.bytes_by_endpoint().items()):
+            print(f"  {endpoint}: {size / 1024:.1f} KiB {weight} cached")
+
+        # The cache dies with the command, so the snapshots are what other processes get to read.
+        project_uuids = args.project
+        if project_uuids is None:
+            try:
+                projects = await ListOrganizationProjectsV1Service(lightdash_client=client).aget_all_projects()
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"Failed to list the projects to snapshot: {type(e).__name__}: {e}", file=sys.stderr)
+                return 1
+            project_uuids = [project.projectUuid for project in projects]
+        failed_snapshots = await _write_snapshots(client, project_uuids, args.snapshot_dir, args.concurrency)
+    finally:
+        client.close()
+    if failed_snapshots:
+        print(f"Failed to snapshot {failed_snapshots} of {len(project_uuids)} projects", file=sys.stderr)
+    return 1 if summary.failed or failed_snapshots else 0
+
+
+def _print_crawl_progress(progress: CrawlProgress) -> None:
+    print(
+        f"{progress.task} page {progress.page}: {progress.task_items} items "
+        f"({progress.items_per_second:.1f} items/s)",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+async def _crawl(args: argparse.Namespace) -> int:
+    try:
+        client = build_client_from_env()
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    crawler = OrganizationCrawler(
+        lightdash_client=client,
+        directory=args.directory,
+        page_size=args.page_size,
+        on_progress=None if args.quiet else _print_crawl_progress,
+    )
+    try:
+        summary = await asyncio.to_thread(crawler.crawl)
+    finally:
+        client.close()
+    print(
+        f"Crawled {summary.tasks} tasks ({summary.resumed_tasks} resumed, {summary.skipped_tasks} already complete): "
+        f"{summary.items} items in {summary.pages} pages in {summary.elapsed_seconds:.2f}s "
+        f"({summary.items_per_second:.1f} items/s)"
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the command-line interface."""
+    parser = argparse.ArgumentParser(
+        prog="lightdash-ai-tools",
+        description=f"Lightdash AI tools. Connection settings are read from {LIGHTDASH_URL_ENV} and {LIGHTDASH_API_KEY_ENV}.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    warm_parser = subparsers.add_parser(
+        "warm",
+        help="Warm projects, explores, members, groups and access lists, and write a catalog snapshot per project",
+    )
+    warm_parser.add_argument("snapshot_dir", help="Directory to write binary catalog snapshots of the warmed projects to")
+    warm_parser.add_argument(
+        "--project",
+        action="append",
+        default=None,
+        help="UUID of a project to warm. Repeat to warm several projects. Defaults to all projects.",
+    )
+    warm_parser.add_argument("--concurrency", type=int, default=8, help="Maximum number of requests in flight")
+    warm_parser.add_argument("--ttl", type=float, default=300.0, help="Seconds cached responses stay valid")
+    warm_parser.add_argument("--max-entries", type=int, default=100_000, help="Maximum number of cached responses")
+    warm_parser.add_argument("--max-bytes", type=int, default=None, help="Maximum bytes retained by the cached responses, estimated from their body lengths")
+    warm_parser.add_argument("--quiet", action="store_true", help="Don't report progress")
+    warm_parser.set_defaults(handler=_warm)
+
+    crawl_parser = subparsers.add_parser(
+        "crawl",
+        help="Crawl members, groups, projects and project access lists into a directory, resuming a previous crawl",
+    )
+    crawl_parser.add_argument("directory", help="Directory holding the crawl checkpoint and the crawled items")
+    crawl_parser.add_argument("--page-size", type=int, default=None, help="Number of results per page of new tasks")
+    crawl_parser.add_argument("--quiet", action="store_true", help="Don't report progress")
+    crawl_parser.set_defaults(handler=_crawl)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the `lightdash-ai-tools` command."""
+    args = build_parser().parse_args(argv)
+    if getattr(args, "concurrency", 1) < 1:
+        print("--concurrency must be a positive integer", file=sys.stderr)
+        return 2
+    return asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
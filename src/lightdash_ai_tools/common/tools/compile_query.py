@@ -23,6 +23,7 @@ from lightdash_ai_tools.lightdash.models.compile_query_v1 import (
     Filters,
     SortField,
 )
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
 
 
 class CompileQueryInput(BaseModel):
@@ -46,9 +47,27 @@ class CompileQuery:
     description: str = "Compile a query in a Lightdash project."
     input_schema: Type[BaseModel] = CompileQueryInput
 
-    def __init__(self, lightdash_client: LightdashClient):
+    def __init__(self, lightdash_client: LightdashClient, catalog: Optional[ProjectCatalog] = None):
         """Initialize the controller with a Lightdash client."""
         self.lightdash_client = lightdash_client
+        self.catalog = catalog
+
+    def _check_fields(
+        self,
+        project_uuid: str,
+        explore_id: str,
+        dimensions: Optional[List[str]],
+        metrics: Optional[List[str]],
+    ) -> None:
+        """Reject unknown fields before calling Lightdash, when the catalog snapshot has the explore"""
+        if self.catalog is None or self.catalog.project_uuid != project_uuid:
+            return
+        explore = self.catalog.get_explore(explore_id)
+        if explore is None:
+            return
+        unknown_fields = explore.find_unknown_fields(dimensions=dimensions or [], metrics=metrics or [])
+        if unknown_fields:
+            raise ValueError(f"Unknown fields in explore {explore_id}: {', '.join(unknown_fields)}")
 
     def call(
         self,
@@ -62,6 +81,7 @@ class CompileQuery:
         limit: Optional[int] = 500,
     ) -> str:
         """Compile a Lightdash query."""
+        self._check_fields(project_uuid, explore_id, dimensions, metrics)
         request_body = CompileQueryRequestV1(
             projectUuid=project_uuid,
             exploreId=explore_id,
@@ -88,6 +108,7 @@ class CompileQuery:
         limit: Optional[int] = 500,
     ) -> str:
         """Asynchronously compile a Lightdash query."""
+        self._check_fields(project_uuid, explore_id, dimensions, metrics)
         request_body = CompileQueryRequestV1(
             projectUuid=project_uuid,
             exploreId=explore_id,
@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Type
+from typing import Optional, Type
 
 from pydantic import BaseModel, Field
 
 from lightdash_ai_tools.lightdash.api.get_explore_v1 import GetExploreV1
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.get_explore_v1 import GetExploreV1Results
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
 
 
 class GetExploreToolInput(BaseModel):
@@ -34,17 +35,30 @@ class GetExplore:
     description: str = "Get a specific explore (table) in a project."
     input_schema: Type[BaseModel] = GetExploreToolInput
 
-    def __init__(self, lightdash_client: LightdashClient):
+    def __init__(self, lightdash_client: LightdashClient, catalog: Optional[ProjectCatalog] = None):
         """Initialize the controller"""
         self.lightdash_client = lightdash_client
+        self.catalog = catalog
+
+    def _get_from_catalog(self, project_uuid: str, explore_id: str) -> Optional[GetExploreV1Results]:
+        """Look up the explore in the catalog snapshot, if any"""
+        if self.catalog is None or self.catalog.project_uuid != project_uuid:
+            return None
+        return self.catalog.get_explore(explore_id)
 
     def call(self, project_uuid: str, explore_id: str) -> GetExploreV1Results:
         """Get a specific explore in a project"""
+        explore = self._get_from_catalog(project_uuid, explore_id)
+        if explore is not None:
+            return explore
         response = GetExploreV1(lightdash_client=self.lightdash_client).call(project_uuid, explore_id)
         return response.results
 
     async def acall(self, project_uuid: str, explore_id: str) -> GetExploreV1Results:
         """Get a specific explore in a project asynchronously"""
+        explore = self._get_from_catalog(project_uuid, explore_id)
+        if explore is not None:
+            return explore
         response = await GetExploreV1(lightdash_client=self.lightdash_client).acall(
             project_uuid, explore_id
         )
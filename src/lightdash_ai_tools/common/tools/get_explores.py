@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Type
+from typing import List, Optional, Type
 
 from pydantic import BaseModel, Field
 
 from lightdash_ai_tools.lightdash.api.get_explores_v1 import GetExploresV1
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.get_explores_v1 import GetExploresV1Results
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
 
 
 class GetExploresToolInput(BaseModel):
@@ -32,16 +33,21 @@ class GetExplores:
     description: str = "Get explores (tables) in a project."
     input_schema: Type[BaseModel] = GetExploresToolInput
 
-    def __init__(self, lightdash_client: LightdashClient):
+    def __init__(self, lightdash_client: LightdashClient, catalog: Optional[ProjectCatalog] = None):
         """Initialize the controller"""
         self.lightdash_client = lightdash_client
+        self.catalog = catalog
 
     def call(self, project_uuid: str) -> List[GetExploresV1Results]:
         """Call the controller"""
+        if self.catalog is not None and self.catalog.project_uuid == project_uuid:
+            return self.catalog.list_explores()
         response = GetExploresV1(lightdash_client=self.lightdash_client).call(project_uuid)
         return response.results
 
     async def acall(self, project_uuid: str) -> List[GetExploresV1Results]:
         """Call the controller asynchronously"""
+        if self.catalog is not None and self.catalog.project_uuid == project_uuid:
+            return self.catalog.list_explores()
         response = await GetExploresV1(lightdash_client=self.lightdash_client).acall(project_uuid)
         return response.results
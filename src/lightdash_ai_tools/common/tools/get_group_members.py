@@ -0,0 +1,108 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Optional, Type
+
+from pydantic import BaseModel, Field
+
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.get_group_v1 import GroupMember
+from lightdash_ai_tools.lightdash.services.get_group_members_v1 import (
+    GetGroupMembersV1Service,
+)
+
+DEFAULT_MAX_MEMBERS = 100
+
+
+class GetGroupMembersToolInput(BaseModel):
+    """Input for the GetGroupMembersTool tool."""
+    group_uuid: str = Field(description="The UUID of the group.")
+    max_members: int = Field(
+        default=DEFAULT_MAX_MEMBERS,
+        ge=1,
+        le=10_000,
+        description="Maximum number of members to return."
+    )
+
+
+class CompactGroupMember(BaseModel):
+    """Member of a group, reduced to what identifies it."""
+    userUuid: str = Field(description="Unique identifier of the user")
+    name: str = Field(description="Full name of the user")
+    role: Optional[str] = Field(default=None, description="User's role in the group")
+
+
+class GetGroupMembersToolOutput(BaseModel):
+    """Output of the GetGroupMembersTool tool."""
+    group_uuid: str = Field(description="The UUID of the group")
+    members: List[CompactGroupMember] = Field(description="Members of the group")
+    truncated: bool = Field(
+        default=False,
+        description="Whether the group has more members than returned because of max_members"
+    )
+
+
+class GetGroupMembers:
+    """Controller for listing the members of a group."""
+
+    name: str = "get_group_members"
+    description: str = "Get the members of a specific group in the Lightdash organization, up to a maximum number of members"
+    input_schema: Type[BaseModel] = GetGroupMembersToolInput
+
+    def __init__(self, lightdash_client: LightdashClient):
+        """
+        Initialize the controller.
+
+        :param lightdash_client: Lightdash client for making API calls
+        """
+        self.lightdash_client = lightdash_client
+        self.service = GetGroupMembersV1Service(lightdash_client=lightdash_client)
+
+    def call(self, group_uuid: str, max_members: int = DEFAULT_MAX_MEMBERS) -> GetGroupMembersToolOutput:
+        """
+        Get the members of a group.
+
+        :param group_uuid: Unique identifier of the group
+        :param max_members: Maximum number of members to return
+        :return: Members of the group
+        """
+        # One extra member tells whether the listing was cut short.
+        members = self.service.get_all_members(group_uuid=group_uuid, max_results=max_members + 1)
+        return self._build_output(group_uuid, members, max_members)
+
+    async def acall(self, group_uuid: str, max_members: int = DEFAULT_MAX_MEMBERS) -> GetGroupMembersToolOutput:
+        """
+        Asynchronously get the members of a group.
+
+        :param group_uuid: Unique identifier of the group
+        :param max_members: Maximum number of members to return
+        :return: Members of the group
+        """
+        members = await self.service.aget_all_members(group_uuid=group_uuid, max_results=max_members + 1)
+        return self._build_output(group_uuid, members, max_members)
+
+    @staticmethod
+    def _build_output(group_uuid: str, members: List[GroupMember], max_members: int) -> GetGroupMembersToolOutput:
+        return GetGroupMembersToolOutput(
+            group_uuid=group_uuid,
+            members=[
+                CompactGroupMember(
+                    userUuid=member.userUuid,
+                    name=f"{member.firstName} {member.lastName}".strip(),
+                    role=member.role,
+                )
+                for member in members[:max_members]
+            ],
+            truncated=len(members) > max_members,
+        )
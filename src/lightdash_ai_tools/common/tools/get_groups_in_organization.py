@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional, Type
+from typing import List, Optional, Type, Union
 
-from pydantic import BaseModel
+import httpx
+from pydantic import BaseModel, Field
 
+from lightdash_ai_tools.lightdash.api.get_group_v1 import GetGroupV1
 from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.get_group_v1 import GetGroupV1Result
 from lightdash_ai_tools.lightdash.models.list_groups_in_organization_v1 import Group
 from lightdash_ai_tools.lightdash.services.list_groups_in_organization_v1 import (
     ListGroupsInOrganizationV1Service,
@@ -37,8 +40,20 @@ class GetGroupsInOrganizationToolInput(BaseModel):
     #     default=None,
     #     description="Optional search query to filter groups"
     # )
+    max_results: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of groups to return. Leave empty to return all groups."
+    )
 
 
+class GetGroupsInOrganizationToolOutput(BaseModel):
+    """Output of the GetGroupsInOrganizationTool tool."""
+    groups: List[Group] = Field(description="Groups of the organization")
+    truncated: bool = Field(
+        default=False,
+        description="Whether the organization has more groups than returned because of max_results"
+    )
 
 
 class GetGroupsInOrganization:
@@ -61,53 +76,101 @@ class GetGroupsInOrganization:
 
     def call(
         self,
-        page_size: Optional[float] = 100,
+        page_size: Optional[int] = None,
         include_members: Optional[float] = None,
-        search_query: Optional[str] = None
-    ) -> List[Group]:
+        search_query: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> Union[List[Group], GetGroupsInOrganizationToolOutput]:
         """
         Execute the synchronous group listing operation
 
-        :param page_size: Number of results per page
+        :param page_size: Number of results per page, None to let the client choose
         :param include_members: Number of members to include
         :param search_query: Search query to filter groups
-        :return: List of groups
+        :param max_results: Maximum number of groups to return, None for all
+        :return: List of groups, or the groups and whether they were truncated when
+            max_results is set
         """
-        return self.service.get_all_groups(
+        # One extra group tells whether the listing was cut short.
+        groups = self.service.get_all_groups(
             page_size=page_size,
             include_members=include_members,
-            search_query=search_query
+            search_query=search_query,
+            max_results=None if max_results is None else max_results + 1,
         )
+        return self._build_output(groups, max_results)
 
     async def acall(
         self,
-        page_size: Optional[float] = 100,
+        page_size: Optional[int] = None,
         include_members: Optional[float] = None,
-        search_query: Optional[str] = None
-    ) -> List[Group]:
+        search_query: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> Union[List[Group], GetGroupsInOrganizationToolOutput]:
         """
         Execute the asynchronous group listing operation
 
-        :param page_size: Number of results per page
+        :param page_size: Number of results per page, None to let the client choose
         :param include_members: Number of members to include
         :param search_query: Search query to filter groups
-        :return: List of groups
+        :param max_results: Maximum number of groups to return, None for all
+        :return: List of groups, or the groups and whether they were truncated when
+            max_results is set
         """
-        return await self.service.get_all_groups_async(
+        groups = await self.service.get_all_groups_async(
             page_size=page_size,
             include_members=include_members,
-            search_query=search_query
+            search_query=search_query,
+            max_results=None if max_results is None else max_results + 1,
         )
+        return self._build_output(groups, max_results)
+
+    @staticmethod
+    def _build_output(
+        groups: List[Group],
+        max_results: Optional[int],
+    ) -> Union[List[Group], GetGroupsInOrganizationToolOutput]:
+        if max_results is None:
+            return groups
+        if len(groups) <= max_results:
+            return GetGroupsInOrganizationToolOutput(groups=groups)
+        return GetGroupsInOrganizationToolOutput(groups=groups[:max_results], truncated=True)
 
     def get_group_details(self, group_uuid: str) -> Optional[Group]:
         """
         Get details of a specific group by its UUID
 
+        The group is requested directly instead of being looked up in the
+        listing of every group. Like a lookup in the listing, a UUID Lightdash
+        rejects, with 404 or with 400 or 422 for a malformed UUID, gives None.
+        Any other error, e.g. authentication, rate limiting or server errors,
+        is raised.
+
+        :param group_uuid: UUID of the group to retrieve
+        :return: Group details or None if not found
+        """
+        try:
+            response = GetGroupV1(lightdash_client=self.client).call(group_uuid=group_uuid)
+        except httpx.HTTPStatusError as e:
+            if self._is_rejected_uuid(e):
+                return None
+            raise
+        return self._to_group(response.results)
+
+    async def aget_group_details(self, group_uuid: str) -> Optional[Group]:
+        """
+        Asynchronously get details of a specific group by its UUID
+
         :param group_uuid: UUID of the group to retrieve
         :return: Group details or None if not found
         """
-        all_groups = self.call()
-        return next((group for group in all_groups if group.uuid == group_uuid), None)
+        try:
+            response = await GetGroupV1(lightdash_client=self.client).acall(group_uuid=group_uuid)
+        except httpx.HTTPStatusError as e:
+            if self._is_rejected_uuid(e):
+                return None
+            raise
+        return self._to_group(response.results)
 
     def filter_groups(
         self,
@@ -117,13 +180,52 @@ class GetGroupsInOrganization:
         """
         Filter groups based on specific criteria
 
+        The name filter is sent to Lightdash as the search query, so only
+        matching groups are downloaded. It is still applied locally, since the
+        search may match more than the group name.
+
         :param name_contains: Filter groups whose name contains this substring
         :param created_by: Filter groups created by a specific user UUID
         :return: Filtered list of groups
         """
-        all_groups = self.call()
+        all_groups = self.service.get_all_groups(search_query=name_contains or None)
+        return self._filter(all_groups, name_contains, created_by)
 
-        filtered_groups = all_groups
+    async def afilter_groups(
+        self,
+        name_contains: Optional[str] = None,
+        created_by: Optional[str] = None
+    ) -> List[Group]:
+        """
+        Asynchronously filter groups based on specific criteria
+
+        :param name_contains: Filter groups whose name contains this substring
+        :param created_by: Filter groups created by a specific user UUID
+        :return: Filtered list of groups
+        """
+        all_groups = await self.service.get_all_groups_async(search_query=name_contains or None)
+        return self._filter(all_groups, name_contains, created_by)
+
+    @staticmethod
+    def _is_rejected_uuid(error: httpx.HTTPStatusError) -> bool:
+        """Whether Lightdash rejected the group UUID, as unknown or as malformed."""
+        return error.response.status_code in (
+            httpx.codes.NOT_FOUND,
+            httpx.codes.BAD_REQUEST,
+            httpx.codes.UNPROCESSABLE_ENTITY,
+        )
+
+    @staticmethod
+    def _to_group(result: GetGroupV1Result) -> Group:
+        return Group.model_construct(**{name: getattr(result, name) for name in Group.model_fields})
+
+    @staticmethod
+    def _filter(
+        groups: List[Group],
+        name_contains: Optional[str],
+        created_by: Optional[str]
+    ) -> List[Group]:
+        filtered_groups = groups
 
         if name_contains:
             filtered_groups = [
@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional, Type
+from typing import List, Optional, Type, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
@@ -27,7 +27,24 @@ from lightdash_ai_tools.lightdash.services.list_organization_members_v1 import (
 
 class GetOrganizationMembersToolInput(BaseModel):
     """Input for the GetOrganizationMembersTool tool."""
-    page_size: Optional[int] = 10
+    page_size: Optional[int] = Field(
+        default=None,
+        description="Number of results per page. Leave empty to let the client pick a page size."
+    )
+    max_results: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of members to return. Leave empty to return all members."
+    )
+
+
+class GetOrganizationMembersToolOutput(BaseModel):
+    """Output of the GetOrganizationMembersTool tool."""
+    members: List[OrganizationMemberModel] = Field(description="Members of the organization")
+    truncated: bool = Field(
+        default=False,
+        description="Whether the organization has more members than returned because of max_results"
+    )
 
 
 class GetOrganizationMembers:
@@ -44,24 +61,50 @@ class GetOrganizationMembers:
 
     def call(
         self,
-        page_size: int = 100
-    ) -> List[OrganizationMemberModel]:
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Union[List[OrganizationMemberModel], GetOrganizationMembersToolOutput]:
         """
         Call the controller to get all organization members
 
-        :param page_size: Number of results per page
-        :return: List of organization members
+        :param page_size: Number of results per page, None to let the client choose
+        :param max_results: Maximum number of members to return, None for all
+        :return: List of organization members, or the members and whether they were
+            truncated when max_results is set
         """
-        return self.service.get_all_members(page_size=page_size)
+        # One extra member tells whether the listing was cut short.
+        members = self.service.get_all_members(
+            page_size=page_size,
+            max_results=None if max_results is None else max_results + 1,
+        )
+        return self._build_output(members, max_results)
 
     async def acall(
         self,
-        page_size: int = 100
-    ) -> List[OrganizationMemberModel]:
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Union[List[OrganizationMemberModel], GetOrganizationMembersToolOutput]:
         """
         Async call the controller to get all organization members
 
-        :param page_size: Number of results per page
-        :return: List of organization members
+        :param page_size: Number of results per page, None to let the client choose
+        :param max_results: Maximum number of members to return, None for all
+        :return: List of organization members, or the members and whether they were
+            truncated when max_results is set
         """
-        return await self.service.aget_all_members(page_size=page_size)
+        members = await self.service.aget_all_members(
+            page_size=page_size,
+            max_results=None if max_results is None else max_results + 1,
+        )
+        return self._build_output(members, max_results)
+
+    @staticmethod
+    def _build_output(
+        members: List[OrganizationMemberModel],
+        max_results: Optional[int],
+    ) -> Union[List[OrganizationMemberModel], GetOrganizationMembersToolOutput]:
+        if max_results is None:
+            return members
+        if len(members) <= max_results:
+            return GetOrganizationMembersToolOutput(members=members)
+        return GetOrganizationMembersToolOutput(members=members[:max_results], truncated=True)
@@ -17,13 +17,13 @@ from typing import List
 
 from pydantic import BaseModel
 
-from lightdash_ai_tools.lightdash.api.list_organization_projects_v1 import (
-    ListOrganizationProjectsV1,
-)
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.list_organization_projects_v1 import (
     ListOrganizationProjectsV1Results,
 )
+from lightdash_ai_tools.lightdash.services.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1Service,
+)
 
 
 class GetProjectsInput(BaseModel):
@@ -40,13 +40,12 @@ class GetProjects:
     def __init__(self, lightdash_client: LightdashClient):
         """Initialize the controller"""
         self.lightdash_client = lightdash_client
+        self.service = ListOrganizationProjectsV1Service(lightdash_client=lightdash_client)
 
     def call(self) -> List[ListOrganizationProjectsV1Results]:
         """Call the controller"""
-        service = ListOrganizationProjectsV1(lightdash_client=self.lightdash_client)
-        return service.call().results
+        return self.service.get_all_projects()
 
     async def acall(self) -> List[ListOrganizationProjectsV1Results]:
         """Async call the controller"""
-        service = ListOrganizationProjectsV1(lightdash_client=self.lightdash_client)
-        return (await service.acall()).results
+        return await self.service.aget_all_projects()
@@ -19,6 +19,7 @@ from langchain_core.tools import BaseTool
 from lightdash_ai_tools.langchain.tools.get_explore import GetExploreTool
 from lightdash_ai_tools.langchain.tools.get_explores import GetExploresTool
 from lightdash_ai_tools.langchain.tools.get_group import GetGroupTool
+from lightdash_ai_tools.langchain.tools.get_group_members import GetGroupMembersTool
 from lightdash_ai_tools.langchain.tools.get_groups_in_organization import (
     GetGroupsInOrganizationTool,
 )
@@ -46,6 +47,7 @@ def get_all_readable_tools(lightdash_client: LightdashClient) -> List[BaseTool]:
         GetExploreTool(lightdash_client=lightdash_client),
         GetGroupsInOrganizationTool(lightdash_client=lightdash_client),
         GetGroupTool(lightdash_client=lightdash_client),
+        GetGroupMembersTool(lightdash_client=lightdash_client),
     ]
 
 
@@ -63,4 +65,5 @@ __all__ = [
     "GetExploreTool",
     "GetGroupsInOrganizationTool",
     "GetGroupTool",
+    "GetGroupMembersTool",
 ]
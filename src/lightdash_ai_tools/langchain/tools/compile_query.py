@@ -31,6 +31,7 @@ from lightdash_ai_tools.lightdash.models.compile_query_v1 import (
     Filters,
     SortField,
 )
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
 
 
 class CompileQueryTool(BaseTool):
@@ -43,6 +44,7 @@ class CompileQueryTool(BaseTool):
     handle_validation_error: bool = True
 
     lightdash_client: LightdashClient
+    catalog: Optional[ProjectCatalog] = None
 
     def _run(
         self,
@@ -62,7 +64,7 @@ class CompileQueryTool(BaseTool):
         :return: Compiled query results
         """
         try:
-            tool = CompileQuery(lightdash_client=self.lightdash_client)
+            tool = CompileQuery(lightdash_client=self.lightdash_client, catalog=self.catalog)
             return tool.call(
                 project_uuid=projectUuid,
                 explore_id=exploreId,
@@ -98,7 +100,7 @@ class CompileQueryTool(BaseTool):
         :return: Compiled query results
         """
         try:
-            tool = CompileQuery(lightdash_client=self.lightdash_client)
+            tool = CompileQuery(lightdash_client=self.lightdash_client, catalog=self.catalog)
             return await tool.acall(
                 project_uuid=projectUuid,
                 explore_id=exploreId,
@@ -25,6 +25,7 @@ from pydantic import BaseModel
 from lightdash_ai_tools.common.tools.get_explore import GetExplore
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.get_explore_v1 import GetExploreV1Results
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
 
 
 class GetExploreTool(BaseTool):
@@ -38,6 +39,7 @@ class GetExploreTool(BaseTool):
     handle_validation_error: bool = True
 
     lightdash_client: LightdashClient
+    catalog: Optional[ProjectCatalog] = None
 
     def _run(
         self,
@@ -46,7 +48,7 @@ class GetExploreTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None
     ) -> GetExploreV1Results:
         try:
-            tool = GetExplore(lightdash_client=self.lightdash_client)
+            tool = GetExplore(lightdash_client=self.lightdash_client, catalog=self.catalog)
             return tool.call(project_uuid=project_uuid, explore_id=explore_id)
         except Exception as e:
             error_message = textwrap.dedent(f"""\
@@ -70,7 +72,7 @@ class GetExploreTool(BaseTool):
         :return: Explore details
         """
         try:
-            tool = GetExplore(lightdash_client=self.lightdash_client)
+            tool = GetExplore(lightdash_client=self.lightdash_client, catalog=self.catalog)
             return await tool.acall(
                 project_uuid=project_uuid,
                 explore_id=explore_id
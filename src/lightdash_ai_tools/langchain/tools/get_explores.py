@@ -25,6 +25,7 @@ from pydantic import BaseModel
 from lightdash_ai_tools.common.tools.get_explores import GetExplores
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.get_explores_v1 import GetExploresV1Results
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
 
 
 class GetExploresTool(BaseTool):
@@ -38,6 +39,7 @@ class GetExploresTool(BaseTool):
     handle_validation_error: bool = True
 
     lightdash_client: LightdashClient
+    catalog: Optional[ProjectCatalog] = None
 
     def _run(
         self,
@@ -51,7 +53,7 @@ class GetExploresTool(BaseTool):
             List of explores as JSON strings
         """
         try:
-            tool = GetExplores(lightdash_client=self.lightdash_client)
+            tool = GetExplores(lightdash_client=self.lightdash_client, catalog=self.catalog)
             return tool.call(project_uuid)
         except Exception as e:
             error_message = textwrap.dedent(f"""\
@@ -73,7 +75,7 @@ class GetExploresTool(BaseTool):
         :return: List of explores
         """
         try:
-            tool = GetExplores(lightdash_client=self.lightdash_client)
+            tool = GetExplores(lightdash_client=self.lightdash_client, catalog=self.catalog)
             return await tool.acall(project_uuid)
         except Exception as e:
             error_message = textwrap.dedent(f"""\
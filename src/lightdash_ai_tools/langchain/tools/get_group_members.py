@@ -0,0 +1,91 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import textwrap
+from typing import Optional, Type
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.tools import BaseTool, ToolException
+from pydantic import BaseModel
+
+from lightdash_ai_tools.common.tools.get_group_members import (
+    DEFAULT_MAX_MEMBERS,
+    GetGroupMembers,
+    GetGroupMembersToolOutput,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+
+
+class GetGroupMembersTool(BaseTool):
+    """Tool for listing the members of a group."""
+
+    name: str = GetGroupMembers.name
+    description: str = GetGroupMembers.description
+    args_schema: Type[BaseModel] = GetGroupMembers.input_schema
+    return_direct: bool = False
+    handle_tool_error: bool = True
+    handle_validation_error: bool = True
+
+    lightdash_client: LightdashClient
+
+    def _run(
+        self,
+        group_uuid: str,
+        max_members: int = DEFAULT_MAX_MEMBERS,
+        run_manager: Optional[CallbackManagerForToolRun] = None
+    ) -> GetGroupMembersToolOutput:
+        """
+        Run the get group members tool.
+
+        :param group_uuid: Unique identifier of the group
+        :param max_members: Maximum number of members to return
+        :param run_manager: Optional callback manager
+        :return: Members of the group, and whether they were truncated
+        """
+        try:
+            tool = GetGroupMembers(lightdash_client=self.lightdash_client)
+            return tool.call(group_uuid=group_uuid, max_members=max_members)
+        except Exception as e:
+            error_message = textwrap.dedent(f"""\
+              Error retrieving members of the group with group_uuid: {group_uuid}.
+              Exception: {type(e).__name__}: {e}
+            """).strip()
+            raise ToolException(error_message) from e
+
+    async def _arun(
+        self,
+        group_uuid: str,
+        max_members: int = DEFAULT_MAX_MEMBERS,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None
+    ) -> GetGroupMembersToolOutput:
+        """
+        Asynchronously retrieve the members of a group.
+
+        :param group_uuid: Unique identifier of the group
+        :param max_members: Maximum number of members to return
+        :param run_manager: Optional async callback manager
+        :return: Members of the group, and whether they were truncated
+        """
+        try:
+            tool = GetGroupMembers(lightdash_client=self.lightdash_client)
+            return await tool.acall(group_uuid=group_uuid, max_members=max_members)
+        except Exception as e:
+            error_message = textwrap.dedent(f"""\
+              Error retrieving members of the group asynchronously with group_uuid: {group_uuid}.
+              Exception: {type(e).__name__}: {e}
+            """).strip()
+            raise ToolException(error_message) from e
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import textwrap
-from typing import List, Optional, Type
+from typing import List, Optional, Type, Union
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
@@ -24,6 +24,7 @@ from pydantic import BaseModel
 
 from lightdash_ai_tools.common.tools.get_groups_in_organization import (
     GetGroupsInOrganization,
+    GetGroupsInOrganizationToolOutput,
 )
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.list_groups_in_organization_v1 import Group
@@ -42,11 +43,12 @@ class GetGroupsInOrganizationTool(BaseTool):
 
     def _run(
         self,
-        page_size: Optional[float] = 100,
+        page_size: Optional[int] = None,
         include_members: Optional[float] = None,
         search_query: Optional[str] = None,
+        max_results: Optional[int] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None
-    ) -> List[Group]:
+    ) -> Union[List[Group], GetGroupsInOrganizationToolOutput]:
         """
         Run method to list groups
 
@@ -57,7 +59,8 @@ class GetGroupsInOrganizationTool(BaseTool):
             return tool.call(
                 page_size=page_size,
                 include_members=include_members,
-                search_query=search_query
+                search_query=search_query,
+                max_results=max_results,
             )
         except Exception as e:
             error_message = textwrap.dedent(f"""\
@@ -68,26 +71,30 @@ class GetGroupsInOrganizationTool(BaseTool):
 
     async def _arun(
         self,
-        page_size: Optional[float] = 100,
+        page_size: Optional[int] = None,
         include_members: Optional[float] = None,
         search_query: Optional[str] = None,
+        max_results: Optional[int] = None,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None
-    ) -> List[Group]:
+    ) -> Union[List[Group], GetGroupsInOrganizationToolOutput]:
         """
         Asynchronously retrieve groups in the organization.
 
         :param page_size: Number of results per page
         :param include_members: Number of members to include
         :param search_query: Search query to filter groups
+        :param max_results: Maximum number of groups to return
         :param run_manager: Optional async callback manager
-        :return: List of groups
+        :return: List of groups, or the groups and whether they were truncated
+            when max_results is set
         """
         try:
             tool = GetGroupsInOrganization(lightdash_client=self.lightdash_client)
             return await tool.acall(
                 page_size=page_size,
                 include_members=include_members,
-                search_query=search_query
+                search_query=search_query,
+                max_results=max_results,
             )
         except Exception as e:
             error_message = textwrap.dedent(f"""\
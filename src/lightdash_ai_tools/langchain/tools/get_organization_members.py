@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import textwrap
-from typing import List, Optional, Type
+from typing import List, Optional, Type, Union
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
@@ -24,10 +24,11 @@ from pydantic import BaseModel
 
 from lightdash_ai_tools.common.tools.get_organization_members import (
     GetOrganizationMembers,
+    GetOrganizationMembersToolOutput,
 )
 from lightdash_ai_tools.lightdash.client import LightdashClient
 from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
-    ListOrganizationMembersV1Results,
+    OrganizationMemberModel,
 )
 
 
@@ -45,17 +46,20 @@ class GetOrganizationMembersTool(BaseTool):
 
     def _run(
         self,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None
-    ) -> List[ListOrganizationMembersV1Results]:
+    ) -> Union[List[OrganizationMemberModel], GetOrganizationMembersToolOutput]:
         """
         Run method for getting members of the organization.
 
         Returns:
-            List of members in the organization
+            List of members in the organization, or the members and whether
+            they were truncated when max_results is set
         """
         try:
             tool = GetOrganizationMembers(lightdash_client=self.lightdash_client)
-            return tool.call()
+            return tool.call(page_size=page_size, max_results=max_results)
         except Exception as e:
             error_message = textwrap.dedent(f"""\
               Error retrieving organization members.
@@ -65,17 +69,22 @@ class GetOrganizationMembersTool(BaseTool):
 
     async def _arun(
         self,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None
-    ) -> List[ListOrganizationMembersV1Results]:
+    ) -> Union[List[OrganizationMemberModel], GetOrganizationMembersToolOutput]:
         """
         Asynchronously retrieve members of the organization.
 
+        :param page_size: Number of results per page
+        :param max_results: Maximum number of members to return
         :param run_manager: Optional async callback manager
-        :return: List of members in the organization
+        :return: List of members in the organization, or the members and whether
+            they were truncated when max_results is set
         """
         try:
             tool = GetOrganizationMembers(lightdash_client=self.lightdash_client)
-            return await tool.acall()
+            return await tool.acall(page_size=page_size, max_results=max_results)
         except Exception as e:
             error_message = textwrap.dedent(f"""\
               Error retrieving organization members asynchronously.
@@ -12,19 +12,74 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, TypeVar
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar, Union
 
-from pydantic import ValidationError
+import httpx
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import CoreConfig, SchemaValidator
 
+from lightdash_ai_tools.lightdash.cache import CacheEntry, is_not_found
 from lightdash_ai_tools.lightdash.client import LightdashClient, RequestType
 
 T = TypeVar("T")
 
+# Raw response of an API call: the JSON body as returned by the server, or an already decoded document.
+RawResponse = Union[bytes, Dict[str, Any]]
+
+
+def validate_response(adapter: TypeAdapter[T], response_data: RawResponse, trusted: bool = False) -> T:
+    """
+    Validates a raw response with a cached validator.
+
+    JSON bodies are validated directly from their bytes, without building
+    an intermediate dictionary first. The bodies of trusted endpoints are
+    validated by a copy of the validator that doesn't cache string values.
+
+    Args:
+        adapter (TypeAdapter[T]): Validator of the response model, built once per API module.
+        response_data (RawResponse): Raw response data from the API.
+        trusted (bool): Whether the endpoint is trusted by the client's drift monitor.
+
+    Returns:
+        T: Parsed response model.
+    """
+    if isinstance(response_data, (bytes, bytearray, str)):
+        if trusted:
+            return _trusted_validator(adapter).validate_json(response_data)
+        return adapter.validate_json(response_data)
+    return adapter.validate_python(response_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _trusted_validator(adapter: TypeAdapter) -> SchemaValidator:
+    """
+    Copy of the validator of an adapter that only caches the keys of JSON objects.
+
+    The string cache deduplicates the short values repeated across the items
+    of a listing, at the cost of a lookup for every string. Most values of the
+    listings are unique identifiers, names and emails, so skipping the lookup
+    parses them faster, and repeated values cost a separate string each.
+    """
+    return SchemaValidator(adapter.core_schema, CoreConfig(cache_strings="keys"))
+
+
+def response_size(response_data: RawResponse) -> Optional[int]:
+    """Length of a JSON body, or None for an already decoded document."""
+    if isinstance(response_data, (bytes, bytearray, str)):
+        return len(response_data)
+    return None
+
+
 class BaseLightdashApiCaller(Generic[T], ABC):
     """Base class for Lightdash API callers"""
 
     request_type: RequestType
+    # Whether the client's drift monitor checks the responses; off for callers whose models drop keys on purpose.
+    monitors_drift: bool = True
 
     def __init__(self, lightdash_client: LightdashClient):
         """
@@ -34,40 +89,160 @@ class BaseLightdashApiCaller(Generic[T], ABC):
             lightdash_client (LightdashClient): The Lightdash client to use for API calls.
         """
         self.lightdash_client = lightdash_client
+        # Length of the JSON body of the last response, None when it was served from the cache or already decoded.
+        self.last_response_size: Optional[int] = None
+        # Whether the last response was served from the client's cache.
+        self.last_response_cached = False
 
     def call(self, *args: Any, **kwargs: Any) -> T:
         """
         Makes a synchronous API call and returns the parsed response.
 
+        GET responses are served from the client's cache when one is configured.
+
         Raises:
             ValueError: If the API response is invalid.
         """
-        response_data = self._request(*args, **kwargs)
+        self.last_response_size = None
+        cache_key, cache_entry = self._lookup_cache(args, kwargs)
+        self.last_response_cached = cache_entry is not None
+        if cache_entry is not None:
+            return cache_entry.unwrap()
         try:
-            return self._parse_response(response_data)
-        except ValidationError as validation_error:
-            raise ValueError(f"Invalid response from Lightdash API: {validation_error.errors()}") from validation_error
+            response_data = self._request(*args, **kwargs)
+        except httpx.HTTPStatusError as error:
+            self._cache_error(cache_key, error)
+            raise
+        self.last_response_size = response_size(response_data)
+        result = self._parse(response_data)
+        self._cache_result(cache_key, result, self.last_response_size)
+        return result
 
     async def acall(self, *args: Any, **kwargs: Any) -> T:
         """
         Makes an asynchronous API call and returns the parsed response.
 
+        GET responses are served from the client's cache when one is configured.
+
         Raises:
             ValueError: If the API response is invalid.
         """
-        response_data = await self._arequest(*args, **kwargs)
+        self.last_response_size = None
+        cache_key, cache_entry = self._lookup_cache(args, kwargs)
+        self.last_response_cached = cache_entry is not None
+        if cache_entry is not None:
+            return cache_entry.unwrap()
         try:
-            return self._parse_response(response_data)
+            response_data = await self._arequest(*args, **kwargs)
+        except httpx.HTTPStatusError as error:
+            self._cache_error(cache_key, error)
+            raise
+        self.last_response_size = response_size(response_data)
+        result = await self._aparse(response_data)
+        self._cache_result(cache_key, result, self.last_response_size)
+        return result
+
+    def _parse(self, response_data: RawResponse) -> T:
+        """Parses the raw response, turning validation errors into a ValueError."""
+        try:
+            result = self._parse_response(response_data)
         except ValidationError as validation_error:
             raise ValueError(f"Invalid response from Lightdash API: {validation_error.errors()}") from validation_error
+        self._check_drift(response_data, result)
+        return result
+
+    async def _aparse(self, response_data: RawResponse) -> T:
+        """
+        Parses the raw response of an asynchronous call.
+
+        JSON bodies larger than the client's offload threshold are parsed on
+        the client's parse thread pool, so validating a multi-MB explore doesn't
+        stall the other coroutines. pydantic holds the GIL while it validates,
+        so a thread shortens the stalls of the event loop without shortening
+        the time spent parsing.
+        """
+        threshold = self.lightdash_client.parse_offload_threshold
+        if (
+            threshold is None
+            or not isinstance(response_data, (bytes, bytearray, str))
+            or len(response_data) <= threshold
+        ):
+            return self._parse(response_data)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.lightdash_client.parse_executor, self._parse, response_data)
+
+    @property
+    def trusted(self) -> bool:
+        """Whether the client's drift monitor trusts the endpoint, which parses its responses on the fast path."""
+        monitor = self.lightdash_client.drift_monitor
+        return monitor is not None and self.monitors_drift and monitor.trusts(self.endpoint_name)
+
+    def _check_drift(self, response_data: RawResponse, result: T) -> None:
+        """Lets the client's drift monitor check a sampled fraction of the parsed responses."""
+        monitor = self.lightdash_client.drift_monitor
+        if monitor is None or not self.monitors_drift or not isinstance(result, BaseModel):
+            return
+        if monitor.should_check():
+            monitor.check(self.endpoint_name, type(result), response_data)
 
+    @property
+    def endpoint_name(self) -> str:
+        """Name of the endpoint, used to label cache entries and metrics."""
+        return type(self).__name__
+
+    def _get_cache_key(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """Builds the cache key of a request, or returns None if the request isn't cacheable."""
+        cache = self.lightdash_client.cache
+        if cache is None or self.request_type != RequestType.GET:
+            return None
+        try:
+            bound_arguments = inspect.signature(self._request).bind(*args, **kwargs)
+        except TypeError:
+            return None
+        bound_arguments.apply_defaults()
+        arguments = {}
+        for name, value in bound_arguments.arguments.items():
+            if bound_arguments.signature.parameters[name].kind == inspect.Parameter.VAR_KEYWORD:
+                value = tuple(sorted(value.items()))
+            arguments[name] = value
+        return cache.make_key(self.endpoint_name, arguments)
+
+    def _lookup_cache(
+        self,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Optional[Hashable], Optional[CacheEntry]]:
+        """Looks up a request in the client's cache."""
+        cache_key = self._get_cache_key(args, kwargs)
+        if cache_key is None:
+            return None, None
+        return cache_key, self.lightdash_client.cache.get(cache_key)
+
+    def _cache_result(self, cache_key: Optional[Hashable], result: T, size: Optional[int]) -> None:
+        """Stores a parsed response in the client's cache, weighed by the length of its JSON body."""
+        if cache_key is None:
+            return
+        cache = self.lightdash_client.cache
+        cache.record_miss()
+        cache.set(cache_key, self.endpoint_name, result, size=size)
+
+    def _cache_error(self, cache_key: Optional[Hashable], error: httpx.HTTPStatusError) -> None:
+        """Stores a 'not found' response in the client's cache."""
+        if cache_key is None:
+            return
+        cache = self.lightdash_client.cache
+        if not is_not_found(error):
+            cache.record_miss()
+            return
+        cache.record_miss(negative=True)
+        cache.set_not_found(cache_key, self.endpoint_name, error)
 
     @abstractmethod
     def _request(
         self,
         *args: Any,
         **kwargs: Any
-    ) -> Dict[str, Any]:
+    ) -> RawResponse:
         """
         Makes a synchronous request to the Lightdash API and returns the raw response.
 
@@ -76,7 +251,7 @@ class BaseLightdashApiCaller(Generic[T], ABC):
             **kwargs: Any keyword arguments.
 
         Returns:
-            Dict[str, Any]: The raw response data from the API.
+            RawResponse: The raw response data from the API, preferably the undecoded JSON body.
         """
         raise NotImplementedError("Subclasses must implement this method")
 
@@ -85,7 +260,7 @@ class BaseLightdashApiCaller(Generic[T], ABC):
         self,
         *args: Any,
         **kwargs: Any
-    ) -> Dict[str, Any]:
+    ) -> RawResponse:
         """
         Makes an asynchronous request to the Lightdash API and returns the raw response.
 
@@ -94,18 +269,22 @@ class BaseLightdashApiCaller(Generic[T], ABC):
             **kwargs: Any keyword arguments.
 
         Returns:
-            Dict[str, Any]: The raw response data from the API.
+            RawResponse: The raw response data from the API, preferably the undecoded JSON body.
         """
         raise NotImplementedError("Subclasses must implement this method")
 
 
     @abstractmethod
-    def _parse_response(self, response_data: Dict[str, Any]) -> T:
+    def _parse_response(self, response_data: RawResponse) -> T:
         """
         Parse the API response into the expected model.
 
+        Implementations validate with a module-level TypeAdapter through
+        `validate_response`, so the validator is built once, and pass it
+        `trusted` to parse the responses of trusted endpoints on the fast path.
+
         Args:
-            response_data (Dict[str, Any]): Raw response data from the API.
+            response_data (RawResponse): Raw response data from the API.
 
         Returns:
             T: Parsed response model.
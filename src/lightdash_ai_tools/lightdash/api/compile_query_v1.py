@@ -12,21 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict
+from pydantic import TypeAdapter
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.compile_query_v1 import (
     CompileQueryRequestV1,
     CompileQueryResponseV1,
 )
 
+_RESPONSE_ADAPTER: TypeAdapter[CompileQueryResponseV1] = TypeAdapter(CompileQueryResponseV1)
+
 
 class CompileQueryV1(BaseLightdashApiCaller[CompileQueryResponseV1]):
     """Compile a query in a Lightdash project"""
     request_type = RequestType.POST
 
-    def _request(self, project_uuid: str, explore_id: str, body: CompileQueryRequestV1) -> Dict[str, Any]:
+    def _request(self, project_uuid: str, explore_id: str, body: CompileQueryRequestV1) -> bytes:
         """
         Compile a query for a specific explore in a project.
 
@@ -36,17 +42,17 @@ class CompileQueryV1(BaseLightdashApiCaller[CompileQueryResponseV1]):
             body (CompileQueryRequestV1): Query compilation parameters
 
         Returns:
-            Dict[str, Any]: Compiled query results
+            bytes: Compiled query results, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid, explore_id)
-        response_data = self.lightdash_client.call(
+        response_data = self.lightdash_client.call_raw(
             request_type=self.request_type,
             path=formatted_path,
             data=body.model_dump(exclude=["projectUuid", "exploreId"]),
         )
         return response_data
 
-    async def _arequest(self, project_uuid: str, explore_id: str, body: CompileQueryRequestV1) -> Dict[str, Any]:
+    async def _arequest(self, project_uuid: str, explore_id: str, body: CompileQueryRequestV1) -> bytes:
         """
         Asynchronously compile a query for a specific explore in a project.
 
@@ -56,18 +62,18 @@ class CompileQueryV1(BaseLightdashApiCaller[CompileQueryResponseV1]):
             body (CompileQueryRequestV1): Query compilation parameters
 
         Returns:
-            Dict[str, Any]: Compiled query results
+            bytes: Compiled query results, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid, explore_id)
-        response_data = await self.lightdash_client.acall(
+        response_data = await self.lightdash_client.acall_raw(
             request_type=self.request_type,
             path=formatted_path,
             data=body.model_dump(exclude=["projectUuid", "exploreId"]),
         )
         return response_data
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> CompileQueryResponseV1:
-        return CompileQueryResponseV1(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> CompileQueryResponseV1:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self, project_uuid: str, explore_id: str) -> str:
         return f"/api/v1/projects/{project_uuid}/explores/{explore_id}/compileQuery"
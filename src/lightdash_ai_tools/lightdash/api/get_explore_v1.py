@@ -12,18 +12,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict
+import functools
+from typing import Any, Dict, Hashable, Optional, Tuple
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
-from lightdash_ai_tools.lightdash.client import RequestType
+from pydantic import TypeAdapter, ValidationError
+
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient, RequestType
+from lightdash_ai_tools.lightdash.models.explore_summary import (
+    EXPLORE_SUMMARY_PROFILE,
+    ExploreSummary,
+)
 from lightdash_ai_tools.lightdash.models.get_explore_v1 import GetExploreV1Response
+from lightdash_ai_tools.lightdash.models.lazy_explore import LazyExploreResponse
+from lightdash_ai_tools.lightdash.models.slim_explore import (
+    SLIM_EXPLORE_PROFILE,
+    ExploreParseProfile,
+    slim_explore_response_model,
+)
+
+_RESPONSE_ADAPTER: TypeAdapter[GetExploreV1Response] = TypeAdapter(GetExploreV1Response)
+_LAZY_RESPONSE_ADAPTER: TypeAdapter[LazyExploreResponse] = TypeAdapter(LazyExploreResponse)
+
+
+@functools.lru_cache(maxsize=None)
+def _slim_response_adapter(profile: ExploreParseProfile) -> TypeAdapter[GetExploreV1Response]:
+    return TypeAdapter(slim_explore_response_model(profile))
+
+
+def explore_path(project_uuid: str, explore_id: str) -> str:
+    """Path of the get explore API for an explore of a project."""
+    return f"/api/v1/projects/{project_uuid}/explores/{explore_id}"
+
+
+def parse_explore_summary(response_data: RawResponse) -> ExploreSummary:
+    """
+    Parse a response of the get explore API into the summary of the explore.
+
+    The function is picklable, so process pools can run it on the raw bodies
+    and send back only the compact summaries.
+
+    Args:
+        response_data (RawResponse): Raw response of the get explore API.
+
+    Returns:
+        ExploreSummary: Summary of the explore.
+
+    Raises:
+        ValueError: If the API response is invalid.
+    """
+    try:
+        response = validate_response(_slim_response_adapter(EXPLORE_SUMMARY_PROFILE), response_data)
+    except ValidationError as validation_error:
+        # Raised without the ValidationError, which doesn't survive the trip back from a worker process.
+        raise ValueError(f"Invalid response from Lightdash API: {validation_error.errors()}") from None
+    return ExploreSummary.from_model(response.results)
 
 
 class GetExploreV1(BaseLightdashApiCaller[GetExploreV1Response]):
     """Get a specific explore for a project"""
     request_type = RequestType.GET
 
-    def _request(self, project_uuid: str, explore_id: str) -> Dict[str, Any]:
+    def _request(self, project_uuid: str, explore_id: str) -> bytes:
         """
         Retrieve a specific explore for a project.
 
@@ -32,16 +86,16 @@ class GetExploreV1(BaseLightdashApiCaller[GetExploreV1Response]):
             explore_id (str): The ID of the explore to retrieve.
 
         Returns:
-            Dict[str, Any]: Details of the explore.
+            bytes: Details of the explore, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid, explore_id)
-        response_data = self.lightdash_client.call(
+        response_data = self.lightdash_client.call_raw(
             request_type=self.request_type,
             path=formatted_path,
         )
         return response_data
 
-    async def _arequest(self, project_uuid: str, explore_id: str) -> Dict[str, Any]:
+    async def _arequest(self, project_uuid: str, explore_id: str) -> bytes:
         """
         Retrieve a specific explore for a project asynchronously.
 
@@ -50,17 +104,52 @@ class GetExploreV1(BaseLightdashApiCaller[GetExploreV1Response]):
             explore_id (str): The ID of the explore to retrieve.
 
         Returns:
-            Dict[str, Any]: Details of the explore.
+            bytes: Details of the explore, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid, explore_id)
-        response_data = await self.lightdash_client.acall(
+        response_data = await self.lightdash_client.acall_raw(
             request_type=self.request_type,
             path=formatted_path,
         )
         return response_data
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> GetExploreV1Response:
-        return GetExploreV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> GetExploreV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self, project_uuid: str, explore_id: str) -> str:
-        return f"/api/v1/projects/{project_uuid}/explores/{explore_id}"
+        return explore_path(project_uuid, explore_id)
+
+
+class GetLazyExploreV1(GetExploreV1):
+    """Get a specific explore for a project, validating its fields on first access"""
+
+    def _parse_response(self, response_data: RawResponse) -> LazyExploreResponse:
+        return validate_response(_LAZY_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
+
+
+class GetSlimExploreV1(GetExploreV1):
+    """Get a specific explore for a project, dropping heavy sub-documents while parsing it"""
+
+    # The slim models ignore keys on purpose, which the drift monitor would report.
+    monitors_drift = False
+
+    def __init__(self, lightdash_client: LightdashClient, profile: ExploreParseProfile = SLIM_EXPLORE_PROFILE):
+        """
+        Initialize the Lightdash API caller.
+
+        Args:
+            lightdash_client (LightdashClient): The Lightdash client to use for API calls.
+            profile (ExploreParseProfile): Keys dropped from the explore while parsing it.
+        """
+        super().__init__(lightdash_client=lightdash_client)
+        self.profile = profile
+
+    def _get_cache_key(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """Builds the cache key of a request, keeping explores parsed by different profiles apart."""
+        cache_key = super()._get_cache_key(args, kwargs)
+        if cache_key is None:
+            return None
+        return (cache_key, self.profile)
+
+    def _parse_response(self, response_data: RawResponse) -> GetExploreV1Response:
+        return validate_response(_slim_response_adapter(self.profile), response_data)
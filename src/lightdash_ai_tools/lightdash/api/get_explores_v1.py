@@ -1,15 +1,21 @@
-from typing import Any, Dict
+from pydantic import TypeAdapter
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.get_explores_v1 import GetExploresV1Response
 
+_RESPONSE_ADAPTER: TypeAdapter[GetExploresV1Response] = TypeAdapter(GetExploresV1Response)
+
 
 class GetExploresV1(BaseLightdashApiCaller[GetExploresV1Response]):
     """Get explores for a project"""
     request_type = RequestType.GET
 
-    def _request(self, project_uuid: str) -> Dict[str, Any]:
+    def _request(self, project_uuid: str) -> bytes:
         """
         Retrieve explores for a specific project.
 
@@ -17,16 +23,16 @@ class GetExploresV1(BaseLightdashApiCaller[GetExploresV1Response]):
             project_uuid (str): The UUID of the project to retrieve explores for.
 
         Returns:
-            Dict[str, Any]: Details of the project's explores.
+            bytes: Details of the project's explores, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid)
-        response_data = self.lightdash_client.call(
+        response_data = self.lightdash_client.call_raw(
             request_type=self.request_type,
             path=formatted_path,
         )
         return response_data
 
-    async def _arequest(self, project_uuid: str) -> Dict[str, Any]:
+    async def _arequest(self, project_uuid: str) -> bytes:
         """
         Retrieve explores for a specific project asynchronously.
 
@@ -34,17 +40,17 @@ class GetExploresV1(BaseLightdashApiCaller[GetExploresV1Response]):
             project_uuid (str): The UUID of the project to retrieve explores for.
 
         Returns:
-            Dict[str, Any]: Details of the project's explores.
+            bytes: Details of the project's explores, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid)
-        response_data = await self.lightdash_client.acall(
+        response_data = await self.lightdash_client.acall_raw(
             request_type=self.request_type,
             path=formatted_path,
         )
         return response_data
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> GetExploresV1Response:
-        return GetExploresV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> GetExploresV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self, project_uuid: str) -> str:
         return f"/api/v1/projects/{project_uuid}/explores"
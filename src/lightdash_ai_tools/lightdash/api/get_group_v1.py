@@ -13,18 +13,26 @@
 # limitations under the License.
 
 
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from pydantic import TypeAdapter
+
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.get_group_v1 import GetGroupV1Response
 
+_RESPONSE_ADAPTER: TypeAdapter[GetGroupV1Response] = TypeAdapter(GetGroupV1Response)
+
 
 class GetGroupV1(BaseLightdashApiCaller[GetGroupV1Response]):
     """Get group details"""
     request_type = RequestType.GET
 
-    def _request(self, group_uuid: str, include_members: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
+    def _request(self, group_uuid: str, include_members: Optional[int] = None, offset: Optional[int] = None) -> bytes:
         """
         Retrieve a specific group.
 
@@ -34,7 +42,7 @@ class GetGroupV1(BaseLightdashApiCaller[GetGroupV1Response]):
             offset (Optional[int]): Offset of members to include.
 
         Returns:
-            Dict[str, Any]: Details of the group.
+            bytes: Details of the group, as a JSON document.
         """
         formatted_path = self._get_endpoint(group_uuid)
         params = {}
@@ -42,14 +50,14 @@ class GetGroupV1(BaseLightdashApiCaller[GetGroupV1Response]):
             params['includeMembers'] = include_members
         if offset is not None:
             params['offset'] = offset
-        response_data = self.lightdash_client.call(
+        response_data = self.lightdash_client.call_raw(
             request_type=self.request_type,
             path=formatted_path,
             parameters=params
         )
         return response_data
 
-    async def _arequest(self, group_uuid: str, include_members: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
+    async def _arequest(self, group_uuid: str, include_members: Optional[int] = None, offset: Optional[int] = None) -> bytes:
         """
         Asynchronously retrieve a specific group.
 
@@ -59,7 +67,7 @@ class GetGroupV1(BaseLightdashApiCaller[GetGroupV1Response]):
             offset (Optional[int]): Offset of members to include.
 
         Returns:
-            Dict[str, Any]: Details of the group.
+            bytes: Details of the group, as a JSON document.
         """
         formatted_path = self._get_endpoint(group_uuid)
         params = {}
@@ -67,15 +75,15 @@ class GetGroupV1(BaseLightdashApiCaller[GetGroupV1Response]):
             params['includeMembers'] = include_members
         if offset is not None:
             params['offset'] = offset
-        response_data = await self.lightdash_client.acall(
+        response_data = await self.lightdash_client.acall_raw(
             request_type=self.request_type,
             path=formatted_path,
             parameters=params
         )
         return response_data
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> GetGroupV1Response:
-        return GetGroupV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> GetGroupV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self, group_uuid: str) -> str:
         return f"/api/v1/groups/{group_uuid}"
@@ -12,20 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict
+from pydantic import TypeAdapter
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.get_project_access_list_v1 import (
     GetProjectAccessListV1Response,
 )
 
+_RESPONSE_ADAPTER: TypeAdapter[GetProjectAccessListV1Response] = TypeAdapter(GetProjectAccessListV1Response)
+
 
 class GetProjectAccessListV1(BaseLightdashApiCaller[GetProjectAccessListV1Response]):
     """Get project access list"""
     request_type = RequestType.GET
 
-    def _request(self, project_uuid: str) -> Dict[str, Any]:
+    def _request(self, project_uuid: str) -> bytes:
         """
         Retrieve the access list for a specific project.
 
@@ -33,13 +39,13 @@ class GetProjectAccessListV1(BaseLightdashApiCaller[GetProjectAccessListV1Respon
             project_uuid (str): The UUID of the project to retrieve access list for.
 
         Returns:
-            Dict[str, Any]: The raw response data from the API.
+            bytes: The raw response data from the API, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid=project_uuid)
-        response_data = self.lightdash_client.call(self.request_type, formatted_path)
+        response_data = self.lightdash_client.call_raw(self.request_type, formatted_path)
         return response_data
 
-    async def _arequest(self, project_uuid: str) -> Dict[str, Any]:
+    async def _arequest(self, project_uuid: str) -> bytes:
         """
         Retrieve the access list for a specific project asynchronously.
 
@@ -47,14 +53,14 @@ class GetProjectAccessListV1(BaseLightdashApiCaller[GetProjectAccessListV1Respon
             project_uuid (str): The UUID of the project to retrieve access list for.
 
         Returns:
-            Dict[str, Any]: The raw response data from the API.
+            bytes: The raw response data from the API, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid=project_uuid)
-        response_data = await self.lightdash_client.acall(self.request_type, formatted_path)
+        response_data = await self.lightdash_client.acall_raw(self.request_type, formatted_path)
         return response_data
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> GetProjectAccessListV1Response:
-        return GetProjectAccessListV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> GetProjectAccessListV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self, project_uuid: str) -> str:
         """
@@ -12,18 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict
+from typing import Any
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from pydantic import TypeAdapter
+
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.get_project_v1 import GetProjectResponse
 
+_RESPONSE_ADAPTER: TypeAdapter[GetProjectResponse] = TypeAdapter(GetProjectResponse)
+
 
 class GetProjectV1(BaseLightdashApiCaller[GetProjectResponse]):
     """Get a Lightdash Project"""
     request_type = RequestType.GET
 
-    def _request(self, project_uuid: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    def _request(self, project_uuid: str, *args: Any, **kwargs: Any) -> bytes:
         """
         Retrieve a specific project by its UUID.
 
@@ -31,13 +39,13 @@ class GetProjectV1(BaseLightdashApiCaller[GetProjectResponse]):
             project_uuid (str): The UUID of the project to retrieve.
 
         Returns:
-            Dict[str, Any]: Details of the retrieved project.
+            bytes: Details of the retrieved project, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid=project_uuid)
-        response_data = self.lightdash_client.call(self.request_type, formatted_path)
+        response_data = self.lightdash_client.call_raw(self.request_type, formatted_path)
         return response_data
 
-    async def _arequest(self, project_uuid: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    async def _arequest(self, project_uuid: str, *args: Any, **kwargs: Any) -> bytes:
         """
         Retrieve a specific project by its UUID asynchronously.
 
@@ -45,14 +53,14 @@ class GetProjectV1(BaseLightdashApiCaller[GetProjectResponse]):
             project_uuid (str): The UUID of the project to retrieve.
 
         Returns:
-            Dict[str, Any]: Details of the retrieved project.
+            bytes: Details of the retrieved project, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid=project_uuid)
-        response_data = await self.lightdash_client.acall(self.request_type, formatted_path)
+        response_data = await self.lightdash_client.acall_raw(self.request_type, formatted_path)
         return response_data
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> GetProjectResponse:
-        return GetProjectResponse(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> GetProjectResponse:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self, project_uuid: str) -> str:
         """
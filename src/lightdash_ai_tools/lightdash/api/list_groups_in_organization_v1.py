@@ -12,14 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from pydantic import TypeAdapter
+
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.list_groups_in_organization_v1 import (
     ListGroupsInOrganizationV1Response,
 )
 
+_RESPONSE_ADAPTER: TypeAdapter[ListGroupsInOrganizationV1Response] = TypeAdapter(ListGroupsInOrganizationV1Response)
+
 
 class ListGroupsInOrganizationV1(BaseLightdashApiCaller[ListGroupsInOrganizationV1Response]):
     """API call to list groups in the organization."""
@@ -32,7 +40,7 @@ class ListGroupsInOrganizationV1(BaseLightdashApiCaller[ListGroupsInOrganization
         page_size: Optional[int] = None,
         search_query: Optional[str] = None,
         include_members: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
         List groups in the organization.
 
@@ -43,7 +51,7 @@ class ListGroupsInOrganizationV1(BaseLightdashApiCaller[ListGroupsInOrganization
             include_members: Optional parameter to include members in the group details
 
         Returns:
-            Dict[str, Any]
+            bytes: JSON document of the response
         """
         formatted_path = self._get_endpoint()
         params = {}
@@ -56,7 +64,7 @@ class ListGroupsInOrganizationV1(BaseLightdashApiCaller[ListGroupsInOrganization
         if include_members is not None:
             params["includeMembers"] = include_members
 
-        response_data = self.lightdash_client.call(
+        response_data = self.lightdash_client.call_raw(
             request_type=self.request_type, path=formatted_path, parameters=params
         )
         return response_data
@@ -67,7 +75,7 @@ class ListGroupsInOrganizationV1(BaseLightdashApiCaller[ListGroupsInOrganization
         page_size: Optional[int] = None,
         search_query: Optional[str] = None,
         include_members: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
         Async version: List groups in the organization.
 
@@ -78,26 +86,26 @@ class ListGroupsInOrganizationV1(BaseLightdashApiCaller[ListGroupsInOrganization
             include_members: Optional parameter to include members in the group details
 
         Returns:
-            Dict[str, Any]
+            bytes: JSON document of the response
         """
         formatted_path = self._get_endpoint()
         params = {}
         if page is not None:
             params["page"] = page
         if page_size is not None:
-            params["page_size"] = page_size
+            params["pageSize"] = page_size
         if search_query is not None:
-            params["search_query"] = search_query
+            params["searchQuery"] = search_query
         if include_members is not None:
-            params["include_members"] = include_members
-        return await self.lightdash_client.acall(
+            params["includeMembers"] = include_members
+        return await self.lightdash_client.acall_raw(
             request_type=self.request_type,
             path=formatted_path,
             parameters=params,
         )
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> ListGroupsInOrganizationV1Response:
-        return ListGroupsInOrganizationV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> ListGroupsInOrganizationV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self) -> str:
         """
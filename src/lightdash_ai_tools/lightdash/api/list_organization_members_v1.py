@@ -12,14 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from pydantic import TypeAdapter
+
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
     ListOrganizationMembersV1Response,
 )
 
+_RESPONSE_ADAPTER: TypeAdapter[ListOrganizationMembersV1Response] = TypeAdapter(ListOrganizationMembersV1Response)
+
 
 class ListOrganizationMembersV1(BaseLightdashApiCaller[ListOrganizationMembersV1Response]):
     """API call to list organization members."""
@@ -33,7 +41,7 @@ class ListOrganizationMembersV1(BaseLightdashApiCaller[ListOrganizationMembersV1
         search_query: Optional[str] = None,
         project_uuid: Optional[str] = None,
         include_groups: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
         List organization members.
 
@@ -45,7 +53,7 @@ class ListOrganizationMembersV1(BaseLightdashApiCaller[ListOrganizationMembersV1
             include_groups: Optional parameter for groups
 
         Returns:
-            Dict[str, Any]
+            bytes: JSON document of the response
         """
         formatted_path = self._get_endpoint()
         params = {}
@@ -60,7 +68,7 @@ class ListOrganizationMembersV1(BaseLightdashApiCaller[ListOrganizationMembersV1
         if include_groups is not None:
             params["includeGroups"] = include_groups
 
-        response_data = self.lightdash_client.call(
+        response_data = self.lightdash_client.call_raw(
             request_type=self.request_type, path=formatted_path, parameters=params
         )
         return response_data
@@ -72,7 +80,7 @@ class ListOrganizationMembersV1(BaseLightdashApiCaller[ListOrganizationMembersV1
         search_query: Optional[str] = None,
         project_uuid: Optional[str] = None,
         include_groups: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
         Async version to list organization members.
 
@@ -84,7 +92,7 @@ class ListOrganizationMembersV1(BaseLightdashApiCaller[ListOrganizationMembersV1
             include_groups: Optional parameter for groups
 
         Returns:
-            Dict[str, Any]
+            bytes: JSON document of the response
         """
         formatted_path = self._get_endpoint()
         params = {}
@@ -99,14 +107,14 @@ class ListOrganizationMembersV1(BaseLightdashApiCaller[ListOrganizationMembersV1
         if include_groups is not None:
             params["includeGroups"] = include_groups
 
-        response_data = await self.lightdash_client.acall(
+        response_data = await self.lightdash_client.acall_raw(
             request_type=self.request_type, path=formatted_path, parameters=params
         )
         return response_data
 
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> ListOrganizationMembersV1Response:
-        return ListOrganizationMembersV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> ListOrganizationMembersV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self) -> str:
         """
@@ -13,14 +13,22 @@
 # limitations under the License.
 
 
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from pydantic import TypeAdapter
+
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.list_organization_projects_v1 import (
     ListOrganizationProjectsV1Response,
 )
 
+_RESPONSE_ADAPTER: TypeAdapter[ListOrganizationProjectsV1Response] = TypeAdapter(ListOrganizationProjectsV1Response)
+
 
 class ListOrganizationProjectsV1(BaseLightdashApiCaller[ListOrganizationProjectsV1Response]):
     """Gets all projects of the current user's organization"""
@@ -31,7 +39,7 @@ class ListOrganizationProjectsV1(BaseLightdashApiCaller[ListOrganizationProjects
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         search_query: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
         Retrieve all projects in the current organization.
 
@@ -41,24 +49,24 @@ class ListOrganizationProjectsV1(BaseLightdashApiCaller[ListOrganizationProjects
             search_query: Search query to filter projects
 
         Returns:
-            Dict[str, Any]: List of organization projects.
+            bytes: List of organization projects, as a JSON document.
         """
         formatted_path = self._get_endpoint()
         params = {}
         if page is not None:
             params["page"] = page
         if page_size is not None:
-            params["page_size"] = page_size
+            params["pageSize"] = page_size
         if search_query is not None:
-            params["search_query"] = search_query
-        return self.lightdash_client.call(request_type=self.request_type, path=formatted_path, parameters=params)
+            params["searchQuery"] = search_query
+        return self.lightdash_client.call_raw(request_type=self.request_type, path=formatted_path, parameters=params)
 
     async def _arequest(
         self,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         search_query: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
         Asynchronously retrieve all projects in the current organization.
 
@@ -68,20 +76,20 @@ class ListOrganizationProjectsV1(BaseLightdashApiCaller[ListOrganizationProjects
             search_query: Search query to filter projects
 
         Returns:
-            Dict[str, Any]: List of organization projects.
+            bytes: List of organization projects, as a JSON document.
         """
         formatted_path = self._get_endpoint()
         params = {}
         if page is not None:
             params["page"] = page
         if page_size is not None:
-            params["page_size"] = page_size
+            params["pageSize"] = page_size
         if search_query is not None:
-            params["search_query"] = search_query
-        return await self.lightdash_client.acall(request_type=self.request_type, path=formatted_path, parameters=params)
+            params["searchQuery"] = search_query
+        return await self.lightdash_client.acall_raw(request_type=self.request_type, path=formatted_path, parameters=params)
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> ListOrganizationProjectsV1Response:
-        return ListOrganizationProjectsV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> ListOrganizationProjectsV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self) -> str:
         """
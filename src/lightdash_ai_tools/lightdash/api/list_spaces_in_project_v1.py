@@ -12,20 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict
+from typing import Any
 
-from lightdash_ai_tools.lightdash.api.base import BaseLightdashApiCaller
+from pydantic import TypeAdapter
+
+from lightdash_ai_tools.lightdash.api.base import (
+    BaseLightdashApiCaller,
+    RawResponse,
+    validate_response,
+)
 from lightdash_ai_tools.lightdash.client import RequestType
 from lightdash_ai_tools.lightdash.models.list_spaces_in_project_v1 import (
     ListSpacesInProjectV1Response,
 )
 
+_RESPONSE_ADAPTER: TypeAdapter[ListSpacesInProjectV1Response] = TypeAdapter(ListSpacesInProjectV1Response)
+
 
 class ListSpacesInProjectV1(BaseLightdashApiCaller[ListSpacesInProjectV1Response]):
     """Gets all spaces in a project"""
     request_type = RequestType.GET
 
-    def _request(self, project_uuid: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    def _request(self, project_uuid: str, *args: Any, **kwargs: Any) -> bytes:
         """
         Retrieve all spaces in the current project.
 
@@ -33,13 +41,13 @@ class ListSpacesInProjectV1(BaseLightdashApiCaller[ListSpacesInProjectV1Response
             project_uuid (str): The UUID of the project to retrieve spaces from.
 
         Returns:
-            Dict[str, Any]: List of spaces in the project.
+            bytes: List of spaces in the project, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid=project_uuid)
-        response_data = self.lightdash_client.call(self.request_type, formatted_path)
+        response_data = self.lightdash_client.call_raw(self.request_type, formatted_path)
         return response_data
 
-    async def _arequest(self, project_uuid: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    async def _arequest(self, project_uuid: str, *args: Any, **kwargs: Any) -> bytes:
         """
         Retrieve all spaces in the current project asynchronously.
 
@@ -47,14 +55,14 @@ class ListSpacesInProjectV1(BaseLightdashApiCaller[ListSpacesInProjectV1Response
             project_uuid (str): The UUID of the project to retrieve spaces from.
 
         Returns:
-            Dict[str, Any]: List of spaces in the project.
+            bytes: List of spaces in the project, as a JSON document.
         """
         formatted_path = self._get_endpoint(project_uuid=project_uuid)
-        response_data = await self.lightdash_client.acall(self.request_type, formatted_path)
+        response_data = await self.lightdash_client.acall_raw(self.request_type, formatted_path)
         return response_data
 
-    def _parse_response(self, response_data: Dict[str, Any]) -> ListSpacesInProjectV1Response:
-        return ListSpacesInProjectV1Response(**response_data)
+    def _parse_response(self, response_data: RawResponse) -> ListSpacesInProjectV1Response:
+        return validate_response(_RESPONSE_ADAPTER, response_data, trusted=self.trusted)
 
     def _get_endpoint(self, project_uuid: str) -> str:
         """
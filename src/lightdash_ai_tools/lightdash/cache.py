@@ -0,0 +1,300 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+from lightdash_ai_tools.lightdash.memory import estimate_size
+
+
+class CacheMetrics(BaseModel):
+    """Counters of a cache"""
+
+    hits: int = Field(default=0, description="Number of lookups answered from the cache")
+    misses: int = Field(default=0, description="Number of lookups not found in the cache")
+    stores: int = Field(default=0, description="Number of entries written to the cache")
+    expirations: int = Field(default=0, description="Number of entries dropped because their TTL elapsed")
+    evictions: int = Field(default=0, description="Number of entries dropped to make room for new ones")
+    rejections: int = Field(default=0, description="Number of entries not stored because they exceed the byte budget on their own")
+
+
+class CacheEntry:
+    """A cached API response, or a cached 'not found' error"""
+
+    __slots__ = ("endpoint", "value", "error", "expires_at", "size")
+
+    def __init__(
+        self,
+        endpoint: str,
+        expires_at: float,
+        value: Any = None,
+        error: Optional[httpx.HTTPStatusError] = None,
+        size: int = 0,
+    ):
+        self.endpoint = endpoint
+        self.value = value
+        self.error = error
+        self.expires_at = expires_at
+        self.size = size
+
+    @property
+    def is_negative(self) -> bool:
+        return self.error is not None
+
+    def unwrap(self) -> Any:
+        """
+        Return the cached value.
+
+        Raises:
+            httpx.HTTPStatusError: If the entry is a cached 'not found' error.
+        """
+        if self.error is not None:
+            # Raise a fresh exception so tracebacks don't pile up on the cached one.
+            raise httpx.HTTPStatusError(
+                str(self.error),
+                request=self.error.request,
+                response=self.error.response,
+            )
+        return self.value
+
+
+class ApiResponseCache:
+    """
+    In-memory LRU cache of parsed Lightdash API responses.
+
+    Besides successful responses, the cache remembers 404 responses for a
+    shorter TTL, so repeatedly looking up an explore, group or project that
+    doesn't exist doesn't hit Lightdash every time. Negative entries share the
+    keys of positive entries and are counted in their own metrics.
+
+    The cache can be bounded by number of entries, by bytes, or both. Parsed
+    explores range from a few KB to several MB, so a byte budget keeps memory
+    predictable where a count would either waste memory or thrash.
+
+    Under a byte budget, an entry weighs an estimate of the memory its parsed
+    response retains. Parsed models retain about 4 times the length of their
+    JSON body, with a ratio that depends on the endpoint. Walking every
+    response with the sizer would cost more than parsing it, so the cache
+    walks the responses of an endpoint until one calibrates it, then one in
+    `calibration_interval`, and weighs the others by their body length times
+    the ratio measured so far. Values cached without a body are always
+    walked. Without a budget nothing is walked, and entries weigh the length
+    of their body.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sizer: Callable[[Any], int] = estimate_size,
+        calibration_interval: int = 32,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a successful response is kept
+            negative_ttl: Seconds a 'not found' response is kept, 0 disables negative caching
+            max_entries: Maximum number of entries before the least recently used ones are evicted, None for no limit
+            max_bytes: Maximum bytes retained by the cached responses, None for no limit
+            clock: Monotonic clock, in seconds
+            sizer: Function estimating the bytes retained by a value
+            calibration_interval: Number of responses of an endpoint per response walked by the sizer
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer")
+        if calibration_interval < 1:
+            raise ValueError("calibration_interval must be a positive integer")
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._sizer = sizer
+        self.calibration_interval = calibration_interval
+        # Bytes walked by the sizer, body bytes of the walked responses, and responses stored, per endpoint.
+        self._calibrations: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes_by_endpoint: Dict[str, int] = defaultdict(int)
+        self._total_bytes = 0
+        self._metrics = CacheMetrics()
+        self._negative_metrics = CacheMetrics()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, arguments: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Build the cache key of a request.
+
+        Args:
+            endpoint: Name of the API endpoint
+            arguments: Arguments of the request, keyed by parameter name
+
+        Returns:
+            The key, or None if the arguments can't be used as a key.
+        """
+        key = (endpoint, tuple(sorted(arguments.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        """Metrics of successful responses."""
+        with self._lock:
+            return self._metrics.model_copy()
+
+    @property
+    def negative_metrics(self) -> CacheMetrics:
+        """Metrics of 'not found' responses."""
+        with self._lock:
+            return self._negative_metrics.model_copy()
+
+    @property
+    def current_bytes(self) -> int:
+        """Bytes of all entries, as estimated retained bytes under a byte budget."""
+        with self._lock:
+            return self._total_bytes
+
+    def bytes_by_endpoint(self) -> Dict[str, int]:
+        """Bytes of the entries of every endpoint, as estimated retained bytes under a byte budget."""
+        with self._lock:
+            return {endpoint: size for endpoint, size in self._bytes_by_endpoint.items() if size}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes_by_endpoint.clear()
+            self._calibrations.clear()
+            self._total_bytes = 0
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up an entry.
+
+        Misses are counted by `record_miss`, since only the caller knows
+        whether the fetched response turns out to be positive or negative.
+
+        Args:
+            key: Cache key built by `make_key`
+
+        Returns:
+            The entry, or None if there is no live entry for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self._metrics_for(entry).expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            self._metrics_for(entry).hits += 1
+            return entry
+
+    def record_miss(self, negative: bool = False) -> None:
+        """Count a lookup that had to go to Lightdash."""
+        with self._lock:
+            (self._negative_metrics if negative else self._metrics).misses += 1
+
+    def set(self, key: Hashable, endpoint: str, value: Any, size: Optional[int] = None) -> None:
+        """
+        Cache a successful response.
+
+        Args:
+            key: Cache key built by `make_key`
+            endpoint: Name of the API endpoint
+            value: Parsed response
+            size: Length of the body the response was parsed from, None if it wasn't parsed from a body
+        """
+        if self.ttl <= 0:
+            return
+        if self.max_bytes is not None:
+            size = self._estimate_retained_size(endpoint, value, size)
+        self._store(key, CacheEntry(endpoint=endpoint, value=value, expires_at=self._clock() + self.ttl, size=size or 0))
+
+    def _estimate_retained_size(self, endpoint: str, value: Any, body_size: Optional[int]) -> int:
+        """Estimate the bytes retained by a response, from its body length and the ratio calibrated for its endpoint."""
+        with self._lock:
+            calibration = self._calibrations[endpoint]
+            calibration[2] += 1
+            if body_size is not None and calibration[1] and calibration[2] % self.calibration_interval:
+                return round(body_size * calibration[0] / calibration[1])
+        size = self._sizer(value)
+        if body_size:
+            with self._lock:
+                calibration[0] += size
+                calibration[1] += body_size
+        return size
+
+    def set_not_found(self, key: Hashable, endpoint: str, error: httpx.HTTPStatusError) -> None:
+        """Cache a 'not found' response."""
+        if self.negative_ttl <= 0:
+            return
+        # The error keeps the response body alive, which is what a negative entry retains.
+        size = len(str(error)) + len(error.response.content)
+        self._store(key, CacheEntry(endpoint=endpoint, error=error, expires_at=self._clock() + self.negative_ttl, size=size))
+
+    def _store(self, key: Hashable, entry: CacheEntry) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                self._metrics_for(entry).rejections += 1
+                return
+            self._entries[key] = entry
+            self._bytes_by_endpoint[entry.endpoint] += entry.size
+            self._total_bytes += entry.size
+            self._metrics_for(entry).stores += 1
+            while self._is_over_budget():
+                evicted_key = next(iter(self._entries))
+                evicted = self._remove(evicted_key)
+                self._metrics_for(evicted).evictions += 1
+
+    def _is_over_budget(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._total_bytes > self.max_bytes
+
+    def _remove(self, key: Hashable) -> CacheEntry:
+        entry = self._entries.pop(key)
+        self._bytes_by_endpoint[entry.endpoint] -= entry.size
+        self._total_bytes -= entry.size
+        return entry
+
+    def _metrics_for(self, entry: CacheEntry) -> CacheMetrics:
+        return self._negative_metrics if entry.is_negative else self._metrics
+
+
+def is_not_found(error: Exception) -> bool:
+    """Whether an exception is a 404 response from Lightdash."""
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == httpx.codes.NOT_FOUND
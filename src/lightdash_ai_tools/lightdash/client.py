@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Dict, Optional, Union
 
 import httpx
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, SecretStr
+
+from lightdash_ai_tools.lightdash.cache import ApiResponseCache
+from lightdash_ai_tools.lightdash.drift import DriftMonitor
+from lightdash_ai_tools.lightdash.paging import AdaptivePageSizer
 
 
 class RequestType(str, Enum):
@@ -31,10 +38,47 @@ class RequestType(str, Enum):
 
 class LightdashClient(BaseModel):
     """A client for the Lightdash API"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     base_url: str = Field(description="Base URL for the Lightdash API")
     token: SecretStr = Field(description="API authentication token")
     timeout: int = Field(default=30, description="Request timeout in seconds")
+    max_connections: int = Field(default=16, description="Maximum number of pooled connections of synchronous calls")
+    cache: Optional[ApiResponseCache] = Field(default=None, exclude=True, description="Cache of parsed API responses shared by the API callers")
+    page_sizer: Optional[AdaptivePageSizer] = Field(default=None, exclude=True, description="Page size policy of paginated listings requested without an explicit page size")
+    parse_offload_threshold: Optional[int] = Field(default=None, ge=0, description="Size in bytes above which asynchronous calls parse responses off the event loop, None to always parse on the event loop")
+    # A thread pool, since parsing runs a bound method of the API caller and uses the client's drift monitor, which a process pool can't share.
+    parse_executor: Optional[ThreadPoolExecutor] = Field(default=None, exclude=True, description="Thread pool parsing the responses moved off the event loop, None for the loop's default thread pool")
+    drift_monitor: Optional[DriftMonitor] = Field(default=None, exclude=True, description="Monitor checking a sampled fraction of the parsed responses for schema drift")
+
+    _http_client: Optional[httpx.Client] = PrivateAttr(default=None)
+    _http_client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def _get_http_client(self) -> httpx.Client:
+        """
+        Returns the HTTP client of synchronous calls.
+
+        The client is created on first use and shared by every synchronous
+        call, including calls made from several threads, so connections are
+        kept alive and reused instead of being opened for every request.
+        """
+        with self._http_client_lock:
+            if self._http_client is None or self._http_client.is_closed:
+                self._http_client = httpx.Client(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+            return self._http_client
+
+    def close(self) -> None:
+        """Closes the pooled connections of synchronous calls."""
+        with self._http_client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
 
     def _build_headers(self) -> Dict[str, str]:
         """Builds the headers for the request."""
@@ -66,20 +110,40 @@ class LightdashClient(BaseModel):
         Returns:
             Dict[str, Any]: Parsed JSON response
         """
+        return json.loads(self.call_raw(request_type, path, parameters=parameters, data=data))
+
+    def call_raw(
+        self,
+        request_type: RequestType,
+        path: str,
+        parameters: Optional[Dict[str, Union[str, int]]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Make a synchronous API call to Lightdash and return the undecoded response body.
+
+        Args:
+            request_type (RequestType): HTTP method to use
+            path (str): API endpoint path
+            parameters (Optional[Dict[str, str]], optional): Query parameters
+            data (Optional[Dict[str, Any]], optional): Request body data
+
+        Returns:
+            bytes: JSON response body
+        """
         url = self._build_url(path)
         headers = self._build_headers()
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.request(
-                    request_type.value,
-                    url,
-                    params=parameters,
-                    json=data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = self._get_http_client().request(
+                request_type.value,
+                url,
+                params=parameters,
+                json=data,
+                headers=headers,
+            )
+            response.raise_for_status()
+            return response.content
         except httpx.RequestError as e:
             error_message = textwrap.dedent(f"""\
               API call failed: {e}
@@ -109,6 +173,27 @@ class LightdashClient(BaseModel):
         Returns:
             Dict[str, Any]: Parsed JSON response
         """
+        return json.loads(await self.acall_raw(request_type, path, parameters=parameters, data=data))
+
+    async def acall_raw(
+        self,
+        request_type: RequestType,
+        path: str,
+        parameters: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Make an asynchronous API call to Lightdash and return the undecoded response body.
+
+        Args:
+            request_type (RequestType): HTTP method to use
+            path (str): API endpoint path
+            parameters (Optional[Dict[str, str]], optional): Query parameters
+            data (Optional[Dict[str, Any]], optional): Request body data
+
+        Returns:
+            bytes: JSON response body
+        """
         url = self._build_url(path)
         headers = self._build_headers()
 
@@ -122,7 +207,7 @@ class LightdashClient(BaseModel):
                     headers=headers,
                 )
                 response.raise_for_status()
-                return response.json()
+                return response.content
         except httpx.RequestError as e:
             error_message = textwrap.dedent(f"""\
               API call failed: {e}
@@ -0,0 +1,225 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Sampled detection of drift between Lightdash API responses and the models.
+
+The response models validate leniently: they coerce values and ignore keys
+they don't know, so a response whose shape has drifted still parses. The
+monitor validates a sampled fraction of the responses a second time against
+a strict copy of the response model. The copy forbids unknown keys and
+disables coercion. What it finds is reported, and the API call still
+returns the leniently parsed response.
+
+Endpoints whose responses have proven to match the models can be trusted.
+Their responses are parsed on a faster path, and the sampled checks keep
+watching them for drift.
+"""
+
+import copy
+import functools
+import random
+import threading
+import types
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    create_model,
+)
+
+
+class DriftMetrics(BaseModel):
+    """Counters of a drift monitor"""
+
+    responses: int = Field(default=0, description="Number of parsed responses seen")
+    checked: int = Field(default=0, description="Number of responses validated against the strict models")
+    drifted: int = Field(default=0, description="Number of checked responses that didn't match the strict models")
+
+
+class SchemaDrift(BaseModel):
+    """Mismatch between a response and the strict copy of its model"""
+
+    endpoint: str = Field(..., description="Name of the endpoint that returned the response")
+    model: str = Field(..., description="Name of the response model")
+    errors: List[Dict[str, Any]] = Field(..., description="Validation errors of the strict models, without the input values")
+
+
+def _strict_annotation(annotation: Any) -> Any:
+    """Annotation with every model replaced by its strict copy."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return strict_model(annotation)
+    origin = get_origin(annotation)
+    arguments = get_args(annotation)
+    if origin is None or not arguments:
+        return annotation
+    strict_arguments = tuple(_strict_annotation(argument) for argument in arguments)
+    if strict_arguments == arguments:
+        return annotation
+    if origin in (Union, types.UnionType):
+        return Union[strict_arguments]
+    if origin is list:
+        return List[strict_arguments[0]]
+    if origin is dict:
+        return Dict[strict_arguments[0], strict_arguments[1]]
+    return annotation
+
+
+@functools.lru_cache(maxsize=None)
+def strict_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Strict copy of a model.
+
+    The copy validates in strict mode and forbids the keys the model ignores.
+    Models that keep unknown keys as extra fields keep doing so.
+
+    Args:
+        model: Model to copy
+
+    Returns:
+        Subclass of `model`
+    """
+    extra = "allow" if model.model_config.get("extra") == "allow" else "forbid"
+    base = type(model.__name__, (model,), {
+        "__module__": __name__,
+        "model_config": ConfigDict(extra=extra, strict=True),
+    })
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = _strict_annotation(field.annotation)
+        if annotation is not field.annotation:
+            strict_field = copy.copy(field)
+            strict_field.annotation = annotation
+            fields[name] = (annotation, strict_field)
+    if not fields:
+        return base
+    return create_model(model.__name__, __base__=base, __module__=__name__, **fields)
+
+
+@functools.lru_cache(maxsize=None)
+def _strict_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(strict_model(model))
+
+
+class DriftMonitor:
+    """
+    Checks a sampled fraction of parsed responses against strict copies of their models.
+
+    Set it as the `drift_monitor` of a LightdashClient to monitor every API
+    caller using the client. The API callers of the trusted endpoints parse
+    JSON bodies without caching string values, which is faster for listings
+    of unique names, identifiers and emails.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        on_drift: Optional[Callable[[SchemaDrift], None]] = None,
+        max_reports: int = 100,
+        seed: Optional[int] = None,
+        trusted_endpoints: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            sample_rate: Fraction of responses checked, between 0 and 1
+            on_drift: Function called with every drift found
+            max_reports: Number of most recent drifts kept in `reports`
+            seed: Seed of the sampling, None to seed it randomly
+            trusted_endpoints: Names of the endpoints parsed on the fast path, e.g. "ListOrganizationMembersV1"
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.on_drift = on_drift
+        self.trusted_endpoints: FrozenSet[str] = frozenset(trusted_endpoints or ())
+        self._random = random.Random(seed)
+        self._reports: Deque[SchemaDrift] = deque(maxlen=max_reports)
+        self._metrics = DriftMetrics()
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> DriftMetrics:
+        """Counters of the monitor."""
+        with self._lock:
+            return self._metrics.model_copy()
+
+    @property
+    def reports(self) -> List[SchemaDrift]:
+        """Most recent drifts found, oldest first."""
+        with self._lock:
+            return list(self._reports)
+
+    def trusts(self, endpoint: str) -> bool:
+        """Whether the responses of an endpoint are parsed on the fast path."""
+        return endpoint in self.trusted_endpoints
+
+    def should_check(self) -> bool:
+        """Count a parsed response and decide whether to check it."""
+        with self._lock:
+            self._metrics.responses += 1
+            return self._random.random() < self.sample_rate
+
+    def check(self, endpoint: str, model: Type[BaseModel], response_data: Any) -> Optional[SchemaDrift]:
+        """
+        Validate a response against the strict copy of its model.
+
+        Args:
+            endpoint: Name of the endpoint that returned the response
+            model: Model the response was parsed into
+            response_data: Raw response, as the JSON body or a decoded document
+
+        Returns:
+            The drift found, or None if the response matches the strict model.
+        """
+        adapter = _strict_adapter(model)
+        try:
+            if isinstance(response_data, (bytes, bytearray, str)):
+                adapter.validate_json(response_data)
+            else:
+                adapter.validate_python(response_data)
+            drift = None
+        except ValidationError as validation_error:
+            drift = SchemaDrift(
+                endpoint=endpoint,
+                model=model.__name__,
+                errors=validation_error.errors(include_url=False, include_input=False),
+            )
+        with self._lock:
+            self._metrics.checked += 1
+            if drift is not None:
+                self._metrics.drifted += 1
+                self._reports.append(drift)
+        if drift is not None and self.on_drift is not None:
+            self.on_drift(drift)
+        return drift
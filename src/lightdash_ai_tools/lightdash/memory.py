@@ -0,0 +1,68 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from typing import Any, Optional, Set
+
+from pydantic import BaseModel, SecretStr
+
+# Objects shared by the whole process, which no single cache entry retains.
+_SHARED_TYPES = (bool, type(None), type)
+
+
+def estimate_size(obj: Any, _seen: Optional[Set[int]] = None) -> int:
+    """
+    Estimate the retained size of an object graph in bytes.
+
+    Pydantic models are walked through their field values, extra fields and
+    private attributes; containers through their items. Every object is
+    counted once, so values shared within the graph aren't double counted.
+
+    Args:
+        obj: Root of the object graph, e.g. a parsed API response
+
+    Returns:
+        Approximate number of bytes retained by the object graph.
+    """
+    seen: Set[int] = set() if _seen is None else _seen
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if isinstance(current, _SHARED_TYPES) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, (str, bytes, int, float)):
+            continue
+        if isinstance(current, BaseModel):
+            stack.append(current.__dict__)
+            stack.append(current.__pydantic_fields_set__)
+            if current.__pydantic_extra__:
+                stack.append(current.__pydantic_extra__)
+            if current.__pydantic_private__:
+                stack.append(current.__pydantic_private__)
+        elif isinstance(current, SecretStr):
+            stack.append(current.get_secret_value())
+        elif isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(vars(current))
+        elif hasattr(current, "__slots__"):
+            stack.extend(getattr(current, slot) for slot in current.__slots__ if hasattr(current, slot))
+    return total
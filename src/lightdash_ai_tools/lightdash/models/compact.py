@@ -0,0 +1,195 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact records of organization members and groups.
+
+Large organizations hold tens of thousands of members. A record keeps the
+fields of a member or group in slots, without a per-instance dictionary or
+validation metadata, and shares the strings every record repeats, such as
+the organization UUID and the role. Records are built from validated models
+and turn back into models on demand.
+"""
+
+import sys
+from datetime import datetime
+from typing import Any, Iterable, List, Optional
+
+from pydantic import SecretStr
+
+from lightdash_ai_tools.lightdash.models.list_groups_in_organization_v1 import Group
+from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
+    OrganizationMemberModel,
+)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+class CompactMember:
+    """Compact record of an organization member"""
+
+    __slots__ = (
+        "userUuid",
+        "userCreatedAt",
+        "userUpdatedAt",
+        "firstName",
+        "lastName",
+        "organizationUuid",
+        "role",
+        "isActive",
+        "isPending",
+        "isInviteExpired",
+        "_email",
+    )
+
+    def __init__(
+        self,
+        userUuid: str,
+        userCreatedAt: str,
+        userUpdatedAt: str,
+        firstName: str,
+        lastName: str,
+        organizationUuid: str,
+        role: str,
+        isActive: bool,
+        isPending: Optional[bool],
+        isInviteExpired: Optional[bool],
+        email: str,
+    ):
+        self.userUuid = userUuid
+        self.userCreatedAt = userCreatedAt
+        self.userUpdatedAt = userUpdatedAt
+        self.firstName = firstName
+        self.lastName = lastName
+        self.organizationUuid = sys.intern(organizationUuid)
+        self.role = sys.intern(role)
+        self.isActive = isActive
+        self.isPending = isPending
+        self.isInviteExpired = isInviteExpired
+        self._email = email
+
+    @classmethod
+    def from_model(cls, member: OrganizationMemberModel) -> "CompactMember":
+        """Build the record of a validated member."""
+        return cls(
+            userUuid=member.userUuid,
+            userCreatedAt=member.userCreatedAt,
+            userUpdatedAt=member.userUpdatedAt,
+            firstName=member.firstName,
+            lastName=member.lastName,
+            organizationUuid=member.organizationUuid,
+            role=member.role,
+            isActive=member.isActive,
+            isPending=member.isPending,
+            isInviteExpired=member.isInviteExpired,
+            email=member.email.get_secret_value(),
+        )
+
+    @property
+    def email(self) -> SecretStr:
+        """User's email address, hidden like the model's."""
+        return SecretStr(self._email)
+
+    def to_model(self) -> OrganizationMemberModel:
+        """Turn the record back into the member model, without validating it again."""
+        return OrganizationMemberModel.model_construct(
+            userUuid=self.userUuid,
+            userCreatedAt=self.userCreatedAt,
+            userUpdatedAt=self.userUpdatedAt,
+            firstName=self.firstName,
+            lastName=self.lastName,
+            organizationUuid=self.organizationUuid,
+            role=self.role,
+            isActive=self.isActive,
+            isPending=self.isPending,
+            isInviteExpired=self.isInviteExpired,
+            email=self.email,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactMember):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"CompactMember(userUuid={self.userUuid!r}, role={self.role!r}, isActive={self.isActive!r}, email='**********')"
+
+
+class CompactGroup:
+    """Compact record of a group"""
+
+    __slots__ = (
+        "uuid",
+        "name",
+        "organizationUuid",
+        "createdAt",
+        "createdByUserUuid",
+        "updatedAt",
+        "updatedByUserUuid",
+    )
+
+    def __init__(
+        self,
+        uuid: str,
+        name: str,
+        organizationUuid: str,
+        createdAt: Optional[datetime] = None,
+        createdByUserUuid: Optional[str] = None,
+        updatedAt: Optional[datetime] = None,
+        updatedByUserUuid: Optional[str] = None,
+    ):
+        self.uuid = uuid
+        self.name = name
+        self.organizationUuid = sys.intern(organizationUuid)
+        self.createdAt = createdAt
+        self.createdByUserUuid = _intern(createdByUserUuid)
+        self.updatedAt = updatedAt
+        self.updatedByUserUuid = _intern(updatedByUserUuid)
+
+    @classmethod
+    def from_model(cls, group: Group) -> "CompactGroup":
+        """Build the record of a validated group."""
+        return cls(
+            uuid=group.uuid,
+            name=group.name,
+            organizationUuid=group.organizationUuid,
+            createdAt=group.createdAt,
+            createdByUserUuid=group.createdByUserUuid,
+            updatedAt=group.updatedAt,
+            updatedByUserUuid=group.updatedByUserUuid,
+        )
+
+    def to_model(self) -> Group:
+        """Turn the record back into the group model, without validating it again."""
+        return Group.model_construct(**{name: getattr(self, name) for name in self.__slots__})
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactGroup):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"CompactGroup(uuid={self.uuid!r}, name={self.name!r})"
+
+
+def compact_members(members: Iterable[OrganizationMemberModel]) -> List[CompactMember]:
+    """Build the records of validated members."""
+    return [CompactMember.from_model(member) for member in members]
+
+
+def compact_groups(groups: Iterable[Group]) -> List[CompactGroup]:
+    """Build the records of validated groups."""
+    return [CompactGroup.from_model(group) for group in groups]
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
+from lightdash_ai_tools.lightdash.models.interned import InternedStr
+
 
 class DefaultTimeDimension(BaseModel):
     """Default time dimension"""
@@ -112,20 +114,45 @@ class JoinedTable(BaseModel):
     compiledSqlOn: Optional[str] = Field(None, description="Compiled SQL join condition")
 
 
+def _field_reference(table: Optional[str], name: Optional[str]) -> Optional[str]:
+    """Reference of a dimension or a metric, e.g. `orders_order_id`."""
+    if table and name:
+        return f"{table}_{name}"
+    return None
+
+
+def _cached_reference(field: Union["Dimension", "Metric"]) -> Optional[str]:
+    """
+    Reference of a field, cached in its instance dictionary.
+
+    The cache is keyed on the table and the name of the field, so it follows
+    copies and assignments that change them. Like `functools.cached_property`,
+    it stays out of dumps and equality, which pydantic private attributes
+    would take part in.
+    """
+    table, name = field.table, field.name
+    cached = field.__dict__.get("_reference")
+    if cached is not None and cached[0] == table and cached[1] == name:
+        return cached[2]
+    reference = _field_reference(table, name)
+    field.__dict__["_reference"] = (table, name, reference)
+    return reference
+
+
 class Dimension(BaseModel):
     """Dimension"""
     model_config = ConfigDict(extra='allow')
 
     sql: Optional[str] = Field(None, description="SQL expression for the dimension")
     name: Optional[str] = Field(None, description="Name of the dimension")
-    type: Optional[str] = Field(None, description="Data type of the dimension")
+    type: Optional[InternedStr] = Field(None, description="Data type of the dimension")
     index: Optional[int] = Field(None, description="Index of the dimension")
     label: Optional[str] = Field(None, description="Label of the dimension")
-    table: Optional[str] = Field(None, description="Table name the dimension belongs to")
-    groups: Optional[List[str]] = Field(None, description="Groups the dimension is part of")
+    table: Optional[InternedStr] = Field(None, description="Table name the dimension belongs to")
+    groups: Optional[List[InternedStr]] = Field(None, description="Groups the dimension is part of")
     hidden: Optional[bool] = Field(None, description="Whether the dimension is hidden")
-    fieldType: Optional[str] = Field(None, description="Field type of the dimension")
-    tableLabel: Optional[str] = Field(None, description="Label of the table")
+    fieldType: Optional[InternedStr] = Field(None, description="Field type of the dimension")
+    tableLabel: Optional[InternedStr] = Field(None, description="Label of the table")
     compiledSql: Optional[str] = Field(None, description="Compiled SQL for the dimension")
     description: Optional[str] = Field(None, description="Description of the dimension")
     isIntervalBase: Optional[bool] = Field(None, description="Whether the dimension is interval-based")
@@ -134,11 +161,10 @@ class Dimension(BaseModel):
     timeIntervalBaseDimensionName: Optional[str] = Field(None, description="Base dimension name for time intervals")
 
     @computed_field(description="Reference of the dimension")
+    @property
     def reference(self) -> Optional[str]:
         """Reference of the dimension"""
-        if self.table and self.name:
-            return f"{self.table}_{self.name}"
-        return None
+        return _cached_reference(self)
 
 
 class Metric(BaseModel):
@@ -147,15 +173,15 @@ class Metric(BaseModel):
 
     sql: Optional[str] = Field(None, description="SQL expression for the metric")
     name: Optional[str] = Field(None, description="Name of the metric")
-    type: Optional[str] = Field(None, description="Type of the metric (e.g., 'sum', 'count_distinct')")
+    type: Optional[InternedStr] = Field(None, description="Type of the metric (e.g., 'sum', 'count_distinct')")
     index: Optional[int] = Field(None, description="Index of the metric")
     label: Optional[str] = Field(None, description="Label of the metric")
-    table: Optional[str] = Field(None, description="Table name the metric belongs to")
-    groups: Optional[List[str]] = Field(None, description="Groups the metric is part of")
+    table: Optional[InternedStr] = Field(None, description="Table name the metric belongs to")
+    groups: Optional[List[InternedStr]] = Field(None, description="Groups the metric is part of")
     hidden: Optional[bool] = Field(None, description="Whether the metric is hidden")
     filters: Optional[List[Any]] = Field(None, description="Filters applied to the metric")
-    fieldType: Optional[str] = Field(None, description="Field type of the metric")
-    tableLabel: Optional[str] = Field(None, description="Label of the table")
+    fieldType: Optional[InternedStr] = Field(None, description="Field type of the metric")
+    tableLabel: Optional[InternedStr] = Field(None, description="Label of the table")
     compiledSql: Optional[str] = Field(None, description="Compiled SQL for the metric")
     description: Optional[str] = Field(None, description="Description of the metric")
     isAutoGenerated: Optional[bool] = Field(None, description="Whether the metric is auto-generated")
@@ -163,11 +189,10 @@ class Metric(BaseModel):
     dimensionReference: Optional[str] = Field(None, description="Reference to the related dimension")
 
     @computed_field(description="Reference of the metric")
+    @property
     def reference(self) -> Optional[str]:
         """Reference of the metric"""
-        if self.table and self.name:
-            return f"{self.table}_{self.name}"
-        return None
+        return _cached_reference(self)
 
 class GetExploreV1Results(BaseModel):
     """Explore results"""
@@ -198,6 +223,69 @@ class GetExploreV1Results(BaseModel):
     description: Optional[str] = Field(None, description="Explore description")
     timeframes: Optional[List[str]] = Field(None, description="Available timeframes")
 
+    @property
+    def _fields_by_reference(self) -> Dict[str, Union[Dimension, Metric]]:
+        """
+        Index of the dimensions and metrics by field ID and reference, built on first lookup.
+
+        The index is cached in the instance dictionary, keyed on the dimension
+        and metric dictionaries it was built from and on their lengths, so
+        assigning them, replacing them with `model_copy`, or adding and
+        removing fields in place rebuilds it. Fields renamed or replaced in
+        place without changing the number of fields aren't reindexed.
+        """
+        metrics, dimensions = self.metrics, self.dimensions
+        sizes = (len(metrics or {}), len(dimensions or {}))
+        cached = self.__dict__.get("_index")
+        if cached is not None and cached[0] is metrics and cached[1] is dimensions and cached[2] == sizes:
+            return cached[3]
+        index: Dict[str, Union[Dimension, Metric]] = {}
+        # Dimensions come last, so they win when a dimension and a metric share a reference.
+        for fields in (metrics or {}, dimensions or {}):
+            for field_id, field in fields.items():
+                if field.reference is not None:
+                    index[field.reference] = field
+                index[field_id] = field
+        self.__dict__["_index"] = (metrics, dimensions, sizes, index)
+        return index
+
+    def get_field(self, reference: str) -> Optional[Union[Dimension, Metric]]:
+        """
+        Get a dimension or a metric by its reference or field ID.
+
+        Args:
+            reference: Field reference, e.g. `orders_order_id`
+
+        Returns:
+            The matching dimension or metric, or None if it doesn't exist.
+        """
+        return self._fields_by_reference.get(reference)
+
+    def get_dimension(self, reference: str) -> Optional[Dimension]:
+        """Get a dimension by its reference or field ID, or None if it isn't a dimension."""
+        field = self.get_field(reference)
+        return field if isinstance(field, Dimension) else None
+
+    def get_metric(self, reference: str) -> Optional[Metric]:
+        """Get a metric by its reference or field ID, or None if it isn't a metric."""
+        field = self.get_field(reference)
+        return field if isinstance(field, Metric) else None
+
+    def find_unknown_fields(self, dimensions: Iterable[str] = (), metrics: Iterable[str] = ()) -> List[str]:
+        """
+        Find the references that don't match a field of the expected kind.
+
+        Args:
+            dimensions: References expected to be dimensions
+            metrics: References expected to be metrics
+
+        Returns:
+            The unknown references, in the order they were given.
+        """
+        unknown = [reference for reference in dimensions if self.get_dimension(reference) is None]
+        unknown.extend(reference for reference in metrics if self.get_metric(reference) is None)
+        return unknown
+
 class GetExploreV1Response(BaseModel):
     results: GetExploreV1Results = Field(None, description="Explore results")
     status: str = Field(None, description="Status of the API response")
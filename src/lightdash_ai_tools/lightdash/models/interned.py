@@ -0,0 +1,44 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+String type of low-cardinality fields repeated across many models.
+
+Table names, field types and roles repeat thousands of times in an explore
+or a member listing. When a JSON body is validated, pydantic-core already
+reuses a single string object for every occurrence of a short string. A
+decoded document holds one string object per occurrence, though, so
+`InternedStr` interns the strings validated from Python objects. It keeps
+JSON validation free of Python calls.
+"""
+
+import sys
+from typing import Annotated, Any
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+class _Interned:
+    """Marker interning the strings validated from Python objects"""
+
+    def __get_pydantic_core_schema__(self, source_type: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        schema = handler(source_type)
+        return core_schema.json_or_python_schema(
+            json_schema=schema,
+            python_schema=core_schema.no_info_after_validator_function(sys.intern, schema),
+        )
+
+
+InternedStr = Annotated[str, _Interned()]
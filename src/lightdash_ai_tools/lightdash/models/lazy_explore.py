@@ -0,0 +1,160 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
+
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Results,
+    JoinedTable,
+    Metric,
+    TableDetails,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class LazyModelMap(Mapping[str, ModelT], Generic[ModelT]):
+    """
+    Read-only mapping of raw documents validated into models on first access.
+
+    Keys, length and membership come from the raw documents, so they cost
+    nothing. Every value is validated once and then reused.
+    """
+
+    def __init__(self, model: Type[ModelT], raw: Optional[Dict[str, Any]]):
+        """
+        Initialize the mapping.
+
+        Args:
+            model: Model the documents are validated into
+            raw: Raw documents keyed by ID
+        """
+        self._model = model
+        self._raw: Dict[str, Any] = raw or {}
+        self._validated: Dict[str, ModelT] = {}
+
+    def __getitem__(self, key: str) -> ModelT:
+        value = self._validated.get(key)
+        if value is None:
+            try:
+                value = self._model.model_validate(self._raw[key])
+            except ValidationError as validation_error:
+                raise ValueError(f"Invalid {self._model.__name__} {key!r} in Lightdash API response: {validation_error.errors()}") from validation_error
+            self._validated[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def raw(self, key: str) -> Dict[str, Any]:
+        """Raw document of a key, without validating it."""
+        return self._raw[key]
+
+    @property
+    def validated_count(self) -> int:
+        """Number of documents validated so far."""
+        return len(self._validated)
+
+
+class LazyExplore(BaseModel):
+    """
+    Explore whose tables, dimensions, metrics and joined tables are validated on first access.
+
+    The scalar attributes of the explore are validated when the response is
+    parsed. The heavy sub-documents are kept raw, so listing the field IDs
+    of an explore doesn't validate a single field.
+    """
+    model_config = ConfigDict(extra='allow')
+
+    type: Optional[str] = Field(None, description="Type of explore")
+    name: Optional[str] = Field(None, description="Explore name")
+    label: Optional[str] = Field(None, description="Display label")
+    groupLabel: Optional[str] = Field(None, description="Group label")
+    baseTable: Optional[str] = Field(None, description="Base table name")
+    tags: Optional[List[str]] = Field(None, description="List of tags")
+    description: Optional[str] = Field(None, description="Explore description")
+    databaseName: Optional[str] = Field(None, description="Database name")
+    schemaName: Optional[str] = Field(None, description="Schema name")
+    targetDatabase: Optional[str] = Field(None, description="Target database")
+    warehouse: Optional[str] = Field(None, description="Warehouse name")
+    raw_tables: Optional[Dict[str, Any]] = Field(None, alias="tables", description="Raw tables keyed by table name")
+    raw_dimensions: Optional[Dict[str, Any]] = Field(None, alias="dimensions", description="Raw dimensions keyed by field ID")
+    raw_metrics: Optional[Dict[str, Any]] = Field(None, alias="metrics", description="Raw metrics keyed by field ID")
+    raw_joined_tables: Optional[List[Any]] = Field(None, alias="joinedTables", description="Raw joined tables")
+
+    _tables: Optional[LazyModelMap[TableDetails]] = PrivateAttr(default=None)
+    _dimensions: Optional[LazyModelMap[Dimension]] = PrivateAttr(default=None)
+    _metrics: Optional[LazyModelMap[Metric]] = PrivateAttr(default=None)
+    _joined_tables: Optional[List[JoinedTable]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Wrap the raw sub-documents into lazily validated mappings."""
+        self._tables = LazyModelMap(TableDetails, self.raw_tables)
+        self._dimensions = LazyModelMap(Dimension, self.raw_dimensions)
+        self._metrics = LazyModelMap(Metric, self.raw_metrics)
+
+    @property
+    def tables(self) -> LazyModelMap[TableDetails]:
+        """Tables of the explore keyed by table name."""
+        return self._tables
+
+    @property
+    def dimensions(self) -> LazyModelMap[Dimension]:
+        """Dimensions of the explore keyed by field ID."""
+        return self._dimensions
+
+    @property
+    def metrics(self) -> LazyModelMap[Metric]:
+        """Metrics of the explore keyed by field ID."""
+        return self._metrics
+
+    @property
+    def joinedTables(self) -> List[JoinedTable]:
+        """Joined tables of the explore, validated together on first access."""
+        if self._joined_tables is None:
+            self._joined_tables = [JoinedTable.model_validate(table) for table in self.raw_joined_tables or []]
+        return self._joined_tables
+
+    def field_ids(self) -> List[str]:
+        """IDs of the dimensions and metrics of the explore, without validating them."""
+        return [*self.dimensions, *self.metrics]
+
+    def to_results(self) -> GetExploreV1Results:
+        """Fully validate the explore."""
+        return GetExploreV1Results.model_validate(self.model_dump(by_alias=True, exclude_unset=True))
+
+
+class LazyExploreResponse(BaseModel):
+    """Response of the get explore API with a lazily validated explore."""
+    results: LazyExplore = Field(None, description="Explore results")
+    status: str = Field(None, description="Status of the API response")
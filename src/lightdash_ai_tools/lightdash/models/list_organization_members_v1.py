@@ -16,6 +16,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, SecretStr
 
+from lightdash_ai_tools.lightdash.models.interned import InternedStr
+
 
 class OrganizationMemberModel(BaseModel):
     """Response model for an organization member."""
@@ -27,8 +29,8 @@ class OrganizationMemberModel(BaseModel):
     userUpdatedAt: str = Field(..., description="Timestamp when the user was last updated")
     firstName: str = Field(..., description="User's first name")
     lastName: str = Field(..., description="User's last name")
-    organizationUuid: str = Field(..., description="Unique identifier for the organization")
-    role: str = Field(..., description="User's role in the organization")
+    organizationUuid: InternedStr = Field(..., description="Unique identifier for the organization")
+    role: InternedStr = Field(..., description="User's role in the organization")
     isActive: bool = Field(default=True, description="Whether the user is active")
     isPending: Optional[bool] = Field(default=True, description="Whether the user's invitation is pending")
     isInviteExpired: Optional[bool] = Field(default=True, description="Whether the user's invitation has expired")
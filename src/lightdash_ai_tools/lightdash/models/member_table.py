@@ -0,0 +1,224 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar table of organization members.
+
+Answering "how many active admins" with models loops over every member in
+Python. The table stores the members column by column instead. Strings that
+members repeat, such as roles, are dictionary encoded into arrays of codes.
+Every distinct value and every flag has a bitmap with one bit per member,
+held in a Python integer. A filter is a few bitwise operations on those
+integers and a count is a popcount.
+"""
+
+from array import array
+from itertools import compress
+from typing import Collection, Dict, Iterable, List, Optional, Union
+
+from lightdash_ai_tools.lightdash.models.compact import CompactMember
+from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
+    OrganizationMemberModel,
+)
+
+Member = Union[OrganizationMemberModel, CompactMember]
+ValueFilter = Optional[Union[str, Collection[str]]]
+
+# Turns the '0' and '1' characters of a binary string into selectors of itertools.compress.
+_SELECTORS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _bitmap(flags: bytes) -> int:
+    """Bitmap of a string of '0' and '1' characters, the first character setting the lowest bit."""
+    return int(flags[::-1], 2) if flags else 0
+
+
+def _flag(value: Optional[bool]) -> int:
+    return 0x31 if value else 0x30
+
+
+class DictionaryColumn:
+    """String column stored as codes into a dictionary of its distinct values"""
+
+    def __init__(self, values: Iterable[str]):
+        """
+        Initialize the column.
+
+        Args:
+            values: Value of every row
+        """
+        index: Dict[str, int] = {}
+        codes = [index.setdefault(value, len(index)) for value in values]
+        self.dictionary: List[str] = list(index)
+        self.codes = array("B" if len(self.dictionary) <= 256 else "I", codes)
+        self._bitmaps = {value: self._build_bitmap(code) for code, value in enumerate(self.dictionary)}
+
+    def _build_bitmap(self, code: int) -> int:
+        if self.codes.itemsize == 1:
+            table = bytearray(b"0" * 256)
+            table[code] = ord("1")
+            return _bitmap(self.codes.tobytes().translate(table))
+        return _bitmap(bytes(_flag(row_code == code) for row_code in self.codes))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str:
+        return self.dictionary[self.codes[row]]
+
+    def bitmap(self, values: Union[str, Collection[str]]) -> int:
+        """
+        Bitmap of the rows holding one of the values.
+
+        Args:
+            values: Value or values to match
+
+        Returns:
+            Bitmap with the bits of the matching rows set
+        """
+        if isinstance(values, str):
+            values = (values,)
+        result = 0
+        for value in values:
+            result |= self._bitmaps.get(value, 0)
+        return result
+
+
+class MemberTable:
+    """Columnar table of organization members answering filter and count queries with bitmaps"""
+
+    def __init__(self, members: Iterable[Member]):
+        """
+        Initialize the table.
+
+        Args:
+            members: Member models or compact records
+        """
+        members = list(members)
+        self.user_uuids: List[str] = [member.userUuid for member in members]
+        self.roles = DictionaryColumn(member.role for member in members)
+        self.organization_uuids = DictionaryColumn(member.organizationUuid for member in members)
+        self._active = _bitmap(bytes(_flag(member.isActive) for member in members))
+        self._pending = _bitmap(bytes(_flag(member.isPending) for member in members))
+        self._all = (1 << len(members)) - 1
+
+    def __len__(self) -> int:
+        return len(self.user_uuids)
+
+    def where(
+        self,
+        role: ValueFilter = None,
+        organization_uuid: ValueFilter = None,
+        is_active: Optional[bool] = None,
+        is_pending: Optional[bool] = None,
+    ) -> int:
+        """
+        Bitmap of the members matching every given condition.
+
+        Args:
+            role: Role or roles to match, None to match any
+            organization_uuid: Organization UUID or UUIDs to match, None to match any
+            is_active: Whether members must be active, None to match both
+            is_pending: Whether members must be pending, None to match both
+
+        Returns:
+            Bitmap with the bits of the matching members set
+        """
+        mask = self._all
+        if role is not None:
+            mask &= self.roles.bitmap(role)
+        if organization_uuid is not None:
+            mask &= self.organization_uuids.bitmap(organization_uuid)
+        if is_active is not None:
+            mask &= self._active if is_active else ~self._active
+        if is_pending is not None:
+            mask &= self._pending if is_pending else ~self._pending
+        return mask & self._all
+
+    def count(
+        self,
+        role: ValueFilter = None,
+        organization_uuid: ValueFilter = None,
+        is_active: Optional[bool] = None,
+        is_pending: Optional[bool] = None,
+    ) -> int:
+        """
+        Count the members matching every given condition.
+
+        Args:
+            role: Role or roles to match, None to match any
+            organization_uuid: Organization UUID or UUIDs to match, None to match any
+            is_active: Whether members must be active, None to match both
+            is_pending: Whether members must be pending, None to match both
+
+        Returns:
+            Number of matching members
+        """
+        return self.where(role, organization_uuid, is_active, is_pending).bit_count()
+
+    def filter(
+        self,
+        role: ValueFilter = None,
+        organization_uuid: ValueFilter = None,
+        is_active: Optional[bool] = None,
+        is_pending: Optional[bool] = None,
+    ) -> List[str]:
+        """
+        User UUIDs of the members matching every given condition, in table order.
+
+        Args:
+            role: Role or roles to match, None to match any
+            organization_uuid: Organization UUID or UUIDs to match, None to match any
+            is_active: Whether members must be active, None to match both
+            is_pending: Whether members must be pending, None to match both
+
+        Returns:
+            User UUIDs of the matching members
+        """
+        return self.select(self.where(role, organization_uuid, is_active, is_pending))
+
+    def select(self, mask: int) -> List[str]:
+        """
+        User UUIDs of the members whose bits are set in a bitmap.
+
+        Args:
+            mask: Bitmap returned by `where`, possibly combined with others
+
+        Returns:
+            User UUIDs of the selected members, in table order
+        """
+        if not mask:
+            return []
+        selectors = format(mask, f"0{len(self)}b").encode()[::-1].translate(_SELECTORS)
+        return list(compress(self.user_uuids, selectors))
+
+    def count_by_role(
+        self,
+        organization_uuid: ValueFilter = None,
+        is_active: Optional[bool] = None,
+        is_pending: Optional[bool] = None,
+    ) -> Dict[str, int]:
+        """
+        Count the members matching every given condition, per role.
+
+        Args:
+            organization_uuid: Organization UUID or UUIDs to match, None to match any
+            is_active: Whether members must be active, None to match both
+            is_pending: Whether members must be pending, None to match both
+
+        Returns:
+            Number of matching members keyed by role
+        """
+        mask = self.where(None, organization_uuid, is_active, is_pending)
+        return {role: (mask & self.roles.bitmap(role)).bit_count() for role in self.roles.dictionary}
@@ -0,0 +1,108 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Results,
+    JoinedTable,
+    Metric,
+)
+from lightdash_ai_tools.lightdash.models.get_explores_v1 import GetExploresV1Results
+
+
+class ProjectCatalog(BaseModel):
+    """In-memory snapshot of every explore in a Lightdash project"""
+
+    project_uuid: str = Field(..., description="UUID of the project the snapshot was taken from")
+    explores: List[GetExploresV1Results] = Field(default_factory=list, description="Summaries of all explores in the project")
+    explore_details: Dict[str, GetExploreV1Results] = Field(default_factory=dict, description="Full explores keyed by explore name")
+
+    _summaries_by_name: Dict[str, GetExploresV1Results] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index the explore summaries by name."""
+        self._summaries_by_name = {explore.name: explore for explore in self.explores}
+
+    def list_explores(self) -> List[GetExploresV1Results]:
+        """List the summaries of all explores in the project."""
+        return list(self.explores)
+
+    def get_explore_summary(self, explore_name: str) -> Optional[GetExploresV1Results]:
+        """Get the summary of an explore, or None if the explore is unknown."""
+        return self._summaries_by_name.get(explore_name)
+
+    def get_explore(self, explore_name: str) -> Optional[GetExploreV1Results]:
+        """Get the full explore, or None if the explore is unknown."""
+        return self.explore_details.get(explore_name)
+
+    def get_dimensions(self, explore_name: str) -> Dict[str, Dimension]:
+        """Get the dimensions of an explore keyed by field ID."""
+        explore = self.get_explore(explore_name)
+        if explore is None or explore.dimensions is None:
+            return {}
+        return explore.dimensions
+
+    def get_metrics(self, explore_name: str) -> Dict[str, Metric]:
+        """Get the metrics of an explore keyed by field ID."""
+        explore = self.get_explore(explore_name)
+        if explore is None or explore.metrics is None:
+            return {}
+        return explore.metrics
+
+    def get_joined_tables(self, explore_name: str) -> List[JoinedTable]:
+        """Get the joined tables of an explore."""
+        explore = self.get_explore(explore_name)
+        if explore is None or explore.joinedTables is None:
+            return []
+        return explore.joinedTables
+
+    def get_field(self, explore_name: str, reference: str) -> Optional[Union[Dimension, Metric]]:
+        """
+        Get a dimension or a metric of an explore by its reference.
+
+        Args:
+            explore_name: Name of the explore
+            reference: Field reference, e.g. `orders_order_id`
+
+        Returns:
+            The matching dimension or metric, or None if it doesn't exist.
+        """
+        explore = self.get_explore(explore_name)
+        if explore is None:
+            return None
+        return explore.get_field(reference)
+
+    def search_fields(self, query: str) -> Dict[str, List[Union[Dimension, Metric]]]:
+        """
+        Search dimensions and metrics across all explores.
+
+        Args:
+            query: Case-insensitive substring matched against field names, labels and descriptions
+
+        Returns:
+            Matching fields keyed by explore name.
+        """
+        needle = query.lower()
+        matches: Dict[str, List[Union[Dimension, Metric]]] = {}
+        for explore_name in self.explore_details:
+            for fields in (self.get_dimensions(explore_name), self.get_metrics(explore_name)):
+                for field in fields.values():
+                    haystack = (field.name, field.label, field.description)
+                    if any(value and needle in value.lower() for value in haystack):
+                        matches.setdefault(explore_name, []).append(field)
+        return matches
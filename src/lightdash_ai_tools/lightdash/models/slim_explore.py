@@ -0,0 +1,146 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Explore models that drop heavy sub-documents while parsing.
+
+The slim models of a parse profile subclass the explore models, so they can
+be used wherever an explore is expected. Fields dropped by the profile are
+discarded as soon as they are parsed and stay None. Keys that aren't model
+fields are ignored instead of being kept as extra fields.
+"""
+
+import functools
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, Field, PlainValidator, create_model
+
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Response,
+    GetExploreV1Results,
+    JoinedTable,
+    Metric,
+    SourceDetails,
+    TableDetails,
+)
+
+
+class ExploreParseProfile(BaseModel):
+    """Fields dropped from every level of an explore while parsing it"""
+    model_config = ConfigDict(frozen=True)
+
+    explore_keys: FrozenSet[str] = Field(default=frozenset({"lineageGraph", "compiledSql"}), description="Fields dropped from the explore")
+    table_keys: FrozenSet[str] = Field(default=frozenset(), description="Fields dropped from every table")
+    source_keys: FrozenSet[str] = Field(default=frozenset({"content"}), description="Fields dropped from the source of every table")
+    field_keys: FrozenSet[str] = Field(default=frozenset({"compiledSql"}), description="Fields dropped from every dimension and metric")
+    joined_table_keys: FrozenSet[str] = Field(default=frozenset({"compiledSqlOn"}), description="Fields dropped from every joined table")
+
+
+# Keeps what the tools read: labels, descriptions, types and uncompiled SQL of every field.
+SLIM_EXPLORE_PROFILE = ExploreParseProfile()
+
+
+def _drop(value: Any) -> None:
+    return None
+
+
+# Type of a dropped field: whatever the response holds, None is kept.
+_DroppedField = Annotated[Optional[Any], PlainValidator(_drop)]
+
+
+class _SlimSourceDetails(SourceDetails):
+    model_config = ConfigDict(extra='ignore')
+
+
+class _SlimTableDetails(TableDetails):
+    model_config = ConfigDict(extra='ignore')
+
+
+class _SlimJoinedTable(JoinedTable):
+    model_config = ConfigDict(extra='ignore')
+
+
+class _SlimDimension(Dimension):
+    model_config = ConfigDict(extra='ignore')
+
+
+class _SlimMetric(Metric):
+    model_config = ConfigDict(extra='ignore')
+
+
+class _SlimExploreResults(GetExploreV1Results):
+    model_config = ConfigDict(extra='ignore')
+
+
+def _slim_model(
+    base: Type[BaseModel],
+    parent: Type[BaseModel],
+    dropped_keys: FrozenSet[str],
+    **nested: Any,
+) -> Type[BaseModel]:
+    """
+    Build the slim model of a profile.
+
+    Args:
+        base: Slim base class ignoring unknown keys
+        parent: Explore model the slim model stands for
+        dropped_keys: Fields dropped while parsing
+        nested: Annotations of the fields holding nested slim models, keyed by field name
+
+    Returns:
+        Subclass of `base` named after `parent`
+    """
+    fields: Dict[str, Tuple[Any, Any]] = {
+        name: (annotation, Field(None, description=parent.model_fields[name].description))
+        for name, annotation in nested.items()
+    }
+    for name in dropped_keys & set(parent.model_fields):
+        fields[name] = (_DroppedField, Field(None, exclude=True, description=parent.model_fields[name].description))
+    return create_model(parent.__name__, __base__=base, __module__=__name__, **fields)
+
+
+@functools.lru_cache(maxsize=None)
+def slim_explore_response_model(profile: ExploreParseProfile = SLIM_EXPLORE_PROFILE) -> Type[GetExploreV1Response]:
+    """
+    Response model of the get explore API parsing the explore with a profile.
+
+    Models are built once per profile.
+
+    Args:
+        profile: Fields dropped while parsing
+
+    Returns:
+        Subclass of GetExploreV1Response
+    """
+    source = _slim_model(_SlimSourceDetails, SourceDetails, profile.source_keys)
+    table = _slim_model(_SlimTableDetails, TableDetails, profile.table_keys, source=Optional[source])
+    joined_table = _slim_model(_SlimJoinedTable, JoinedTable, profile.joined_table_keys)
+    dimension = _slim_model(_SlimDimension, Dimension, profile.field_keys)
+    metric = _slim_model(_SlimMetric, Metric, profile.field_keys)
+    explore = _slim_model(
+        _SlimExploreResults,
+        GetExploreV1Results,
+        profile.explore_keys,
+        tables=Optional[Dict[str, table]],
+        joinedTables=Optional[List[joined_table]],
+        dimensions=Optional[Dict[str, dimension]],
+        metrics=Optional[Dict[str, metric]],
+    )
+    return create_model(
+        GetExploreV1Response.__name__,
+        __base__=GetExploreV1Response,
+        __module__=__name__,
+        results=(explore, Field(None, description="Explore results")),
+    )
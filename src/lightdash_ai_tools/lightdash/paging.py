@@ -0,0 +1,117 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+DEFAULT_PAGE_SIZE = 100
+
+
+class AdaptivePageSizer:
+    """
+    Chooses the page size of paginated Lightdash endpoints.
+
+    Every fetched page is measured. When a page comes back well under the
+    target latency and payload size, the next page is twice as large; when it
+    takes too long or is too heavy, the next page is half as large. Sizes stay
+    within `[min_page_size, max_page_size]` and are remembered per endpoint,
+    so later listings start from the size that worked last time.
+    """
+
+    def __init__(
+        self,
+        initial_page_size: int = DEFAULT_PAGE_SIZE,
+        min_page_size: int = 25,
+        max_page_size: int = 1000,
+        target_latency: float = 1.0,
+        max_page_bytes: Optional[int] = 8 * 1024 * 1024,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Initialize the page sizer.
+
+        Args:
+            initial_page_size: Page size of endpoints that haven't been measured yet
+            min_page_size: Smallest page size to use
+            max_page_size: Largest page size to use
+            target_latency: Seconds a single page request should take
+            max_page_bytes: Length of the JSON body of a single page not to exceed, None for no limit
+            clock: Clock used to time requests, in seconds
+        """
+        if min_page_size < 1:
+            raise ValueError("min_page_size must be a positive integer")
+        if max_page_size < min_page_size:
+            raise ValueError("max_page_size must not be smaller than min_page_size")
+        if target_latency <= 0:
+            raise ValueError("target_latency must be positive")
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.initial_page_size = self._clamp(initial_page_size)
+        self.target_latency = target_latency
+        self.max_page_bytes = max_page_bytes
+        self.clock = clock
+        self._page_sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _clamp(self, page_size: int) -> int:
+        return max(self.min_page_size, min(self.max_page_size, page_size))
+
+    def page_size_for(self, endpoint: str) -> int:
+        """Page size to use for the next request to an endpoint."""
+        with self._lock:
+            return self._page_sizes.get(endpoint, self.initial_page_size)
+
+    def page_sizes(self) -> Dict[str, int]:
+        """Remembered page size of every measured endpoint."""
+        with self._lock:
+            return dict(self._page_sizes)
+
+    def record(
+        self,
+        endpoint: str,
+        page_size: int,
+        num_items: int,
+        elapsed: float,
+        num_bytes: Optional[int],
+    ) -> int:
+        """
+        Record the measurements of a fetched page.
+
+        Args:
+            endpoint: Name of the API endpoint
+            page_size: Page size the page was requested with
+            num_items: Number of items on the page
+            elapsed: Seconds the request took
+            num_bytes: Length of the JSON body of the page, None if unknown
+
+        Returns:
+            Page size to request next.
+        """
+        weighed = self.max_page_bytes is not None and num_bytes is not None
+        too_heavy = weighed and num_bytes > self.max_page_bytes
+        if elapsed > self.target_latency or too_heavy:
+            next_page_size = self._clamp(page_size // 2)
+        elif (
+            # A partial page is the last one, so it says nothing about larger pages.
+            num_items >= page_size
+            and elapsed * 2 <= self.target_latency
+            and (not weighed or num_bytes * 2 <= self.max_page_bytes)
+        ):
+            next_page_size = self._clamp(page_size * 2)
+        else:
+            next_page_size = self._clamp(page_size)
+        with self._lock:
+            self._page_sizes[endpoint] = next_page_size
+        return next_page_size
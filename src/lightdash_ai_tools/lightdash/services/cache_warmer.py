@@ -0,0 +1,164 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List, Optional
+
+from pydantic import BaseModel, Field, computed_field
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import GetExploreV1
+from lightdash_ai_tools.lightdash.api.get_explores_v1 import GetExploresV1
+from lightdash_ai_tools.lightdash.api.get_project_access_list_v1 import (
+    GetProjectAccessListV1,
+)
+from lightdash_ai_tools.lightdash.api.get_project_v1 import GetProjectV1
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.services.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1Service,
+)
+from lightdash_ai_tools.lightdash.services.list_organization_members_v1 import (
+    ListOrganizationMembersV1Service,
+)
+from lightdash_ai_tools.lightdash.services.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1Service,
+)
+
+
+class CacheWarmingProgress(BaseModel):
+    """Progress of a cache warming run"""
+
+    completed: int = Field(..., description="Number of finished fetches, including failed ones")
+    failed: int = Field(..., description="Number of failed fetches")
+    scheduled: int = Field(..., description="Number of fetches scheduled so far")
+    resource: str = Field(..., description="Resource of the fetch that just finished")
+    error: Optional[str] = Field(default=None, description="Error of the fetch that just finished, if it failed")
+
+
+class CacheWarmingSummary(BaseModel):
+    """Summary of a cache warming run"""
+
+    projects: int = Field(..., description="Number of warmed projects")
+    fetched: int = Field(..., description="Number of successful fetches")
+    failed: int = Field(..., description="Number of failed fetches")
+    elapsed_seconds: float = Field(..., description="Wall-clock duration of the run")
+
+    @computed_field(description="Successful fetches per second")
+    def fetches_per_second(self) -> float:
+        """Successful fetches per second"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.fetched / self.elapsed_seconds
+
+
+class CacheWarmer:
+    """
+    Pre-populates the cache of a Lightdash client.
+
+    Projects, explores, project access lists, organization members and groups
+    are fetched concurrently through the regular API callers, so every
+    response lands in `lightdash_client.cache`.
+    """
+
+    def __init__(
+        self,
+        lightdash_client: LightdashClient,
+        max_concurrency: int = 8,
+        on_progress: Optional[Callable[[CacheWarmingProgress], None]] = None,
+    ):
+        """
+        Initialize the warmer.
+
+        Args:
+            lightdash_client: Lightdash client whose cache is warmed
+            max_concurrency: Maximum number of fetches in flight
+            on_progress: Callback invoked after every fetch
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        self.lightdash_client = lightdash_client
+        self.max_concurrency = max_concurrency
+        self.on_progress = on_progress
+
+    async def awarm(self, project_uuids: Optional[List[str]] = None) -> CacheWarmingSummary:
+        """
+        Warm the cache.
+
+        Failed fetches are reported and counted, but don't stop the run.
+
+        Args:
+            project_uuids: Projects to warm, all projects of the organization if omitted
+
+        Returns:
+            Summary of the run
+        """
+        started_at = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        counters = {"scheduled": 0, "completed": 0, "failed": 0}
+
+        async def fetch(resource: str, request: Callable[[], Awaitable[Any]]) -> Any:
+            counters["scheduled"] += 1
+            error: Optional[str] = None
+            result = None
+            async with semaphore:
+                try:
+                    result = await request()
+                except Exception as e:  # A single failure must not abort the run
+                    error = f"{type(e).__name__}: {e}"
+            counters["completed"] += 1
+            if error is not None:
+                counters["failed"] += 1
+            if self.on_progress is not None:
+                self.on_progress(CacheWarmingProgress(
+                    completed=counters["completed"],
+                    failed=counters["failed"],
+                    scheduled=counters["scheduled"],
+                    resource=resource,
+                    error=error,
+                ))
+            return result
+
+        client = self.lightdash_client
+        if project_uuids is None:
+            projects = await fetch("projects", lambda: ListOrganizationProjectsV1Service(lightdash_client=client).aget_all_projects())
+            project_uuids = [project.projectUuid for project in projects] if projects is not None else []
+
+        async def warm_project(project_uuid: str) -> None:
+            explores_response, *_ = await asyncio.gather(
+                fetch(f"projects/{project_uuid}/explores", lambda: GetExploresV1(lightdash_client=client).acall(project_uuid)),
+                fetch(f"projects/{project_uuid}", lambda: GetProjectV1(lightdash_client=client).acall(project_uuid)),
+                fetch(f"projects/{project_uuid}/access", lambda: GetProjectAccessListV1(lightdash_client=client).acall(project_uuid)),
+            )
+            if explores_response is None:
+                return
+            api_call = GetExploreV1(lightdash_client=client)
+            await asyncio.gather(*(
+                fetch(
+                    f"projects/{project_uuid}/explores/{explore.name}",
+                    lambda explore_name=explore.name: api_call.acall(project_uuid, explore_name),
+                )
+                for explore in explores_response.results
+            ))
+
+        await asyncio.gather(
+            fetch("members", lambda: ListOrganizationMembersV1Service(lightdash_client=client).aget_all_members()),
+            fetch("groups", lambda: ListGroupsInOrganizationV1Service(lightdash_client=client).get_all_groups_async()),
+            *(warm_project(project_uuid) for project_uuid in project_uuids),
+        )
+        return CacheWarmingSummary(
+            projects=len(project_uuids),
+            fetched=counters["completed"] - counters["failed"],
+            failed=counters["failed"],
+            elapsed_seconds=time.perf_counter() - started_at,
+        )
@@ -0,0 +1,178 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import AsyncIterator, Iterator, List, Optional
+
+from lightdash_ai_tools.lightdash.api.get_group_v1 import GetGroupV1
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.get_group_v1 import GroupMember
+from lightdash_ai_tools.lightdash.services.pagination import (
+    DEFAULT_MAX_CONCURRENCY,
+    AsyncPageFetcher,
+    PageFetcher,
+    afetch_pages_speculatively,
+    ainfer_page_count,
+    aiter_items,
+    aiter_pages,
+    atake,
+    fetch_pages_speculatively,
+    infer_page_count,
+    iter_items,
+    iter_pages,
+    limit_page_size,
+    resolve_page_size,
+    take,
+)
+
+ENDPOINT = GetGroupV1.__name__
+
+
+def _member_key(member: GroupMember) -> str:
+    return member.userUuid
+
+
+class GetGroupMembersV1Service:
+    """
+    Service for listing every member of a group.
+
+    The group endpoint returns `include_members` members starting at
+    `offset`, without telling how many members there are. Pages of members
+    are requested at growing offsets, concurrently in windows or one after
+    another when streaming, until a page isn't full.
+    """
+
+    def __init__(self, lightdash_client: LightdashClient):
+        """
+        Initialize the service.
+
+        Args:
+            lightdash_client: Lightdash client for making API calls
+        """
+        self.lightdash_client = lightdash_client
+
+    def get_all_members(
+        self,
+        group_uuid: str,
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_results: Optional[int] = None,
+    ) -> List[GroupMember]:
+        """
+        Get all members of a group.
+
+        Args:
+            group_uuid: UUID of the group
+            page_size: Number of members per request, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+            max_results: Maximum number of members to return, None for all. Pages
+                are then fetched one after another and no further than needed.
+
+        Returns:
+            Members of the group
+        """
+        if max_results is not None:
+            limited_page_size = limit_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT, max_results)
+            return take(self.iter_members(group_uuid, page_size=limited_page_size), max_results)
+        return fetch_pages_speculatively(self._page_fetcher(group_uuid, page_size), max_concurrency=max_concurrency)
+
+    async def aget_all_members(
+        self,
+        group_uuid: str,
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_results: Optional[int] = None,
+    ) -> List[GroupMember]:
+        """
+        Asynchronously get all members of a group.
+
+        Args:
+            group_uuid: UUID of the group
+            page_size: Number of members per request, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+            max_results: Maximum number of members to return, None for all. Pages
+                are then fetched one after another and no further than needed.
+
+        Returns:
+            Members of the group
+        """
+        if max_results is not None:
+            limited_page_size = limit_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT, max_results)
+            return await atake(self.aiter_members(group_uuid, page_size=limited_page_size), max_results)
+        return await afetch_pages_speculatively(self._apage_fetcher(group_uuid, page_size), max_concurrency=max_concurrency)
+
+    def iter_members(
+        self,
+        group_uuid: str,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[GroupMember]:
+        """
+        Iterate over the members of a group as pages arrive.
+
+        Args:
+            group_uuid: UUID of the group
+            page_size: Number of members per request, None to let the client choose
+            prefetch: Whether to fetch the next page while the current one is consumed
+
+        Yields:
+            Members of the group
+        """
+        return iter_items(iter_pages(self._page_fetcher(group_uuid, page_size), prefetch=prefetch))
+
+    def aiter_members(
+        self,
+        group_uuid: str,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[GroupMember]:
+        """
+        Asynchronously iterate over the members of a group as pages arrive.
+
+        Args:
+            group_uuid: UUID of the group
+            page_size: Number of members per request, None to let the client choose
+            prefetch: Whether to fetch the next page while the current one is consumed
+
+        Yields:
+            Members of the group
+        """
+        return aiter_items(aiter_pages(self._apage_fetcher(group_uuid, page_size), prefetch=prefetch))
+
+    def _page_fetcher(self, group_uuid: str, page_size: Optional[int]) -> PageFetcher[GroupMember]:
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        api_call = GetGroupV1(lightdash_client=self.lightdash_client)
+
+        def fetch_items(page: int) -> List[GroupMember]:
+            response = api_call.call(
+                group_uuid=group_uuid,
+                include_members=fixed_page_size,
+                offset=(page - 1) * fixed_page_size,
+            )
+            return response.results.members or []
+
+        return infer_page_count(fetch_items, fixed_page_size, key=_member_key)
+
+    def _apage_fetcher(self, group_uuid: str, page_size: Optional[int]) -> AsyncPageFetcher[GroupMember]:
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        api_call = GetGroupV1(lightdash_client=self.lightdash_client)
+
+        async def fetch_items(page: int) -> List[GroupMember]:
+            response = await api_call.acall(
+                group_uuid=group_uuid,
+                include_members=fixed_page_size,
+                offset=(page - 1) * fixed_page_size,
+            )
+            return response.results.members or []
+
+        return ainfer_page_count(fetch_items, fixed_page_size, key=_member_key)
@@ -12,13 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 
 from lightdash_ai_tools.lightdash.api.list_groups_in_organization_v1 import (
     ListGroupsInOrganizationV1,
 )
 from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.compact import CompactGroup, compact_groups
 from lightdash_ai_tools.lightdash.models.list_groups_in_organization_v1 import Group
+from lightdash_ai_tools.lightdash.services.pagination import (
+    DEFAULT_MAX_CONCURRENCY,
+    afetch_all_pages,
+    aiter_items,
+    apaginate,
+    atake,
+    fetch_all_pages,
+    iter_items,
+    limit_page_size,
+    paginate,
+    resolve_page_size,
+    take,
+)
+
+ENDPOINT = ListGroupsInOrganizationV1.__name__
 
 
 class ListGroupsInOrganizationV1Service:
@@ -27,82 +43,232 @@ class ListGroupsInOrganizationV1Service:
 
     def get_all_groups(
         self,
-        page_size: Optional[float] = 100,
+        page_size: Optional[int] = None,
         include_members: Optional[float] = None,
         search_query: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_results: Optional[int] = None,
     ) -> List[Group]:
         """
         Retrieve all groups across all pages
 
-        :param page_size: Number of results per page
+        The first page is fetched alone to learn the total page count, then
+        the remaining pages are fetched from a thread pool sharing the
+        client's pooled connections.
+
+        :param page_size: Number of results per page, None to let the client choose
         :param include_members: Number of members to include
         :param search_query: Search query to filter groups
+        :param max_concurrency: Maximum number of pages fetched at the same time
+        :param max_results: Maximum number of groups to return, None for all. Pages
+            are then fetched one after another and no further than needed.
         :return: ListGroupsResponse or list of groups
         """
-        all_groups: List[Group] = []
-        current_page = 1
+        if max_results is not None:
+            limited_page_size = limit_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT, max_results)
+            return take(self.iter_groups(
+                page_size=limited_page_size,
+                include_members=include_members,
+                search_query=search_query
+            ), max_results)
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return fetch_all_pages(
+            lambda page: self._fetch_page(page, fixed_page_size, include_members, search_query),
+            max_concurrency=max_concurrency,
+        )
+
+    async def get_all_groups_async(
+        self,
+        page_size: Optional[int] = None,
+        include_members: Optional[float] = None,
+        search_query: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_results: Optional[int] = None,
+    ) -> List[Group]:
+        """
+        Asynchronously retrieve all groups across all pages
 
-        while True:
-            response = ListGroupsInOrganizationV1(lightdash_client=self.lightdash_client).call(
-                page=current_page,
-                page_size=page_size,
+        The first page is fetched alone to learn the total page count, then
+        the remaining pages are fetched concurrently with the same page size.
+
+        :param page_size: Number of results per page, None to let the client choose
+        :param include_members: Number of members to include
+        :param search_query: Search query to filter groups
+        :param max_concurrency: Maximum number of pages fetched at the same time
+        :param max_results: Maximum number of groups to return, None for all. Pages
+            are then fetched one after another and no further than needed.
+        :return: ListGroupsResponse or list of groups
+        """
+        if max_results is not None:
+            limited_page_size = limit_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT, max_results)
+            return await atake(self.aiter_groups(
+                page_size=limited_page_size,
                 include_members=include_members,
                 search_query=search_query
-            )
+            ), max_results)
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return await afetch_all_pages(
+            lambda page: self._afetch_page(page, fixed_page_size, include_members, search_query),
+            max_concurrency=max_concurrency,
+        )
 
-            # Extract groups from the response
-            current_groups = response.results.data
-            if not current_groups:
-                break
+    def get_all_groups_compact(
+        self,
+        page_size: Optional[int] = None,
+        search_query: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[CompactGroup]:
+        """
+        Retrieve all groups across all pages as compact records
 
-            all_groups.extend(current_groups)
+        Every page is turned into records as soon as it arrives, so only the
+        models of the pages in flight are alive at the same time.
 
-            # Check if we've retrieved all pages
-            total_pages = response.results.pagination.totalPageCount
+        :param page_size: Number of results per page, None to let the client choose
+        :param search_query: Search query to filter groups
+        :param max_concurrency: Maximum number of pages fetched at the same time
+        :return: Records of the groups
+        """
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return fetch_all_pages(
+            lambda page: self._fetch_compact_page(page, fixed_page_size, search_query),
+            max_concurrency=max_concurrency,
+        )
 
-            if current_page >= total_pages:
-                break
+    async def get_all_groups_compact_async(
+        self,
+        page_size: Optional[int] = None,
+        search_query: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[CompactGroup]:
+        """
+        Asynchronously retrieve all groups across all pages as compact records
 
-            current_page += 1
-        return all_groups
+        :param page_size: Number of results per page, None to let the client choose
+        :param search_query: Search query to filter groups
+        :param max_concurrency: Maximum number of pages fetched at the same time
+        :return: Records of the groups
+        """
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return await afetch_all_pages(
+            lambda page: self._afetch_compact_page(page, fixed_page_size, search_query),
+            max_concurrency=max_concurrency,
+        )
 
-    async def get_all_groups_async(
+    def iter_groups(
         self,
-        page_size: Optional[float] = 100,
+        page_size: Optional[int] = None,
         include_members: Optional[float] = None,
         search_query: Optional[str] = None,
-    ) -> List[Group]:
+        prefetch: bool = False,
+    ) -> Iterator[Group]:
         """
-        Asynchronously retrieve all groups across all pages
+        Iterate over the groups as pages arrive
 
-        :param page_size: Number of results per page
+        :param page_size: Number of results per page, None to let the client choose
         :param include_members: Number of members to include
         :param search_query: Search query to filter groups
-        :return: ListGroupsResponse or list of groups
+        :param prefetch: Whether to fetch the next page while the current one is consumed
+        :return: Iterator of groups
         """
-        all_groups: List[Group] = []
-        current_page = 1
+        return iter_items(paginate(
+            lambda page, size: self._fetch_measured_page(page, size, include_members, search_query),
+            ENDPOINT,
+            page_size=page_size,
+            page_sizer=self.lightdash_client.page_sizer,
+            prefetch=prefetch,
+        ))
 
-        while True:
-            response = await ListGroupsInOrganizationV1(lightdash_client=self.lightdash_client).acall(
-                page=current_page,
-                page_size=page_size,
-                include_members=include_members,
-                search_query=search_query
-            )
+    def aiter_groups(
+        self,
+        page_size: Optional[int] = None,
+        include_members: Optional[float] = None,
+        search_query: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Group]:
+        """
+        Asynchronously iterate over the groups as pages arrive
+
+        :param page_size: Number of results per page, None to let the client choose
+        :param include_members: Number of members to include
+        :param search_query: Search query to filter groups
+        :param prefetch: Whether to fetch the next page while the current one is consumed
+        :return: Async iterator of groups
+        """
+        return aiter_items(apaginate(
+            lambda page, size: self._afetch_measured_page(page, size, include_members, search_query),
+            ENDPOINT,
+            page_size=page_size,
+            page_sizer=self.lightdash_client.page_sizer,
+            prefetch=prefetch,
+        ))
+
+    def _fetch_page(
+        self,
+        page: int,
+        page_size: int,
+        include_members: Optional[float],
+        search_query: Optional[str],
+    ) -> Tuple[List[Group], int]:
+        groups, total_page_count, _, _ = self._fetch_measured_page(page, page_size, include_members, search_query)
+        return groups, total_page_count
 
-            # Extract groups from the response
-            current_groups = response.results.data
-            if not current_groups:
-                break
+    async def _afetch_page(
+        self,
+        page: int,
+        page_size: int,
+        include_members: Optional[float],
+        search_query: Optional[str],
+    ) -> Tuple[List[Group], int]:
+        groups, total_page_count, _, _ = await self._afetch_measured_page(page, page_size, include_members, search_query)
+        return groups, total_page_count
 
-            all_groups.extend(current_groups)
+    def _fetch_measured_page(
+        self,
+        page: int,
+        page_size: int,
+        include_members: Optional[float],
+        search_query: Optional[str],
+    ) -> Tuple[List[Group], int, Optional[int], bool]:
+        api_call = ListGroupsInOrganizationV1(lightdash_client=self.lightdash_client)
+        response = api_call.call(
+            page=page,
+            page_size=page_size,
+            include_members=include_members,
+            search_query=search_query
+        )
+        return response.results.data, int(response.results.pagination.totalPageCount), api_call.last_response_size, api_call.last_response_cached
 
-            # Check if we've retrieved all pages
-            total_pages = response.results.pagination.totalPageCount
+    async def _afetch_measured_page(
+        self,
+        page: int,
+        page_size: int,
+        include_members: Optional[float],
+        search_query: Optional[str],
+    ) -> Tuple[List[Group], int, Optional[int], bool]:
+        api_call = ListGroupsInOrganizationV1(lightdash_client=self.lightdash_client)
+        response = await api_call.acall(
+            page=page,
+            page_size=page_size,
+            include_members=include_members,
+            search_query=search_query
+        )
+        return response.results.data, int(response.results.pagination.totalPageCount), api_call.last_response_size, api_call.last_response_cached
 
-            if current_page >= total_pages:
-                break
+    def _fetch_compact_page(
+        self,
+        page: int,
+        page_size: int,
+        search_query: Optional[str],
+    ) -> Tuple[List[CompactGroup], int]:
+        groups, total_page_count = self._fetch_page(page, page_size, None, search_query)
+        return compact_groups(groups), total_page_count
 
-            current_page += 1
-        return all_groups
+    async def _afetch_compact_page(
+        self,
+        page: int,
+        page_size: int,
+        search_query: Optional[str],
+    ) -> Tuple[List[CompactGroup], int]:
+        groups, total_page_count = await self._afetch_page(page, page_size, None, search_query)
+        return compact_groups(groups), total_page_count
@@ -12,16 +12,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 
 from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
     ListOrganizationMembersV1,
 )
 from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.compact import (
+    CompactMember,
+    compact_members,
+)
 from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
     ListOrganizationMembersV1Response,
     OrganizationMemberModel,
 )
+from lightdash_ai_tools.lightdash.models.member_table import MemberTable
+from lightdash_ai_tools.lightdash.services.pagination import (
+    DEFAULT_MAX_CONCURRENCY,
+    afetch_all_pages,
+    aiter_items,
+    apaginate,
+    atake,
+    fetch_all_pages,
+    iter_items,
+    limit_page_size,
+    paginate,
+    resolve_page_size,
+    take,
+)
+
+ENDPOINT = ListOrganizationMembersV1.__name__
 
 
 class ListOrganizationMembersV1Service:
@@ -38,74 +58,220 @@ class ListOrganizationMembersV1Service:
 
     def get_all_members(
         self,
-        page_size: int = 100
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_results: Optional[int] = None,
     ) -> List[OrganizationMemberModel]:
         """
         Get all members of the organization.
 
+        The first page is fetched alone to learn the total page count, then
+        the remaining pages are fetched from a thread pool sharing the
+        client's pooled connections.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+            max_results: Maximum number of members to return, None for all. Pages
+                are then fetched one after another and no further than needed.
+
         Returns:
             List of organization members
         """
-        all_members: List[OrganizationMemberModel] = []
-        current_page = 1
-        api_call = ListOrganizationMembersV1(lightdash_client=self.lightdash_client)
+        if max_results is not None:
+            limited_page_size = limit_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT, max_results)
+            return take(self.iter_members(page_size=limited_page_size), max_results)
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return fetch_all_pages(
+            lambda page: self._fetch_page(page, fixed_page_size),
+            max_concurrency=max_concurrency,
+        )
 
-        while True:
-            response: ListOrganizationMembersV1Response = api_call.call(
-                page=current_page,
-                page_size=page_size,
-            )
+    async def aget_all_members(
+        self,
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_results: Optional[int] = None,
+    ) -> List[OrganizationMemberModel]:
+        """
+        Asynchronously get all members of the organization.
 
-            # Extract members from the response
-            current_members = response.results.data
-            if not current_members:
-                break
+        The first page is fetched alone to learn the total page count, then
+        the remaining pages are fetched concurrently. Concurrent requests skew
+        latencies, so pages aren't resized on the way; an unset page size
+        uses the size the client's page sizer remembers for the endpoint.
 
-            all_members.extend(current_members)
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+            max_results: Maximum number of members to return, None for all. Pages
+                are then fetched one after another and no further than needed.
 
-            # Check if we've retrieved all pages
-            total_pages = response.results.pagination.totalPageCount
+        Returns:
+            List of organization members
+        """
+        if max_results is not None:
+            limited_page_size = limit_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT, max_results)
+            return await atake(self.aiter_members(page_size=limited_page_size), max_results)
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return await afetch_all_pages(
+            lambda page: self._afetch_page(page, fixed_page_size),
+            max_concurrency=max_concurrency,
+        )
 
-            if current_page >= total_pages:
-                break
+    def get_all_members_compact(
+        self,
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[CompactMember]:
+        """
+        Get all members of the organization as compact records.
 
-            current_page += 1
-        return all_members
+        Every page is turned into records as soon as it arrives, so only the
+        models of the pages in flight are alive at the same time.
 
-    async def aget_all_members(
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+
+        Returns:
+            Records of the organization members
+        """
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return fetch_all_pages(
+            lambda page: self._fetch_compact_page(page, fixed_page_size),
+            max_concurrency=max_concurrency,
+        )
+
+    async def aget_all_members_compact(
         self,
-        page_size: int = 100
-    ) -> List[OrganizationMemberModel]:
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[CompactMember]:
         """
-        Asynchronously get all members of the organization.
+        Asynchronously get all members of the organization as compact records.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
 
         Returns:
-            List of organization members
+            Records of the organization members
         """
-        all_members: List[OrganizationMemberModel] = []
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        return await afetch_all_pages(
+            lambda page: self._afetch_compact_page(page, fixed_page_size),
+            max_concurrency=max_concurrency,
+        )
 
-        all_members: List[OrganizationMemberModel] = []
-        current_page = 1
-        api_call = ListOrganizationMembersV1(lightdash_client=self.lightdash_client)
+    def get_member_table(
+        self,
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> MemberTable:
+        """
+        Get all members of the organization as a columnar table.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+
+        Returns:
+            Table of the organization members
+        """
+        return MemberTable(self.get_all_members_compact(page_size=page_size, max_concurrency=max_concurrency))
+
+    async def aget_member_table(
+        self,
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> MemberTable:
+        """
+        Asynchronously get all members of the organization as a columnar table.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+
+        Returns:
+            Table of the organization members
+        """
+        return MemberTable(await self.aget_all_members_compact(page_size=page_size, max_concurrency=max_concurrency))
+
+    def iter_members(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[OrganizationMemberModel]:
+        """
+        Iterate over the members of the organization as pages arrive.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            prefetch: Whether to fetch the next page while the current one is consumed
 
-        while True:
-            response: ListOrganizationMembersV1Response = await api_call.acall(
-                page=current_page,
-                page_size=page_size,
-            )
+        Yields:
+            Organization members
+        """
+        return iter_items(paginate(
+            self._fetch_measured_page,
+            ENDPOINT,
+            page_size=page_size,
+            page_sizer=self.lightdash_client.page_sizer,
+            prefetch=prefetch,
+        ))
 
-            # Extract members from the response
-            current_members = response.results.data
-            if not current_members:
-                break
+    def aiter_members(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[OrganizationMemberModel]:
+        """
+        Asynchronously iterate over the members of the organization as pages arrive.
 
-            all_members.extend(current_members)
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            prefetch: Whether to fetch the next page while the current one is consumed
 
-            # Check if we've retrieved all pages
-            total_pages = response.results.pagination.totalPageCount
+        Yields:
+            Organization members
+        """
+        return aiter_items(apaginate(
+            self._afetch_measured_page,
+            ENDPOINT,
+            page_size=page_size,
+            page_sizer=self.lightdash_client.page_sizer,
+            prefetch=prefetch,
+        ))
+
+    def _fetch_page(self, page: int, page_size: int) -> Tuple[List[OrganizationMemberModel], int]:
+        members, total_page_count, _, _ = self._fetch_measured_page(page, page_size)
+        return members, total_page_count
+
+    async def _afetch_page(self, page: int, page_size: int) -> Tuple[List[OrganizationMemberModel], int]:
+        members, total_page_count, _, _ = await self._afetch_measured_page(page, page_size)
+        return members, total_page_count
+
+    def _fetch_measured_page(self, page: int, page_size: int) -> Tuple[List[OrganizationMemberModel], int, Optional[int], bool]:
+        api_call = ListOrganizationMembersV1(lightdash_client=self.lightdash_client)
+        response: ListOrganizationMembersV1Response = api_call.call(
+            page=page,
+            page_size=page_size,
+        )
+        return response.results.data, response.results.pagination.totalPageCount, api_call.last_response_size, api_call.last_response_cached
+
+    async def _afetch_measured_page(self, page: int, page_size: int) -> Tuple[List[OrganizationMemberModel], int, Optional[int], bool]:
+        api_call = ListOrganizationMembersV1(lightdash_client=self.lightdash_client)
+        response: ListOrganizationMembersV1Response = await api_call.acall(
+            page=page,
+            page_size=page_size,
+        )
+        return response.results.data, response.results.pagination.totalPageCount, api_call.last_response_size, api_call.last_response_cached
 
-            if current_page >= total_pages:
-                break
+    def _fetch_compact_page(self, page: int, page_size: int) -> Tuple[List[CompactMember], int]:
+        members, total_page_count = self._fetch_page(page, page_size)
+        return compact_members(members), total_page_count
 
-            current_page += 1
-        return all_members
+    async def _afetch_compact_page(self, page: int, page_size: int) -> Tuple[List[CompactMember], int]:
+        members, total_page_count = await self._afetch_page(page, page_size)
+        return compact_members(members), total_page_count
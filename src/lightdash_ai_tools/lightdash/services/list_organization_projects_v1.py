@@ -0,0 +1,172 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import AsyncIterator, Iterator, List, Optional
+
+from lightdash_ai_tools.lightdash.api.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1,
+)
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1Results,
+)
+from lightdash_ai_tools.lightdash.services.pagination import (
+    DEFAULT_MAX_CONCURRENCY,
+    AsyncPageFetcher,
+    PageFetcher,
+    afetch_pages_speculatively,
+    ainfer_page_count,
+    aiter_items,
+    aiter_pages,
+    fetch_pages_speculatively,
+    infer_page_count,
+    iter_items,
+    iter_pages,
+    resolve_page_size,
+)
+
+ENDPOINT = ListOrganizationProjectsV1.__name__
+
+
+def _project_key(project: ListOrganizationProjectsV1Results) -> str:
+    return project.projectUuid
+
+
+class ListOrganizationProjectsV1Service:
+    """
+    Service for listing the projects of the organization.
+
+    The project listing doesn't report how many pages there are, so a page
+    is assumed to be followed by another one as long as it is full. Pages are
+    fetched in windows of concurrent requests until the last one shows up.
+    Lightdash versions that ignore the paging parameters return every project
+    at once; the listing then stops after the first response.
+    """
+
+    def __init__(self, lightdash_client: LightdashClient):
+        """
+        Initialize the service.
+
+        Args:
+            lightdash_client: Lightdash client for making API calls
+        """
+        self.lightdash_client = lightdash_client
+
+    def get_all_projects(
+        self,
+        page_size: Optional[int] = None,
+        search_query: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[ListOrganizationProjectsV1Results]:
+        """
+        Get all projects of the organization.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            search_query: Search query to filter projects
+            max_concurrency: Maximum number of pages fetched at the same time
+
+        Returns:
+            List of projects
+        """
+        return fetch_pages_speculatively(
+            self._page_fetcher(page_size, search_query),
+            max_concurrency=max_concurrency,
+        )
+
+    async def aget_all_projects(
+        self,
+        page_size: Optional[int] = None,
+        search_query: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[ListOrganizationProjectsV1Results]:
+        """
+        Asynchronously get all projects of the organization.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            search_query: Search query to filter projects
+            max_concurrency: Maximum number of pages fetched at the same time
+
+        Returns:
+            List of projects
+        """
+        return await afetch_pages_speculatively(
+            self._apage_fetcher(page_size, search_query),
+            max_concurrency=max_concurrency,
+        )
+
+    def iter_projects(
+        self,
+        page_size: Optional[int] = None,
+        search_query: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ListOrganizationProjectsV1Results]:
+        """
+        Iterate over the projects of the organization as pages arrive.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            search_query: Search query to filter projects
+            prefetch: Whether to fetch the next page while the current one is consumed
+
+        Yields:
+            Projects
+        """
+        return iter_items(iter_pages(self._page_fetcher(page_size, search_query), prefetch=prefetch))
+
+    def aiter_projects(
+        self,
+        page_size: Optional[int] = None,
+        search_query: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ListOrganizationProjectsV1Results]:
+        """
+        Asynchronously iterate over the projects of the organization as pages arrive.
+
+        Args:
+            page_size: Number of results per page, None to let the client choose
+            search_query: Search query to filter projects
+            prefetch: Whether to fetch the next page while the current one is consumed
+
+        Yields:
+            Projects
+        """
+        return aiter_items(aiter_pages(self._apage_fetcher(page_size, search_query), prefetch=prefetch))
+
+    def _page_fetcher(
+        self,
+        page_size: Optional[int],
+        search_query: Optional[str],
+    ) -> PageFetcher[ListOrganizationProjectsV1Results]:
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        api_call = ListOrganizationProjectsV1(lightdash_client=self.lightdash_client)
+
+        def fetch_items(page: int) -> List[ListOrganizationProjectsV1Results]:
+            return api_call.call(page=page, page_size=fixed_page_size, search_query=search_query).results
+
+        return infer_page_count(fetch_items, fixed_page_size, key=_project_key)
+
+    def _apage_fetcher(
+        self,
+        page_size: Optional[int],
+        search_query: Optional[str],
+    ) -> AsyncPageFetcher[ListOrganizationProjectsV1Results]:
+        fixed_page_size = resolve_page_size(page_size, self.lightdash_client.page_sizer, ENDPOINT)
+        api_call = ListOrganizationProjectsV1(lightdash_client=self.lightdash_client)
+
+        async def fetch_items(page: int) -> List[ListOrganizationProjectsV1Results]:
+            return (await api_call.acall(page=page, page_size=fixed_page_size, search_query=search_query)).results
+
+        return ainfer_page_count(fetch_items, fixed_page_size, key=_project_key)
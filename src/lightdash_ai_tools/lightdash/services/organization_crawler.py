@@ -0,0 +1,212 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from pydantic import BaseModel, Field, SecretStr, computed_field
+
+from lightdash_ai_tools.lightdash.api.get_project_access_list_v1 import (
+    GetProjectAccessListV1,
+)
+from lightdash_ai_tools.lightdash.api.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1,
+)
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from lightdash_ai_tools.lightdash.api.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1,
+)
+from lightdash_ai_tools.lightdash.cache import is_not_found
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.services.pagination import (
+    PageFetcher,
+    infer_page_count,
+    resolve_page_size,
+)
+from lightdash_ai_tools.lightdash.storage.crawl_store import CrawlStore
+
+MEMBERS_TASK = "members"
+GROUPS_TASK = "groups"
+PROJECTS_TASK = "projects"
+PROJECT_ACCESS_TASK_PREFIX = "project_access/"
+
+# Builds the page fetcher of a task from the task's page size.
+_PageFetcherFactory = Callable[[int], PageFetcher[BaseModel]]
+
+
+def _to_json(item: BaseModel) -> Dict[str, Any]:
+    """Dump a model for storage, revealing secret fields the crawl has to keep."""
+    data = item.model_dump(mode="json")
+    for name, value in item:
+        if isinstance(value, SecretStr):
+            data[name] = value.get_secret_value()
+    return data
+
+
+class CrawlProgress(BaseModel):
+    """Progress of a crawl, reported after every committed page"""
+
+    task: str = Field(..., description="Task the page belongs to")
+    page: int = Field(..., description="Page number within the task")
+    task_items: int = Field(..., description="Number of items committed for the task so far")
+    items: int = Field(..., description="Number of items fetched by this run so far")
+    items_per_second: float = Field(..., description="Throughput of this run so far")
+
+
+class CrawlSummary(BaseModel):
+    """Summary of a crawl run"""
+
+    tasks: int = Field(..., description="Number of tasks of the crawl")
+    resumed_tasks: int = Field(..., description="Number of tasks resumed from a checkpoint")
+    skipped_tasks: int = Field(..., description="Number of tasks already completed by a previous run")
+    pages: int = Field(..., description="Number of pages fetched by this run")
+    items: int = Field(..., description="Number of items fetched by this run")
+    elapsed_seconds: float = Field(..., description="Wall-clock duration of the run")
+
+    @computed_field(description="Items fetched per second")
+    def items_per_second(self) -> float:
+        """Items fetched per second"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.items / self.elapsed_seconds
+
+
+class OrganizationCrawler:
+    """
+    Resumable crawl of the members, groups, projects and project access lists of the organization.
+
+    Every fetched page is committed to a crawl directory before the next one
+    is requested. Running the crawler again on the same directory, e.g. after
+    a crash, skips completed tasks and resumes the others at their next page.
+    Pages are fetched one after another, so the checkpoint always describes a
+    prefix of every task.
+    """
+
+    def __init__(
+        self,
+        lightdash_client: LightdashClient,
+        directory: str,
+        page_size: Optional[int] = None,
+        on_progress: Optional[Callable[[CrawlProgress], None]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            lightdash_client: Lightdash client for making API calls
+            directory: Crawl directory holding the checkpoint and the fetched items
+            page_size: Number of results per page of new tasks, None to let the client choose
+            on_progress: Function called after every committed page
+            clock: Clock used to measure throughput, in seconds
+        """
+        self.lightdash_client = lightdash_client
+        self.store = CrawlStore(directory)
+        self.page_size = page_size
+        self.on_progress = on_progress
+        self._clock = clock
+
+    def crawl(self) -> CrawlSummary:
+        """
+        Run the crawl until every task is complete.
+
+        Returns:
+            Summary of this run
+        """
+        self._started_at = self._clock()
+        self._counters = {"tasks": 0, "resumed_tasks": 0, "skipped_tasks": 0, "pages": 0, "items": 0}
+
+        self._crawl_task(MEMBERS_TASK, ListOrganizationMembersV1.__name__, self._member_pages)
+        self._crawl_task(GROUPS_TASK, ListGroupsInOrganizationV1.__name__, self._group_pages)
+        self._crawl_task(PROJECTS_TASK, ListOrganizationProjectsV1.__name__, self._project_pages)
+        for project in self.store.read_items(PROJECTS_TASK):
+            project_uuid = project["projectUuid"]
+            self._crawl_task(
+                f"{PROJECT_ACCESS_TASK_PREFIX}{project_uuid}",
+                GetProjectAccessListV1.__name__,
+                lambda page_size, project_uuid=project_uuid: self._project_access_pages(project_uuid),
+            )
+
+        return CrawlSummary(elapsed_seconds=self._clock() - self._started_at, **self._counters)
+
+    def _crawl_task(self, task: str, endpoint: str, make_fetch_page: _PageFetcherFactory) -> None:
+        self._counters["tasks"] += 1
+        default_page_size = resolve_page_size(self.page_size, self.lightdash_client.page_sizer, endpoint)
+        state = self.store.start_task(task, page_size=default_page_size)
+        if state.done:
+            self._counters["skipped_tasks"] += 1
+            return
+        if state.next_page > 1:
+            self._counters["resumed_tasks"] += 1
+
+        fetch_page = make_fetch_page(state.page_size)
+        while not state.done:
+            page = state.next_page
+            items, total_pages = fetch_page(page)
+            state = self.store.commit_page(task, [_to_json(item) for item in items], done=not items or page >= total_pages)
+            self._counters["pages"] += 1
+            self._counters["items"] += len(items)
+            if self.on_progress is not None:
+                elapsed = self._clock() - self._started_at
+                self.on_progress(CrawlProgress(
+                    task=task,
+                    page=page,
+                    task_items=state.items,
+                    items=self._counters["items"],
+                    items_per_second=self._counters["items"] / elapsed if elapsed > 0 else 0.0,
+                ))
+
+    def _member_pages(self, page_size: int) -> PageFetcher[BaseModel]:
+        api_call = ListOrganizationMembersV1(lightdash_client=self.lightdash_client)
+
+        def fetch_page(page: int) -> Tuple[List[BaseModel], int]:
+            response = api_call.call(page=page, page_size=page_size)
+            return response.results.data, response.results.pagination.totalPageCount
+
+        return fetch_page
+
+    def _group_pages(self, page_size: int) -> PageFetcher[BaseModel]:
+        api_call = ListGroupsInOrganizationV1(lightdash_client=self.lightdash_client)
+
+        def fetch_page(page: int) -> Tuple[List[BaseModel], int]:
+            response = api_call.call(page=page, page_size=page_size)
+            return response.results.data, int(response.results.pagination.totalPageCount)
+
+        return fetch_page
+
+    def _project_pages(self, page_size: int) -> PageFetcher[BaseModel]:
+        api_call = ListOrganizationProjectsV1(lightdash_client=self.lightdash_client)
+        return infer_page_count(
+            lambda page: api_call.call(page=page, page_size=page_size).results,
+            page_size,
+            key=lambda project: project.projectUuid,
+        )
+
+    def _project_access_pages(self, project_uuid: str) -> PageFetcher[BaseModel]:
+        api_call = GetProjectAccessListV1(lightdash_client=self.lightdash_client)
+
+        def fetch_page(page: int) -> Tuple[List[BaseModel], int]:
+            # The access list isn't paginated, it is a single page.
+            try:
+                return api_call.call(project_uuid).results, 1
+            except httpx.HTTPStatusError as e:
+                # The project was deleted since the project listing was crawled.
+                if is_not_found(e):
+                    return [], 1
+                raise
+
+        return fetch_page
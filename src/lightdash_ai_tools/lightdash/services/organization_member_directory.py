@@ -0,0 +1,193 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from lightdash_ai_tools.lightdash.client import LightdashClient
+from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
+    OrganizationMemberModel,
+)
+from lightdash_ai_tools.lightdash.services.list_organization_members_v1 import (
+    ListOrganizationMembersV1Service,
+)
+from lightdash_ai_tools.lightdash.services.pagination import DEFAULT_MAX_CONCURRENCY
+
+# What tells whether a mirrored member changed. The role, the activation
+# state and the invitation state belong to the membership rather than to the
+# user, so they can change without bumping userUpdatedAt.
+MemberVersion = Tuple[str, str, bool, Optional[bool], Optional[bool]]
+
+
+def _version(member: OrganizationMemberModel) -> MemberVersion:
+    return member.userUpdatedAt, member.role, member.isActive, member.isPending, member.isInviteExpired
+
+
+class MemberDirectorySyncStats(BaseModel):
+    """Outcome of a member directory refresh"""
+
+    added: int = Field(default=0, description="Number of members new to the directory")
+    updated: int = Field(default=0, description="Number of members whose mirror was replaced")
+    removed: int = Field(default=0, description="Number of members no longer in the organization")
+    unchanged: int = Field(default=0, description="Number of members kept as they were")
+    elapsed_seconds: float = Field(default=0.0, description="Wall-clock duration of the refresh")
+
+    @property
+    def changed(self) -> int:
+        """Number of added, updated and removed members."""
+        return self.added + self.updated + self.removed
+
+
+class OrganizationMemberDirectory:
+    """
+    In-memory mirror of the members of the organization.
+
+    Lookups are answered from memory. A refresh lists the members and applies
+    only the difference to the mirror: members whose `userUpdatedAt`, role,
+    activation or invitation state changed are replaced, new ones are added,
+    and members missing from the listing are removed. Unchanged members keep
+    their mirrored objects, and the email index is only touched for changed
+    members.
+
+    Lightdash can't list members updated since a point in time, so a refresh
+    still pages through the whole organization; the work done on the mirror
+    scales with churn.
+    """
+
+    def __init__(
+        self,
+        lightdash_client: LightdashClient,
+        page_size: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the directory. It stays empty until the first refresh.
+
+        Args:
+            lightdash_client: Lightdash client for making API calls
+            page_size: Number of results per page, None to let the client choose
+            max_concurrency: Maximum number of pages fetched at the same time
+            clock: Monotonic clock, in seconds
+        """
+        self.service = ListOrganizationMembersV1Service(lightdash_client=lightdash_client)
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self._clock = clock
+        self._members: Dict[str, OrganizationMemberModel] = {}
+        self._versions: Dict[str, MemberVersion] = {}
+        self._uuids_by_email: Dict[str, str] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> MemberDirectorySyncStats:
+        """
+        Synchronize the directory with the organization.
+
+        Returns:
+            What changed in the directory
+        """
+        started_at = self._clock()
+        members = self.service.get_all_members(page_size=self.page_size, max_concurrency=self.max_concurrency)
+        return self._apply(members, started_at)
+
+    async def arefresh(self) -> MemberDirectorySyncStats:
+        """
+        Asynchronously synchronize the directory with the organization.
+
+        Returns:
+            What changed in the directory
+        """
+        started_at = self._clock()
+        members = await self.service.aget_all_members(page_size=self.page_size, max_concurrency=self.max_concurrency)
+        return self._apply(members, started_at)
+
+    def refresh_if_older_than(self, max_age: float) -> Optional[MemberDirectorySyncStats]:
+        """
+        Refresh the directory if it was never refreshed or is older than `max_age` seconds.
+
+        Returns:
+            What changed in the directory, or None if it was fresh enough
+        """
+        if self.age is not None and self.age <= max_age:
+            return None
+        return self.refresh()
+
+    def _apply(self, members: Iterable[OrganizationMemberModel], started_at: float) -> MemberDirectorySyncStats:
+        stats = MemberDirectorySyncStats()
+        with self._lock:
+            seen = set()
+            for member in members:
+                seen.add(member.userUuid)
+                version = _version(member)
+                current_version = self._versions.get(member.userUuid)
+                if current_version == version:
+                    stats.unchanged += 1
+                    continue
+                if current_version is None:
+                    stats.added += 1
+                else:
+                    stats.updated += 1
+                    self._unindex(self._members[member.userUuid])
+                self._members[member.userUuid] = member
+                self._versions[member.userUuid] = version
+                self._uuids_by_email[member.email.get_secret_value().lower()] = member.userUuid
+
+            for user_uuid in self._members.keys() - seen:
+                self._unindex(self._members.pop(user_uuid))
+                del self._versions[user_uuid]
+                stats.removed += 1
+
+            self._refreshed_at = self._clock()
+        stats.elapsed_seconds = self._refreshed_at - started_at
+        return stats
+
+    def _unindex(self, member: OrganizationMemberModel) -> None:
+        email = member.email.get_secret_value().lower()
+        if self._uuids_by_email.get(email) == member.userUuid:
+            del self._uuids_by_email[email]
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last refresh, None if the directory was never refreshed."""
+        if self._refreshed_at is None:
+            return None
+        return self._clock() - self._refreshed_at
+
+    def get(self, user_uuid: str) -> Optional[OrganizationMemberModel]:
+        """Member with a user UUID, None if there is none."""
+        with self._lock:
+            return self._members.get(user_uuid)
+
+    def find_by_email(self, email: str) -> Optional[OrganizationMemberModel]:
+        """Member with an email address, compared case-insensitively, None if there is none."""
+        with self._lock:
+            user_uuid = self._uuids_by_email.get(email.lower())
+            return None if user_uuid is None else self._members[user_uuid]
+
+    def members(self) -> List[OrganizationMemberModel]:
+        """All mirrored members."""
+        with self._lock:
+            return list(self._members.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._members)
+
+    def __contains__(self, user_uuid: object) -> bool:
+        with self._lock:
+            return user_uuid in self._members
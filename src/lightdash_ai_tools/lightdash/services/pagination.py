@@ -0,0 +1,609 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from lightdash_ai_tools.lightdash.paging import DEFAULT_PAGE_SIZE, AdaptivePageSizer
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# A page fetcher takes a 1-based page number and returns the items of the page
+# together with the total number of pages reported by Lightdash.
+PageFetcher = Callable[[int], Tuple[List[T], int]]
+AsyncPageFetcher = Callable[[int], Awaitable[Tuple[List[T], int]]]
+# Some endpoints don't report how many pages there are, their fetchers only
+# return the items of the page.
+ItemsFetcher = Callable[[int], List[T]]
+AsyncItemsFetcher = Callable[[int], Awaitable[List[T]]]
+# A sized page fetcher additionally takes the page size to request, and also
+# returns the length of the page's JSON body, None when it isn't known, and
+# whether the page was served from the client's cache.
+SizedPageFetcher = Callable[[int, int], Tuple[List[T], int, Optional[int], bool]]
+AsyncSizedPageFetcher = Callable[[int, int], Awaitable[Tuple[List[T], int, Optional[int], bool]]]
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer")
+
+
+def _validate_max_results(max_results: int) -> None:
+    if max_results < 0:
+        raise ValueError("max_results must not be negative")
+
+
+def limit_page_size(
+    page_size: Optional[int],
+    page_sizer: Optional[AdaptivePageSizer],
+    endpoint: str,
+    max_results: int,
+) -> int:
+    """
+    Page size to request when at most `max_results` items are needed.
+
+    Pages never hold more items than needed, so a small limit is answered
+    by a single small page.
+
+    Args:
+        page_size: Page size requested by the caller, None to let the client choose
+        page_sizer: Page size policy of the client, if any
+        endpoint: Name of the API endpoint
+        max_results: Maximum number of items needed
+
+    Returns:
+        The page size.
+    """
+    _validate_max_results(max_results)
+    return max(1, min(resolve_page_size(page_size, page_sizer, endpoint), max_results))
+
+
+def resolve_page_size(
+    page_size: Optional[int],
+    page_sizer: Optional[AdaptivePageSizer],
+    endpoint: str,
+) -> int:
+    """
+    Page size to request when the caller may have left it unset.
+
+    Args:
+        page_size: Page size requested by the caller, None to let the client choose
+        page_sizer: Page size policy of the client, if any
+        endpoint: Name of the API endpoint
+
+    Returns:
+        The caller's page size, else the size remembered by the page sizer,
+        else the default page size.
+    """
+    if page_size is not None:
+        return page_size
+    if page_sizer is not None:
+        return page_sizer.page_size_for(endpoint)
+    return DEFAULT_PAGE_SIZE
+
+
+def fetch_all_pages(
+    fetch_page: PageFetcher[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[T]:
+    """
+    Fetch every page of a paginated endpoint from a thread pool.
+
+    The synchronous counterpart of `afetch_all_pages`: the first page tells
+    how many pages there are, then the remaining pages are requested from at
+    most `max_concurrency` threads. Items are returned in page order.
+
+    Args:
+        fetch_page: Function fetching a single page, safe to call from several threads
+        max_concurrency: Maximum number of pages fetched at the same time
+
+    Returns:
+        Items of all pages
+    """
+    _validate_max_concurrency(max_concurrency)
+    first_items, total_pages = fetch_page(1)
+    if not first_items or total_pages <= 1:
+        return list(first_items)
+
+    def fetch_remaining_page(page: int) -> List[T]:
+        items, _ = fetch_page(page)
+        return items
+
+    all_items = list(first_items)
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, total_pages - 1)) as executor:
+        for items in executor.map(fetch_remaining_page, range(2, total_pages + 1)):
+            all_items.extend(items)
+    return all_items
+
+
+async def afetch_all_pages(
+    fetch_page: AsyncPageFetcher[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[T]:
+    """
+    Fetch every page of a paginated endpoint.
+
+    The first page tells how many pages there are, then the remaining pages
+    are requested concurrently, at most `max_concurrency` at a time. Items are
+    returned in page order.
+
+    Args:
+        fetch_page: Function fetching a single page
+        max_concurrency: Maximum number of pages fetched at the same time
+
+    Returns:
+        Items of all pages
+    """
+    _validate_max_concurrency(max_concurrency)
+    first_items, total_pages = await fetch_page(1)
+    if not first_items or total_pages <= 1:
+        return list(first_items)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_remaining_page(page: int) -> List[T]:
+        async with semaphore:
+            items, _ = await fetch_page(page)
+        return items
+
+    remaining_pages = await asyncio.gather(*(fetch_remaining_page(page) for page in range(2, total_pages + 1)))
+    all_items = list(first_items)
+    for items in remaining_pages:
+        all_items.extend(items)
+    return all_items
+
+
+def _infer_page_count(
+    page: int,
+    items: List[T],
+    page_size: int,
+    key: Callable[[T], Hashable],
+    first_keys: List[Hashable],
+) -> Tuple[List[T], int]:
+    if page == 1:
+        if items:
+            first_keys[:] = [key(items[0])]
+    elif items and first_keys and key(items[0]) == first_keys[0]:
+        # The endpoint ignored the page number and returned the first page again.
+        return [], page
+    # A full page may be followed by another one, a short or oversized page is the last one.
+    return items, page + 1 if len(items) == page_size else page
+
+
+def infer_page_count(
+    fetch_items: ItemsFetcher[T],
+    page_size: int,
+    key: Callable[[T], Hashable],
+) -> PageFetcher[T]:
+    """
+    Turn the fetcher of an endpoint that doesn't report its page count into a page fetcher.
+
+    A full page is assumed to be followed by another page. A page shorter
+    than `page_size` is the last one, and so is a page longer than
+    `page_size`, which means the endpoint ignored the page size. A page
+    starting with the same item as the first page means the endpoint ignored
+    the page number, and is reported as empty.
+
+    Args:
+        fetch_items: Function fetching the items of a single page
+        page_size: Page size the items are requested with
+        key: Function identifying an item
+
+    Returns:
+        Page fetcher reporting one page more than the current one while pages are full
+    """
+    first_keys: List[Hashable] = []
+
+    def fetch_page(page: int) -> Tuple[List[T], int]:
+        return _infer_page_count(page, fetch_items(page), page_size, key, first_keys)
+
+    return fetch_page
+
+
+def ainfer_page_count(
+    fetch_items: AsyncItemsFetcher[T],
+    page_size: int,
+    key: Callable[[T], Hashable],
+) -> AsyncPageFetcher[T]:
+    """
+    Turn the async fetcher of an endpoint that doesn't report its page count into a page fetcher.
+
+    See `infer_page_count`.
+
+    Args:
+        fetch_items: Function fetching the items of a single page
+        page_size: Page size the items are requested with
+        key: Function identifying an item
+
+    Returns:
+        Page fetcher reporting one page more than the current one while pages are full
+    """
+    first_keys: List[Hashable] = []
+
+    async def fetch_page(page: int) -> Tuple[List[T], int]:
+        return _infer_page_count(page, await fetch_items(page), page_size, key, first_keys)
+
+    return fetch_page
+
+
+def fetch_pages_speculatively(
+    fetch_page: PageFetcher[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[T]:
+    """
+    Fetch every page of an endpoint whose page count is only known at its last page.
+
+    After the first page, pages are requested in windows of `max_concurrency`
+    pages from a thread pool, until a page turns out to be the last one or
+    empty. Pages fetched past the last one are discarded, so at most
+    `max_concurrency - 1` requests are wasted. Items are returned in page order.
+
+    Args:
+        fetch_page: Function fetching a single page, safe to call from several threads
+        max_concurrency: Maximum number of pages fetched at the same time
+
+    Returns:
+        Items of all pages
+    """
+    _validate_max_concurrency(max_concurrency)
+    first_items, total_pages = fetch_page(1)
+    all_items = list(first_items)
+    if not first_items or total_pages <= 1:
+        return all_items
+
+    next_page = 2
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        while True:
+            window = range(next_page, next_page + max_concurrency)
+            for page, (items, total_pages) in zip(window, executor.map(fetch_page, window), strict=True):
+                if not items:
+                    return all_items
+                all_items.extend(items)
+                if page >= total_pages:
+                    return all_items
+            next_page += max_concurrency
+
+
+async def afetch_pages_speculatively(
+    fetch_page: AsyncPageFetcher[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[T]:
+    """
+    Asynchronously fetch every page of an endpoint whose page count is only known at its last page.
+
+    See `fetch_pages_speculatively`.
+
+    Args:
+        fetch_page: Function fetching a single page
+        max_concurrency: Maximum number of pages fetched at the same time
+
+    Returns:
+        Items of all pages
+    """
+    _validate_max_concurrency(max_concurrency)
+    first_items, total_pages = await fetch_page(1)
+    all_items = list(first_items)
+    if not first_items or total_pages <= 1:
+        return all_items
+
+    next_page = 2
+    while True:
+        window = range(next_page, next_page + max_concurrency)
+        pages = await asyncio.gather(*(fetch_page(page) for page in window))
+        for page, (items, total_pages) in zip(window, pages, strict=True):
+            if not items:
+                return all_items
+            all_items.extend(items)
+            if page >= total_pages:
+                return all_items
+        next_page += max_concurrency
+
+
+def iter_pages(fetch_page: PageFetcher[T], prefetch: bool = False) -> Iterator[List[T]]:
+    """
+    Iterate over the pages of a paginated endpoint as they arrive.
+
+    Args:
+        fetch_page: Function fetching a single page
+        prefetch: Whether to fetch the next page on a background thread while
+            the caller consumes the current one
+
+    Yields:
+        Items of every page, in page order
+    """
+    if not prefetch:
+        page = 1
+        while True:
+            items, total_pages = fetch_page(page)
+            if not items:
+                return
+            yield items
+            if page >= total_pages:
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        next_page: Optional[Future] = executor.submit(fetch_page, 1)
+        page = 1
+        while next_page is not None:
+            items, total_pages = next_page.result()
+            next_page = None
+            if not items:
+                return
+            if page < total_pages:
+                next_page = executor.submit(fetch_page, page + 1)
+            yield items
+            page += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch_page: AsyncPageFetcher[T], prefetch: bool = False) -> AsyncIterator[List[T]]:
+    """
+    Asynchronously iterate over the pages of a paginated endpoint as they arrive.
+
+    Args:
+        fetch_page: Function fetching a single page
+        prefetch: Whether to start fetching the next page while the caller
+            consumes the current one
+
+    Yields:
+        Items of every page, in page order
+    """
+    page = 1
+    next_page: Optional[asyncio.Future] = None
+    try:
+        items, total_pages = await fetch_page(page)
+        while items:
+            if prefetch and page < total_pages:
+                next_page = asyncio.ensure_future(fetch_page(page + 1))
+            yield items
+            if page >= total_pages:
+                return
+            page += 1
+            if next_page is not None:
+                items, total_pages = await next_page
+                next_page = None
+            else:
+                items, total_pages = await fetch_page(page)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+def iter_adaptive_pages(
+    fetch_page: SizedPageFetcher[T],
+    page_sizer: AdaptivePageSizer,
+    endpoint: str,
+) -> Iterator[List[T]]:
+    """
+    Iterate over the pages of a paginated endpoint, resizing pages as they arrive.
+
+    Every page is timed and weighed by the length of its JSON body, and the
+    page sizer picks the size of the next one. Lightdash paginates by page number, so a
+    new size is only adopted once the items fetched so far fill a whole
+    number of pages of that size; otherwise the current size is kept. Pages
+    served from the client's cache say nothing about the server, so they
+    aren't recorded and keep the current size.
+
+    Args:
+        fetch_page: Function fetching a single page of a given size
+        page_sizer: Page size policy
+        endpoint: Name of the API endpoint, the key sizes are remembered by
+
+    Yields:
+        Items of every page, in order
+    """
+    page_size = page_sizer.page_size_for(endpoint)
+    offset = 0
+    while True:
+        started_at = page_sizer.clock()
+        items, total_pages, num_bytes, cached = fetch_page(offset // page_size + 1, page_size)
+        elapsed = page_sizer.clock() - started_at
+        if not items:
+            return
+        if cached:
+            next_page_size = page_size
+        else:
+            next_page_size = page_sizer.record(endpoint, page_size, len(items), elapsed, num_bytes)
+        yield items
+        offset += len(items)
+        if len(items) < page_size or offset // page_size >= total_pages:
+            return
+        if offset % next_page_size == 0:
+            page_size = next_page_size
+
+
+async def aiter_adaptive_pages(
+    fetch_page: AsyncSizedPageFetcher[T],
+    page_sizer: AdaptivePageSizer,
+    endpoint: str,
+) -> AsyncIterator[List[T]]:
+    """
+    Asynchronously iterate over the pages of a paginated endpoint, resizing pages as they arrive.
+
+    See `iter_adaptive_pages`.
+
+    Args:
+        fetch_page: Function fetching a single page of a given size
+        page_sizer: Page size policy
+        endpoint: Name of the API endpoint, the key sizes are remembered by
+
+    Yields:
+        Items of every page, in order
+    """
+    page_size = page_sizer.page_size_for(endpoint)
+    offset = 0
+    while True:
+        started_at = page_sizer.clock()
+        items, total_pages, num_bytes, cached = await fetch_page(offset // page_size + 1, page_size)
+        elapsed = page_sizer.clock() - started_at
+        if not items:
+            return
+        if cached:
+            next_page_size = page_size
+        else:
+            next_page_size = page_sizer.record(endpoint, page_size, len(items), elapsed, num_bytes)
+        yield items
+        offset += len(items)
+        if len(items) < page_size or offset // page_size >= total_pages:
+            return
+        if offset % next_page_size == 0:
+            page_size = next_page_size
+
+
+def paginate(
+    fetch_page: SizedPageFetcher[T],
+    endpoint: str,
+    page_size: Optional[int] = None,
+    page_sizer: Optional[AdaptivePageSizer] = None,
+    prefetch: bool = False,
+) -> Iterator[List[T]]:
+    """
+    Iterate over the pages of a paginated endpoint.
+
+    Pages are resized adaptively when the caller leaves `page_size` unset and
+    a page sizer is given. Otherwise every page has the same size and may be
+    prefetched.
+
+    Args:
+        fetch_page: Function fetching a single page of a given size
+        endpoint: Name of the API endpoint
+        page_size: Page size, None to let the page sizer choose
+        page_sizer: Page size policy of the client, if any
+        prefetch: Whether to fetch the next page while the current one is consumed,
+            only used with a fixed page size
+
+    Returns:
+        Iterator of the items of every page
+    """
+    if page_size is None and page_sizer is not None:
+        return iter_adaptive_pages(fetch_page, page_sizer, endpoint)
+    fixed_page_size = resolve_page_size(page_size, page_sizer, endpoint)
+    return iter_pages(lambda page: fetch_page(page, fixed_page_size)[:2], prefetch=prefetch)
+
+
+def apaginate(
+    fetch_page: AsyncSizedPageFetcher[T],
+    endpoint: str,
+    page_size: Optional[int] = None,
+    page_sizer: Optional[AdaptivePageSizer] = None,
+    prefetch: bool = False,
+) -> AsyncIterator[List[T]]:
+    """
+    Asynchronously iterate over the pages of a paginated endpoint.
+
+    See `paginate`.
+
+    Args:
+        fetch_page: Function fetching a single page of a given size
+        endpoint: Name of the API endpoint
+        page_size: Page size, None to let the page sizer choose
+        page_sizer: Page size policy of the client, if any
+        prefetch: Whether to fetch the next page while the current one is consumed,
+            only used with a fixed page size
+
+    Returns:
+        Async iterator of the items of every page
+    """
+    if page_size is None and page_sizer is not None:
+        return aiter_adaptive_pages(fetch_page, page_sizer, endpoint)
+    fixed_page_size = resolve_page_size(page_size, page_sizer, endpoint)
+
+    async def fetch_fixed_page(page: int) -> Tuple[List[T], int]:
+        items, total_pages, _, _ = await fetch_page(page, fixed_page_size)
+        return items, total_pages
+
+    return aiter_pages(fetch_fixed_page, prefetch=prefetch)
+
+
+def take(items: Iterator[T], max_results: int) -> List[T]:
+    """
+    Collect at most `max_results` items, without fetching pages past them.
+
+    Args:
+        items: Iterator of items, closed once enough items are collected
+        max_results: Maximum number of items to collect
+
+    Returns:
+        The collected items
+    """
+    _validate_max_results(max_results)
+    collected: List[T] = []
+    try:
+        if max_results > 0:
+            for item in items:
+                collected.append(item)
+                if len(collected) >= max_results:
+                    break
+    finally:
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+    return collected
+
+
+async def atake(items: AsyncIterator[T], max_results: int) -> List[T]:
+    """
+    Asynchronously collect at most `max_results` items, without fetching pages past them.
+
+    Args:
+        items: Async iterator of items, closed once enough items are collected
+        max_results: Maximum number of items to collect
+
+    Returns:
+        The collected items
+    """
+    _validate_max_results(max_results)
+    collected: List[T] = []
+    try:
+        if max_results > 0:
+            async for item in items:
+                collected.append(item)
+                if len(collected) >= max_results:
+                    break
+    finally:
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return collected
+
+
+def iter_items(pages: Iterable[List[T]]) -> Iterator[T]:
+    """Iterate over the items of a paginated endpoint, page by page."""
+    for items in pages:
+        yield from items
+
+
+async def aiter_items(pages: AsyncIterable[List[T]]) -> AsyncIterator[T]:
+    """Asynchronously iterate over the items of a paginated endpoint, page by page."""
+    async for items in pages:
+        for item in items:
+            yield item
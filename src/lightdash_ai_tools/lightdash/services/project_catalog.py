@@ -0,0 +1,205 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import (
+    GetExploreV1,
+    GetSlimExploreV1,
+    explore_path,
+    parse_explore_summary,
+)
+from lightdash_ai_tools.lightdash.api.get_explores_v1 import GetExploresV1
+from lightdash_ai_tools.lightdash.client import LightdashClient, RequestType
+from lightdash_ai_tools.lightdash.models.explore_summary import ExploreSummary
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import GetExploreV1Results
+from lightdash_ai_tools.lightdash.models.get_explores_v1 import GetExploresV1Results
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
+from lightdash_ai_tools.lightdash.models.slim_explore import ExploreParseProfile
+
+
+def _process_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """
+    Process pool parsing the explores of a project.
+
+    The pool starts its workers on demand, while the fetch threads are
+    running. A child forked from a process with running threads can hang on
+    a lock held by one of them, so the workers are started by a fork server,
+    or spawned where there is none.
+    """
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(start_method))
+
+
+class ProjectCatalogService:
+    """Service for building project catalog snapshots."""
+
+    def __init__(self, lightdash_client: LightdashClient, explore_profile: Optional[ExploreParseProfile] = None):
+        """
+        Initialize the service.
+
+        Args:
+            lightdash_client: Lightdash client for making API calls
+            explore_profile: Fields dropped from the explores while parsing them, None to keep everything
+        """
+        self.lightdash_client = lightdash_client
+        self.explore_profile = explore_profile
+
+    def _explore_api_call(self) -> GetExploreV1:
+        if self.explore_profile is None:
+            return GetExploreV1(lightdash_client=self.lightdash_client)
+        return GetSlimExploreV1(lightdash_client=self.lightdash_client, profile=self.explore_profile)
+
+    def build(self, project_uuid: str, max_concurrency: int = 8) -> ProjectCatalog:
+        """
+        Build a snapshot of all explores in a project.
+
+        The explores are listed once, then every explore is fetched on a
+        bounded thread pool.
+
+        Args:
+            project_uuid: UUID of the project
+            max_concurrency: Maximum number of explores fetched at the same time
+
+        Returns:
+            Project catalog snapshot
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        summaries = GetExploresV1(lightdash_client=self.lightdash_client).call(project_uuid).results
+        api_call = self._explore_api_call()
+        explore_names = [summary.name for summary in summaries]
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            responses = executor.map(lambda name: api_call.call(project_uuid, name), explore_names)
+            explore_details: Dict[str, GetExploreV1Results] = {
+                name: response.results for name, response in zip(explore_names, responses, strict=True)
+            }
+        return ProjectCatalog(project_uuid=project_uuid, explores=summaries, explore_details=explore_details)
+
+    async def abuild(self, project_uuid: str, max_concurrency: int = 8) -> ProjectCatalog:
+        """
+        Asynchronously build a snapshot of all explores in a project.
+
+        Args:
+            project_uuid: UUID of the project
+            max_concurrency: Maximum number of explores fetched at the same time
+
+        Returns:
+            Project catalog snapshot
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        summaries = (await GetExploresV1(lightdash_client=self.lightdash_client).acall(project_uuid)).results
+        api_call = self._explore_api_call()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_explore(explore_name: str) -> GetExploreV1Results:
+            async with semaphore:
+                response = await api_call.acall(project_uuid, explore_name)
+            return response.results
+
+        explore_names: List[str] = [summary.name for summary in summaries]
+        results = await asyncio.gather(*(fetch_explore(name) for name in explore_names))
+        explore_details = dict(zip(explore_names, results, strict=True))
+        return ProjectCatalog(project_uuid=project_uuid, explores=summaries, explore_details=explore_details)
+
+    def build_summaries(
+        self,
+        project_uuid: str,
+        max_concurrency: int = 8,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, ExploreSummary]:
+        """
+        Summarize all explores in a project, parsing them in worker processes.
+
+        The explores are fetched on a bounded thread pool, and every response
+        body is handed to a process pool as soon as it arrives. The workers
+        validate the explores and send back compact summaries, so parsing
+        scales across cores instead of running on one core under the GIL.
+        The service's explore profile doesn't apply: the summaries leave out
+        sources, lineage and compiled SQL anyway.
+
+        Args:
+            project_uuid: UUID of the project
+            max_concurrency: Maximum number of explores fetched at the same time
+            max_workers: Number of worker processes, None for the number of CPUs
+            executor: Executor running the parsing, e.g. a shared process pool; it is left running
+
+        Returns:
+            Explore summaries keyed by explore name
+        """
+        _, explore_summaries = self._summarize(project_uuid, max_concurrency, max_workers, executor)
+        return explore_summaries
+
+    def build_in_processes(
+        self,
+        project_uuid: str,
+        max_concurrency: int = 8,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> ProjectCatalog:
+        """
+        Build a snapshot of all explores in a project, parsing them in worker processes.
+
+        The explores of the snapshot are built from the summaries returned by
+        `build_summaries`, so they only hold what the summaries keep.
+
+        Args:
+            project_uuid: UUID of the project
+            max_concurrency: Maximum number of explores fetched at the same time
+            max_workers: Number of worker processes, None for the number of CPUs
+            executor: Executor running the parsing, e.g. a shared process pool; it is left running
+
+        Returns:
+            Project catalog snapshot
+        """
+        summaries, explore_summaries = self._summarize(project_uuid, max_concurrency, max_workers, executor)
+        explore_details = {name: summary.to_model() for name, summary in explore_summaries.items()}
+        return ProjectCatalog(project_uuid=project_uuid, explores=summaries, explore_details=explore_details)
+
+    def _summarize(
+        self,
+        project_uuid: str,
+        max_concurrency: int,
+        max_workers: Optional[int],
+        executor: Optional[Executor],
+    ) -> Tuple[List[GetExploresV1Results], Dict[str, ExploreSummary]]:
+        """List the explores of a project, then fetch them and summarize them on a process pool."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        summaries = GetExploresV1(lightdash_client=self.lightdash_client).call(project_uuid).results
+        explore_names = [summary.name for summary in summaries]
+
+        if executor is None:
+            parsing = _process_pool(max_workers)
+        else:
+            parsing = contextlib.nullcontext(executor)
+        with parsing as parser:
+            def fetch_explore(explore_name: str) -> "Future[ExploreSummary]":
+                response_data = self.lightdash_client.call_raw(RequestType.GET, explore_path(project_uuid, explore_name))
+                return parser.submit(parse_explore_summary, response_data)
+
+            with ThreadPoolExecutor(max_workers=max_concurrency) as fetcher:
+                futures = list(fetcher.map(fetch_explore, explore_names))
+            explore_summaries = {name: future.result() for name, future in zip(explore_names, futures, strict=True)}
+        return summaries, explore_summaries
@@ -0,0 +1,506 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Binary, memory-mapped snapshots of project catalogs.
+
+Layout (little-endian):
+
+    header   magic, version, counts and the position of every section
+    strings  (string_count + 1) uint32 offsets followed by the UTF-8 data
+    explores fixed-size records sorted by explore name
+    fields   fixed-size records, grouped by explore and sorted by reference
+    joins    fixed-size records, grouped by explore
+
+Every string is stored once in the string table and referenced by its index,
+so opening a snapshot only maps the file: lookups binary-search the sorted
+records in place and decode the strings they actually return.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Results,
+    Metric,
+)
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
+
+MAGIC = b"LDCATLG\x00"
+VERSION = 1
+NULL_STRING = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<8sHHIIIIIQQQQQ")
+_OFFSET = struct.Struct("<I")
+# name, label, base table, group label, description, type, field start, field count, join start, join count
+_EXPLORE = struct.Struct("<10I")
+# reference, name, label, table, table label, type, description, sql, hidden, kind
+_FIELD = struct.Struct("<8IBB2x")
+# table, type, sql on
+_JOIN = struct.Struct("<3I")
+
+FIELD_KIND_DIMENSION = 0
+FIELD_KIND_METRIC = 1
+
+_HIDDEN_UNSET = 2
+
+
+class _StringTableBuilder:
+    """Deduplicating string table used while writing a snapshot"""
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._encoded: List[bytes] = []
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NULL_STRING
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self._encoded)
+            self._ids[value] = string_id
+            self._encoded.append(value.encode("utf-8"))
+        return string_id
+
+    def to_bytes(self) -> Tuple[int, bytes]:
+        offsets = bytearray()
+        position = 0
+        for encoded in self._encoded:
+            offsets += _OFFSET.pack(position)
+            position += len(encoded)
+        offsets += _OFFSET.pack(position)
+        return len(self._encoded), bytes(offsets) + b"".join(self._encoded)
+
+
+def _encode_hidden(hidden: Optional[bool]) -> int:
+    if hidden is None:
+        return _HIDDEN_UNSET
+    return int(hidden)
+
+
+def _field_reference(field_id: str, field: Union[Dimension, Metric]) -> str:
+    return field.reference or field_id
+
+
+def write_catalog_snapshot(catalog: ProjectCatalog, path: Union[str, os.PathLike]) -> None:
+    """
+    Write a project catalog as a binary snapshot.
+
+    The file is written next to its destination and atomically moved into
+    place, so readers never observe a partially written snapshot.
+
+    Args:
+        catalog: Project catalog to serialize
+        path: Destination path of the snapshot
+    """
+    strings = _StringTableBuilder()
+    project_uuid_id = strings.add(catalog.project_uuid)
+
+    summaries = {summary.name: summary for summary in catalog.explores}
+    explore_names = sorted(set(summaries) | set(catalog.explore_details), key=lambda name: name.encode("utf-8"))
+
+    explore_records = bytearray()
+    field_records = bytearray()
+    join_records = bytearray()
+    field_count = 0
+    join_count = 0
+    for explore_name in explore_names:
+        summary = summaries.get(explore_name)
+        explore = catalog.explore_details.get(explore_name) or GetExploreV1Results()
+
+        fields: List[Tuple[bytes, int, str, Union[Dimension, Metric]]] = []
+        for kind, field_map in ((FIELD_KIND_DIMENSION, explore.dimensions), (FIELD_KIND_METRIC, explore.metrics)):
+            for field_id, field in (field_map or {}).items():
+                reference = _field_reference(field_id, field)
+                fields.append((reference.encode("utf-8"), kind, reference, field))
+        fields.sort(key=lambda item: item[0])
+
+        explore_records += _EXPLORE.pack(
+            strings.add(explore_name),
+            strings.add(explore.label if explore.label is not None else getattr(summary, "label", None)),
+            strings.add(explore.baseTable),
+            strings.add(explore.groupLabel if explore.groupLabel is not None else getattr(summary, "groupLabel", None)),
+            strings.add(explore.description if explore.description is not None else getattr(summary, "description", None)),
+            strings.add(explore.type if explore.type is not None else getattr(summary, "type", None)),
+            field_count,
+            len(fields),
+            join_count,
+            len(explore.joinedTables or []),
+        )
+        for _, kind, reference, field in fields:
+            field_records += _FIELD.pack(
+                strings.add(reference),
+                strings.add(field.name),
+                strings.add(field.label),
+                strings.add(field.table),
+                strings.add(field.tableLabel),
+                strings.add(field.type),
+                strings.add(field.description),
+                strings.add(field.sql),
+                _encode_hidden(field.hidden),
+                kind,
+            )
+        field_count += len(fields)
+        for joined_table in explore.joinedTables or []:
+            join_records += _JOIN.pack(
+                strings.add(joined_table.table),
+                strings.add(joined_table.type),
+                strings.add(joined_table.sqlOn),
+            )
+        join_count += len(explore.joinedTables or [])
+
+    string_count, string_table = strings.to_bytes()
+    strings_position = _HEADER.size
+    explores_position = strings_position + len(string_table)
+    fields_position = explores_position + len(explore_records)
+    joins_position = fields_position + len(field_records)
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        project_uuid_id,
+        string_count,
+        len(explore_names),
+        field_count,
+        join_count,
+        strings_position,
+        explores_position,
+        fields_position,
+        joins_position,
+        joins_position + len(join_records),
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as snapshot_file:
+            snapshot_file.write(header)
+            snapshot_file.write(string_table)
+            snapshot_file.write(explore_records)
+            snapshot_file.write(field_records)
+            snapshot_file.write(join_records)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+class SnapshotField:
+    """View of a dimension or a metric stored in a snapshot"""
+
+    __slots__ = ("_snapshot", "_record")
+
+    def __init__(self, snapshot: "CatalogSnapshot", record: Tuple[int, ...]):
+        self._snapshot = snapshot
+        self._record = record
+
+    @property
+    def reference(self) -> str:
+        return self._snapshot._get_string(self._record[0])
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[1])
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[2])
+
+    @property
+    def table(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[3])
+
+    @property
+    def table_label(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[4])
+
+    @property
+    def type(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[5])
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[6])
+
+    @property
+    def sql(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[7])
+
+    @property
+    def hidden(self) -> Optional[bool]:
+        hidden = self._record[8]
+        return None if hidden == _HIDDEN_UNSET else bool(hidden)
+
+    @property
+    def is_metric(self) -> bool:
+        return self._record[9] == FIELD_KIND_METRIC
+
+    def to_model(self) -> Union[Dimension, Metric]:
+        """Convert the view into a `Dimension` or a `Metric`."""
+        model = Metric if self.is_metric else Dimension
+        return model(
+            name=self.name,
+            label=self.label,
+            table=self.table,
+            tableLabel=self.table_label,
+            type=self.type,
+            description=self.description,
+            sql=self.sql,
+            hidden=self.hidden,
+        )
+
+    def __repr__(self) -> str:
+        return f"SnapshotField(reference={self.reference!r}, is_metric={self.is_metric})"
+
+
+class SnapshotJoinedTable:
+    """View of a joined table stored in a snapshot"""
+
+    __slots__ = ("table", "type", "sql_on")
+
+    def __init__(self, table: Optional[str], type: Optional[str], sql_on: Optional[str]):
+        self.table = table
+        self.type = type
+        self.sql_on = sql_on
+
+    def __repr__(self) -> str:
+        return f"SnapshotJoinedTable(table={self.table!r}, type={self.type!r})"
+
+
+class SnapshotExplore:
+    """View of an explore stored in a snapshot"""
+
+    __slots__ = ("_snapshot", "_record")
+
+    def __init__(self, snapshot: "CatalogSnapshot", record: Tuple[int, ...]):
+        self._snapshot = snapshot
+        self._record = record
+
+    @property
+    def name(self) -> str:
+        return self._snapshot._get_string(self._record[0])
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[1])
+
+    @property
+    def base_table(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[2])
+
+    @property
+    def group_label(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[3])
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[4])
+
+    @property
+    def type(self) -> Optional[str]:
+        return self._snapshot._get_string(self._record[5])
+
+    def fields(self) -> Iterator[SnapshotField]:
+        """Iterate over the dimensions and metrics of the explore, ordered by reference."""
+        field_start, field_count = self._record[6], self._record[7]
+        for index in range(field_start, field_start + field_count):
+            yield SnapshotField(self._snapshot, self._snapshot._get_field_record(index))
+
+    def dimensions(self) -> List[SnapshotField]:
+        """List the dimensions of the explore."""
+        return [field for field in self.fields() if not field.is_metric]
+
+    def metrics(self) -> List[SnapshotField]:
+        """List the metrics of the explore."""
+        return [field for field in self.fields() if field.is_metric]
+
+    def get_field(self, reference: str) -> Optional[SnapshotField]:
+        """
+        Get a dimension or a metric by its reference.
+
+        Args:
+            reference: Field reference, e.g. `orders_order_id`
+
+        Returns:
+            The field, or None if the explore has no such field.
+        """
+        field_start, field_count = self._record[6], self._record[7]
+        index = self._snapshot._search(
+            reference.encode("utf-8"),
+            field_start,
+            field_start + field_count,
+            self._snapshot._get_field_record,
+        )
+        if index is None:
+            return None
+        return SnapshotField(self._snapshot, self._snapshot._get_field_record(index))
+
+    def joined_tables(self) -> List[SnapshotJoinedTable]:
+        """List the tables joined into the explore."""
+        join_start, join_count = self._record[8], self._record[9]
+        joined_tables = []
+        for index in range(join_start, join_start + join_count):
+            table, join_type, sql_on = self._snapshot._get_join_record(index)
+            joined_tables.append(SnapshotJoinedTable(
+                table=self._snapshot._get_string(table),
+                type=self._snapshot._get_string(join_type),
+                sql_on=self._snapshot._get_string(sql_on),
+            ))
+        return joined_tables
+
+    def __repr__(self) -> str:
+        return f"SnapshotExplore(name={self.name!r})"
+
+
+class CatalogSnapshot:
+    """
+    Read-only project catalog backed by a memory-mapped binary snapshot.
+
+    Opening a snapshot is O(1): the file is mapped, not parsed, so processes
+    opening the same file share a single copy in the page cache.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        Open a snapshot written by `write_catalog_snapshot`.
+
+        Args:
+            path: Path of the snapshot
+
+        Raises:
+            ValueError: If the file isn't a supported catalog snapshot.
+        """
+        with open(path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("Invalid catalog snapshot: file is too small")
+        (
+            magic,
+            version,
+            _,
+            self._project_uuid_id,
+            self._string_count,
+            self._explore_count,
+            self._field_count,
+            self._join_count,
+            self._strings_position,
+            self._explores_position,
+            self._fields_position,
+            self._joins_position,
+            end_position,
+        ) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError("Invalid catalog snapshot: bad magic number")
+        if version != VERSION:
+            raise ValueError(f"Unsupported catalog snapshot version: {version}")
+        if end_position != len(self._mmap):
+            raise ValueError("Invalid catalog snapshot: unexpected file size")
+        self._string_data_position = self._strings_position + (self._string_count + 1) * _OFFSET.size
+
+    def close(self) -> None:
+        """Unmap the snapshot."""
+        self._mmap.close()
+
+    def __enter__(self) -> "CatalogSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._explore_count
+
+    def __contains__(self, explore_name: str) -> bool:
+        return self._find_explore(explore_name) is not None
+
+    @property
+    def project_uuid(self) -> str:
+        return self._get_string(self._project_uuid_id)
+
+    def explore_names(self) -> List[str]:
+        """List the names of all explores, in sorted order."""
+        return [self._get_string(self._get_explore_record(index)[0]) for index in range(self._explore_count)]
+
+    def explores(self) -> Iterator[SnapshotExplore]:
+        """Iterate over all explores, in name order."""
+        for index in range(self._explore_count):
+            yield SnapshotExplore(self, self._get_explore_record(index))
+
+    def get_explore(self, explore_name: str) -> Optional[SnapshotExplore]:
+        """
+        Get an explore by name.
+
+        Args:
+            explore_name: Name of the explore
+
+        Returns:
+            The explore, or None if the snapshot has no such explore.
+        """
+        index = self._find_explore(explore_name)
+        if index is None:
+            return None
+        return SnapshotExplore(self, self._get_explore_record(index))
+
+    def get_field(self, explore_name: str, reference: str) -> Optional[SnapshotField]:
+        """Get a dimension or a metric of an explore by its reference."""
+        explore = self.get_explore(explore_name)
+        if explore is None:
+            return None
+        return explore.get_field(reference)
+
+    def _find_explore(self, explore_name: str) -> Optional[int]:
+        return self._search(explore_name.encode("utf-8"), 0, self._explore_count, self._get_explore_record)
+
+    def _search(self, key: bytes, low: int, high: int, get_record) -> Optional[int]:
+        """Binary-search records in [low, high) whose first column is a string ID."""
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self._get_string_bytes(get_record(middle)[0])
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _get_explore_record(self, index: int) -> Tuple[int, ...]:
+        return _EXPLORE.unpack_from(self._mmap, self._explores_position + index * _EXPLORE.size)
+
+    def _get_field_record(self, index: int) -> Tuple[int, ...]:
+        return _FIELD.unpack_from(self._mmap, self._fields_position + index * _FIELD.size)
+
+    def _get_join_record(self, index: int) -> Tuple[int, ...]:
+        return _JOIN.unpack_from(self._mmap, self._joins_position + index * _JOIN.size)
+
+    def _get_string_bytes(self, string_id: int) -> bytes:
+        offset_position = self._strings_position + string_id * _OFFSET.size
+        start, end = struct.unpack_from("<II", self._mmap, offset_position)
+        return self._mmap[self._string_data_position + start:self._string_data_position + end]
+
+    def _get_string(self, string_id: int) -> Optional[str]:
+        if string_id == NULL_STRING:
+            return None
+        return self._get_string_bytes(string_id).decode("utf-8")
@@ -0,0 +1,166 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Local storage of resumable crawls.
+
+A crawl directory holds one JSON Lines file of fetched items per task and a
+`checkpoint.json` file recording, for every task, the next page to fetch and
+how many bytes of its items file are committed. Items are appended first and
+the checkpoint is replaced atomically afterwards, so a crash between the two
+leaves uncommitted bytes that are truncated when the crawl resumes.
+
+Crawled members and access lists include email addresses, so every file is
+only readable by its owner.
+"""
+
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+CHECKPOINT_FILE_NAME = "checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+_UNSAFE_FILE_NAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class CrawlTaskState(BaseModel):
+    """Progress of a crawl task"""
+
+    page_size: int = Field(..., description="Page size the task's pages are requested with")
+    next_page: int = Field(default=1, description="Next page to fetch")
+    items: int = Field(default=0, description="Number of committed items")
+    committed_bytes: int = Field(default=0, description="Committed size of the task's items file")
+    done: bool = Field(default=False, description="Whether every page of the task was fetched")
+
+
+class CrawlCheckpoint(BaseModel):
+    """Progress of every task of a crawl"""
+
+    version: int = Field(default=CHECKPOINT_VERSION, description="Version of the checkpoint format")
+    tasks: Dict[str, CrawlTaskState] = Field(default_factory=dict, description="Progress of every task, keyed by task name")
+
+
+class CrawlStore:
+    """Crawl directory with its checkpoint"""
+
+    def __init__(self, directory: str):
+        """
+        Open a crawl directory, creating it if needed.
+
+        Args:
+            directory: Path of the crawl directory
+        """
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.checkpoint = self._read_checkpoint()
+
+    @property
+    def checkpoint_path(self) -> str:
+        return os.path.join(self.directory, CHECKPOINT_FILE_NAME)
+
+    def items_path(self, task: str) -> str:
+        """Path of the items file of a task."""
+        return os.path.join(self.directory, f"{_UNSAFE_FILE_NAME_CHARACTERS.sub('_', task)}.jsonl")
+
+    def _read_checkpoint(self) -> CrawlCheckpoint:
+        if not os.path.exists(self.checkpoint_path):
+            return CrawlCheckpoint()
+        with open(self.checkpoint_path, encoding="utf-8") as checkpoint_file:
+            checkpoint = CrawlCheckpoint.model_validate_json(checkpoint_file.read())
+        if checkpoint.version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported crawl checkpoint version {checkpoint.version} in {self.checkpoint_path}")
+        return checkpoint
+
+    def _write_checkpoint(self) -> None:
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as checkpoint_file:
+                checkpoint_file.write(self.checkpoint.model_dump_json(indent=2))
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(temporary_path, self.checkpoint_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def start_task(self, task: str, page_size: int) -> CrawlTaskState:
+        """
+        Get the state of a task, registering it if it's new.
+
+        Items fetched after the last checkpoint of the task are dropped, so
+        the task resumes exactly at its next page.
+
+        Args:
+            task: Name of the task
+            page_size: Page size of a new task. A resumed task keeps its page size,
+                since page numbers only make sense for the size they were fetched with.
+
+        Returns:
+            The state of the task
+        """
+        state = self.checkpoint.tasks.get(task)
+        if state is None:
+            state = CrawlTaskState(page_size=page_size)
+            self.checkpoint.tasks[task] = state
+            self._write_checkpoint()
+        path = self.items_path(task)
+        if os.path.exists(path) and os.path.getsize(path) > state.committed_bytes:
+            os.truncate(path, state.committed_bytes)
+        return state
+
+    def commit_page(self, task: str, items: List[Dict[str, Any]], done: bool) -> CrawlTaskState:
+        """
+        Append the items of the task's next page and checkpoint the task.
+
+        Args:
+            task: Name of a started task
+            items: JSON-serializable items of the page
+            done: Whether the page is the last one of the task
+
+        Returns:
+            The new state of the task
+        """
+        state = self.checkpoint.tasks[task]
+        if items:
+            data = "".join(json.dumps(item, separators=(",", ":")) + "\n" for item in items).encode("utf-8")
+            file_descriptor = os.open(self.items_path(task), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            with os.fdopen(file_descriptor, "wb") as items_file:
+                items_file.write(data)
+                items_file.flush()
+                os.fsync(items_file.fileno())
+            state.committed_bytes += len(data)
+            state.items += len(items)
+        state.next_page += 1
+        state.done = done
+        self._write_checkpoint()
+        return state
+
+    def read_items(self, task: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the committed items of a task."""
+        state = self.checkpoint.tasks.get(task)
+        if state is None or not os.path.exists(self.items_path(task)):
+            return
+        with open(self.items_path(task), "rb") as items_file:
+            data = items_file.read(state.committed_bytes)
+        for line in data.splitlines():
+            yield json.loads(line)
+
+    def task_state(self, task: str) -> Optional[CrawlTaskState]:
+        """State of a task, None if it was never started."""
+        return self.checkpoint.tasks.get(task)
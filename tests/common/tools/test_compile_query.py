@@ -0,0 +1,65 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.common.tools.compile_query import CompileQuery
+from lightdash_ai_tools.lightdash.models.compile_query_v1 import Filters
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import GetExploreV1Results
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+COMPILE_PATH = "/api/v1/projects/project-1/explores/orders/compileQuery"
+
+
+def build_catalog() -> ProjectCatalog:
+    explore = GetExploreV1Results.model_validate({
+        "name": "orders",
+        "dimensions": {"orders_status": {"table": "orders", "name": "status"}},
+        "metrics": {"orders_count": {"table": "orders", "name": "count"}},
+    })
+    return ProjectCatalog(project_uuid="project-1", explore_details={"orders": explore})
+
+
+class TestCompileQuery(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeLightdashClient(routes={COMPILE_PATH: {"status": "ok", "results": "SELECT 1"}})
+
+    def test_compiles_known_fields(self):
+        tool = CompileQuery(lightdash_client=self.client, catalog=build_catalog())
+
+        result = tool.call("project-1", "orders", "orders", dimensions=["orders_status"], metrics=["orders_count"], filters=Filters())
+
+        self.assertEqual(result, "SELECT 1")
+        self.assertEqual(len(self.client.requests), 1)
+
+    def test_rejects_unknown_fields_without_calling_lightdash(self):
+        tool = CompileQuery(lightdash_client=self.client, catalog=build_catalog())
+
+        with self.assertRaisesRegex(ValueError, "orders_count, orders_total"):
+            asyncio.run(tool.acall("project-1", "orders", "orders", dimensions=["orders_count"], metrics=["orders_total"]))
+        self.assertEqual(self.client.requests, [])
+
+    def test_without_catalog(self):
+        tool = CompileQuery(lightdash_client=self.client)
+
+        self.assertEqual(tool.call("project-1", "orders", "orders", dimensions=["orders_total"], filters=Filters()), "SELECT 1")
+
+    def test_catalog_of_another_project(self):
+        catalog = build_catalog().model_copy(update={"project_uuid": "project-2"})
+        tool = CompileQuery(lightdash_client=self.client, catalog=catalog)
+
+        self.assertEqual(tool.call("project-1", "orders", "orders", dimensions=["orders_total"], filters=Filters()), "SELECT 1")
@@ -0,0 +1,91 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+import httpx
+
+from lightdash_ai_tools.common.tools.get_groups_in_organization import (
+    GetGroupsInOrganization,
+)
+from tests.lightdash.fake_lightdash_client import (
+    FakeLightdashClient,
+    failing,
+    paginated,
+)
+from tests.lightdash.services.test_list_groups_in_organization_v1 import (
+    GROUPS_PATH,
+    build_groups,
+)
+
+
+def search(groups):
+    """Handler answering the group listing like Lightdash does with a search query"""
+
+    def handler(parameters):
+        query = parameters.get("searchQuery", "").lower()
+        return paginated([group for group in groups if query in group["name"].lower()])(parameters)
+
+    return handler
+
+
+class TestGetGroupsInOrganization(unittest.TestCase):
+    def setUp(self):
+        groups = build_groups(500)
+        self.client = FakeLightdashClient(routes={
+            GROUPS_PATH: search(groups),
+            "/api/v1/groups/group-7": {"status": "ok", "results": {**groups[7], "members": [], "memberUuids": []}},
+            "/api/v1/groups/missing": failing(404),
+            "/api/v1/groups/malformed": failing(400),
+            "/api/v1/groups/unprocessable": failing(422),
+            "/api/v1/groups/throttled": failing(429),
+            "/api/v1/groups/conflict": failing(409),
+            "/api/v1/groups/forbidden": failing(403),
+            "/api/v1/groups/broken": failing(500),
+        })
+        self.tool = GetGroupsInOrganization(lightdash_client=self.client)
+
+    def test_call(self):
+        groups = self.tool.call()
+        output = asyncio.run(self.tool.acall(max_results=3))
+
+        self.assertIsInstance(groups, list)
+        self.assertEqual(len(groups), 500)
+        self.assertEqual([group.uuid for group in output.groups], ["group-0", "group-1", "group-2"])
+        self.assertTrue(output.truncated)
+
+    def test_get_group_details(self):
+        group = self.tool.get_group_details("group-7")
+
+        self.assertEqual(group.name, "Group 7")
+        self.assertIsNone(asyncio.run(self.tool.aget_group_details("missing")))
+        self.assertEqual([path for path, _ in self.client.requests], ["/api/v1/groups/group-7", "/api/v1/groups/missing"])
+        self.assertEqual(group, self.tool.service.get_all_groups()[7])
+
+    def test_get_group_details_errors(self):
+        self.assertIsNone(self.tool.get_group_details("malformed"))
+        self.assertIsNone(asyncio.run(self.tool.aget_group_details("malformed")))
+        self.assertIsNone(self.tool.get_group_details("unprocessable"))
+        for group_uuid, status_code in (("forbidden", 403), ("throttled", 429), ("conflict", 409), ("broken", 500)):
+            with self.assertRaises(httpx.HTTPStatusError) as context:
+                self.tool.get_group_details(group_uuid)
+            self.assertEqual(context.exception.response.status_code, status_code)
+
+    def test_filter_groups(self):
+        groups = self.tool.filter_groups(name_contains="group 12", created_by="user-2")
+
+        self.assertEqual([group.uuid for group in groups], ["group-12", "group-120", "group-122", "group-124", "group-126", "group-128"])
+        self.assertEqual(len(self.client.requests), 1)
+        self.assertEqual(self.client.requests[0][1]["searchQuery"], "group 12")
@@ -0,0 +1,46 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.common.tools.get_organization_members import (
+    GetOrganizationMembers,
+)
+from tests.lightdash.services.test_list_organization_members_v1 import build_client
+
+
+class TestGetOrganizationMembers(unittest.TestCase):
+    def test_max_results(self):
+        client = build_client(1000)
+        output = GetOrganizationMembers(lightdash_client=client).call(max_results=5)
+
+        self.assertEqual([member.userUuid for member in output.members], [f"user-{index}" for index in range(5)])
+        self.assertTrue(output.truncated)
+        self.assertEqual(client.requests, [("/api/v1/org/users", {"page": 1, "pageSize": 6})])
+
+    def test_max_results_not_reached(self):
+        client = build_client(3)
+        output = asyncio.run(GetOrganizationMembers(lightdash_client=client).acall(max_results=5))
+
+        self.assertEqual(len(output.members), 3)
+        self.assertFalse(output.truncated)
+        self.assertEqual(len(client.requests), 1)
+
+    def test_no_max_results(self):
+        members = GetOrganizationMembers(lightdash_client=build_client(250)).call()
+
+        # Without a limit the tool keeps returning the plain list of members.
+        self.assertIsInstance(members, list)
+        self.assertEqual(len(members), 250)
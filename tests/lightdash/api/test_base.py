@@ -0,0 +1,125 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from pydantic import ValidationError
+
+from lightdash_ai_tools.lightdash.api.get_project_v1 import GetProjectV1
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+
+PROJECT_PATH = "/api/v1/projects/project-1"
+PROJECT = {
+    "status": "ok",
+    "results": {"projectUuid": "project-1", "organizationUuid": "org-1", "name": "Analytics"},
+}
+
+
+class TestParseResponse(unittest.TestCase):
+    def test_bytes_and_documents_parse_alike(self):
+        api_call = GetProjectV1(lightdash_client=FakeLightdashClient())
+
+        from_bytes = api_call._parse_response(json.dumps(PROJECT).encode("utf-8"))
+        from_document = api_call._parse_response(PROJECT)
+
+        self.assertEqual(from_bytes, from_document)
+        self.assertEqual(from_bytes.results.name, "Analytics")
+
+    def test_invalid_body(self):
+        api_call = GetProjectV1(lightdash_client=FakeLightdashClient())
+        with self.assertRaises(ValueError):
+            api_call._parse(b'{"status": "ok", "results": {"name": "Analytics"}}')
+        with self.assertRaises(ValueError):
+            api_call._parse(b"not json")
+
+    def test_call_validates_raw_body(self):
+        members = [
+            {
+                "userUuid": f"user-{index}",
+                "userCreatedAt": "2025-01-01",
+                "userUpdatedAt": "2025-01-01",
+                "firstName": "First",
+                "lastName": "Last",
+                "organizationUuid": "org-1",
+                "role": "viewer",
+                "email": f"user-{index}@example.com",
+            }
+            for index in range(3)
+        ]
+        client = FakeLightdashClient(routes={"/api/v1/org/users": paginated(members)})
+
+        response = ListOrganizationMembersV1(lightdash_client=client).call(page=1, page_size=10)
+
+        self.assertEqual([member.userUuid for member in response.results.data], ["user-0", "user-1", "user-2"])
+        self.assertEqual(response.results.data[0].email.get_secret_value(), "user-0@example.com")
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the threads it parsed responses on"""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.threads = []
+
+    def submit(self, fn, *args, **kwargs):
+        def run():
+            self.threads.append(threading.current_thread())
+            return fn(*args, **kwargs)
+        return super().submit(run)
+
+
+class TestOffloadedParsing(unittest.TestCase):
+    def call(self, **client_options):
+        client = FakeLightdashClient(routes={PROJECT_PATH: PROJECT}, **client_options)
+        return asyncio.run(GetProjectV1(lightdash_client=client).acall("project-1"))
+
+    def test_parses_large_responses_on_the_executor(self):
+        with RecordingExecutor() as executor:
+            response = self.call(parse_offload_threshold=10, parse_executor=executor)
+
+        self.assertEqual(response.results.name, "Analytics")
+        self.assertEqual(len(executor.threads), 1)
+        self.assertIsNot(executor.threads[0], threading.main_thread())
+
+    def test_parses_small_responses_on_the_event_loop(self):
+        with RecordingExecutor() as executor:
+            self.call(parse_offload_threshold=10_000, parse_executor=executor)
+            self.call(parse_executor=executor)
+
+        self.assertEqual(executor.threads, [])
+
+    def test_rejects_process_pools(self):
+        with ProcessPoolExecutor(max_workers=1) as executor, self.assertRaises(ValidationError):
+            FakeLightdashClient(routes={}, parse_offload_threshold=0, parse_executor=executor)
+
+    def test_default_executor(self):
+        response = self.call(parse_offload_threshold=0)
+
+        self.assertEqual(response.results.projectUuid, "project-1")
+
+    def test_invalid_body_on_the_executor(self):
+        client = FakeLightdashClient(
+            routes={PROJECT_PATH: {"status": "ok", "results": {"name": "Analytics"}}},
+            parse_offload_threshold=0,
+        )
+
+        with self.assertRaises(ValueError):
+            asyncio.run(GetProjectV1(lightdash_client=client).acall("project-1"))
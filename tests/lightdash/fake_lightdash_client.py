@@ -0,0 +1,138 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+from pydantic import Field, PrivateAttr, SecretStr
+
+from lightdash_ai_tools.lightdash.client import LightdashClient, RequestType
+
+Handler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class FakeLightdashClient(LightdashClient):
+    """Lightdash client answering requests from in-memory handlers"""
+
+    base_url: str = "https://lightdash.example.com"
+    token: SecretStr = SecretStr("fake-token")
+    routes: Dict[str, Union[Handler, Dict[str, Any]]] = Field(default_factory=dict)
+    requests: List[Tuple[str, Dict[str, Any]]] = Field(default_factory=list)
+    latency: float = Field(default=0.0, description="Seconds every request takes")
+    max_in_flight: int = Field(default=0, description="Highest number of concurrent requests observed")
+
+    _in_flight: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def _enter(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _respond(self, path: str, parameters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        parameters = dict(parameters or {})
+        with self._lock:
+            self.requests.append((path, parameters))
+        if path not in self.routes:
+            raise AssertionError(f"Unexpected request to {path}")
+        route = self.routes[path]
+        return route(parameters) if callable(route) else route
+
+    def call(
+        self,
+        request_type: RequestType,
+        path: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        self._enter()
+        try:
+            time.sleep(self.latency)
+            return self._respond(path, parameters)
+        finally:
+            self._exit()
+
+    async def acall(
+        self,
+        request_type: RequestType,
+        path: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        self._enter()
+        try:
+            await asyncio.sleep(self.latency)
+            return self._respond(path, parameters)
+        finally:
+            self._exit()
+
+    def call_raw(
+        self,
+        request_type: RequestType,
+        path: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        return json.dumps(self.call(request_type, path, parameters=parameters, data=data)).encode("utf-8")
+
+    async def acall_raw(
+        self,
+        request_type: RequestType,
+        path: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        return json.dumps(await self.acall(request_type, path, parameters=parameters, data=data)).encode("utf-8")
+
+
+def paginated(items: List[Dict[str, Any]], default_page_size: int = 100) -> Handler:
+    """Build a handler serving `items` the way Lightdash paginates organization listings"""
+
+    def handler(parameters: Dict[str, Any]) -> Dict[str, Any]:
+        page = int(parameters.get("page", 1))
+        page_size = int(parameters.get("pageSize", default_page_size))
+        start = (page - 1) * page_size
+        return {
+            "status": "ok",
+            "results": {
+                "pagination": {
+                    "page": page,
+                    "pageSize": page_size,
+                    "totalResults": len(items),
+                    "totalPageCount": max(1, math.ceil(len(items) / page_size)),
+                },
+                "data": items[start:start + page_size],
+            },
+        }
+
+    return handler
+
+
+def failing(status_code: int) -> Handler:
+    """Build a handler answering every request with an error status"""
+
+    def handler(parameters: Dict[str, Any]) -> Dict[str, Any]:
+        request = httpx.Request("GET", "https://lightdash.example.com")
+        raise httpx.HTTPStatusError("Error", request=request, response=httpx.Response(status_code, request=request))
+
+    return handler
@@ -0,0 +1,73 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Any, Dict
+
+from lightdash_ai_tools.lightdash.cache import ApiResponseCache
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+EMPTY_PAGE = {
+    "status": "ok",
+    "results": {"pagination": {"page": 1, "pageSize": 100, "totalResults": 0, "totalPageCount": 1}, "data": []},
+}
+
+
+def project_routes(project_uuid: str, explores: Dict[str, Any]) -> Dict[str, Any]:
+    """Routes of a project whose explores are keyed by name, with a route or None for explores that don't exist"""
+    routes = {
+        f"/api/v1/projects/{project_uuid}": {
+            "status": "ok",
+            "results": {"name": "Project", "projectUuid": project_uuid, "organizationUuid": "org-1"},
+        },
+        f"/api/v1/projects/{project_uuid}/access": {"status": "ok", "results": []},
+        f"/api/v1/projects/{project_uuid}/explores": {
+            "status": "ok",
+            "results": [{"name": name, "type": "default"} for name in explores],
+        },
+    }
+    for name, route in explores.items():
+        if route is not None:
+            routes[f"/api/v1/projects/{project_uuid}/explores/{name}"] = route
+    return routes
+
+
+def build_organization_client(*project_uuids: str) -> FakeLightdashClient:
+    """
+    Cached client of an organization without members and groups.
+
+    Every project has an `orders` explore and a `broken` explore that can't be fetched.
+    """
+    project_uuids = project_uuids or ("project-1",)
+    routes: Dict[str, Any] = {
+        "/api/v1/org/projects": {
+            "status": "ok",
+            "results": [
+                {
+                    "warehouseType": "bigquery",
+                    "upstreamProjectUuid": None,
+                    "createdByUserUuid": None,
+                    "type": "DEFAULT",
+                    "name": "Project",
+                    "projectUuid": project_uuid,
+                }
+                for project_uuid in project_uuids
+            ],
+        },
+        "/api/v1/org/users": EMPTY_PAGE,
+        "/api/v1/org/groups": EMPTY_PAGE,
+    }
+    for project_uuid in project_uuids:
+        routes.update(project_routes(project_uuid, {"orders": {"status": "ok", "results": {"name": "orders"}}, "broken": None}))
+    return FakeLightdashClient(cache=ApiResponseCache(), routes=routes)
@@ -0,0 +1,93 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.models.compact import (
+    CompactGroup,
+    CompactMember,
+)
+from lightdash_ai_tools.lightdash.services.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1Service,
+)
+from lightdash_ai_tools.lightdash.services.list_organization_members_v1 import (
+    ListOrganizationMembersV1Service,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+from tests.lightdash.services.test_list_groups_in_organization_v1 import (
+    GROUPS_PATH,
+    build_groups,
+)
+from tests.lightdash.services.test_list_organization_members_v1 import (
+    MEMBERS_PATH,
+    build_members,
+)
+
+
+class TestCompactMember(unittest.TestCase):
+    def setUp(self):
+        client = FakeLightdashClient(routes={MEMBERS_PATH: paginated(build_members(25))})
+        self.service = ListOrganizationMembersV1Service(lightdash_client=client)
+
+    def test_round_trip(self):
+        members = self.service.get_all_members(page_size=10)
+        records = self.service.get_all_members_compact(page_size=10)
+
+        self.assertEqual([record.to_model() for record in records], members)
+        self.assertEqual(records[3].email.get_secret_value(), "user-3@example.com")
+
+    def test_has_no_instance_dictionary(self):
+        record = self.service.get_all_members_compact(page_size=10)[0]
+
+        self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.nickname = "nick"
+
+    def test_shares_repeated_strings(self):
+        records = self.service.get_all_members_compact(page_size=10)
+
+        self.assertIs(records[1].role, records[2].role)
+        self.assertIs(records[1].organizationUuid, records[24].organizationUuid)
+
+    def test_repr_hides_email(self):
+        record = self.service.get_all_members_compact(page_size=10)[0]
+
+        self.assertNotIn("example.com", repr(record))
+
+    def test_async(self):
+        records = asyncio.run(self.service.aget_all_members_compact(page_size=10))
+
+        self.assertEqual([record.userUuid for record in records], [f"user-{index}" for index in range(25)])
+        self.assertIsInstance(records[0], CompactMember)
+
+
+class TestCompactGroup(unittest.TestCase):
+    def setUp(self):
+        client = FakeLightdashClient(routes={GROUPS_PATH: paginated(build_groups(30))})
+        self.service = ListGroupsInOrganizationV1Service(lightdash_client=client)
+
+    def test_round_trip(self):
+        groups = self.service.get_all_groups(page_size=20)
+        records = self.service.get_all_groups_compact(page_size=20)
+
+        self.assertEqual([record.to_model() for record in records], groups)
+        self.assertIs(records[1].createdByUserUuid, records[3].createdByUserUuid)
+
+    def test_async(self):
+        records = asyncio.run(self.service.get_all_groups_compact_async(page_size=20))
+
+        self.assertEqual([record.uuid for record in records], [f"group-{index}" for index in range(30)])
+        self.assertIsInstance(records[0], CompactGroup)
@@ -0,0 +1,104 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import pickle
+import sys
+import unittest
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import (
+    _RESPONSE_ADAPTER,
+    parse_explore_summary,
+)
+from lightdash_ai_tools.lightdash.models.explore_summary import ExploreSummary
+
+
+def build_body() -> bytes:
+    fields = {}
+    for index, table in enumerate(["orders", "customers"] * 2):
+        fields[f"{table}_column_{index}"] = {
+            "name": f"column_{index}",
+            "label": f"Column {index}",
+            "table": table,
+            "tableLabel": table.title(),
+            "fieldType": "dimension",
+            "type": "string",
+            "description": f"Value of column {index}.",
+            "sql": f"${{TABLE}}.column_{index}",
+            "compiledSql": f'"{table}".column_{index}',
+            "source": {"path": f"models/{table}.yml", "content": "version: 2"},
+            "hidden": index == 3,
+        }
+    return json.dumps({
+        "status": "ok",
+        "results": {
+            "name": "orders",
+            "label": "Orders",
+            "baseTable": "orders",
+            "tags": ["finance"],
+            "tables": {
+                "orders": {"name": "orders", "label": "Orders", "source": {"content": "version: 2"}},
+                "customers": {"name": "customers", "label": "Customers", "description": "One row per customer."},
+            },
+            "joinedTables": [{"table": "customers", "sqlOn": "1 = 1", "type": "left", "compiledSqlOn": "1 = 1"}],
+            "dimensions": fields,
+            "metrics": {
+                "orders_count": {"name": "count", "table": "orders", "fieldType": "metric", "type": "count", "compiledSql": "COUNT(*)"},
+            },
+            "lineageGraph": {"orders": []},
+            "compiledSql": "SELECT 1",
+        },
+    }).encode("utf-8")
+
+
+class TestExploreSummary(unittest.TestCase):
+    def test_keeps_what_the_catalog_reads(self):
+        body = build_body()
+        explore = _RESPONSE_ADAPTER.validate_json(body).results
+
+        model = parse_explore_summary(body).to_model()
+
+        self.assertEqual((model.name, model.label, model.baseTable, model.tags), ("orders", "Orders", "orders", ["finance"]))
+        self.assertEqual(model.tables["customers"].description, "One row per customer.")
+        self.assertEqual(model.joinedTables[0].sqlOn, "1 = 1")
+        self.assertIsNone(model.joinedTables[0].compiledSqlOn)
+        self.assertIsNone(model.lineageGraph)
+        for field_id, field in explore.dimensions.items():
+            summarized = model.dimensions[field_id]
+            self.assertEqual(
+                (summarized.reference, summarized.label, summarized.type, summarized.description, summarized.sql, summarized.hidden),
+                (field.reference, field.label, field.type, field.description, field.sql, field.hidden),
+            )
+            self.assertIsNone(summarized.compiledSql)
+        self.assertEqual(model.get_metric("orders_count").type, "count")
+
+    def test_round_trips_through_pickle(self):
+        summary = parse_explore_summary(build_body())
+
+        copy = pickle.loads(pickle.dumps(summary))
+
+        self.assertEqual(copy, summary)
+        self.assertIsInstance(copy, ExploreSummary)
+        self.assertIs(copy.dimensions[0].table, sys.intern("orders"))
+
+    def test_interns_repeated_strings(self):
+        summary = parse_explore_summary(build_body())
+
+        self.assertIs(summary.dimensions[0].table, summary.dimensions[2].table)
+        self.assertIs(summary.dimensions[0].fieldType, summary.dimensions[1].fieldType)
+
+    def test_invalid_response(self):
+        with self.assertRaisesRegex(ValueError, "Invalid response from Lightdash API"):
+            parse_explore_summary(b'{"status": "ok", "results": {"dimensions": []}}')
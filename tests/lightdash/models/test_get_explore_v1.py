@@ -15,7 +15,11 @@
 
 import unittest
 
-from lightdash_ai_tools.lightdash.models.get_explore_v1 import Dimension, Metric
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Results,
+    Metric,
+)
 
 
 class TestDimension(unittest.TestCase):
@@ -47,3 +51,85 @@ class TestMetric(unittest.TestCase):
             "reference": "orders_num_unique_order_ids",
         }
         self.assertDictEqual(result, expected)
+
+
+class TestGetExploreV1Results(unittest.TestCase):
+    def setUp(self):
+        self.explore = GetExploreV1Results.model_validate({
+            "name": "orders",
+            "dimensions": {
+                "orders_order_id": {"table": "orders", "name": "order_id"},
+                "customers_region": {"table": "customers", "name": "region"},
+            },
+            "metrics": {
+                "orders_count": {"table": "orders", "name": "count"},
+                "legacy_revenue": {"table": "orders", "name": "revenue"},
+            },
+        })
+
+    def test_references_follow_copies_and_assignments(self):
+        dimension = self.explore.dimensions["customers_region"]
+        self.assertEqual(dimension.reference, "customers_region")
+        self.assertEqual(dimension, Dimension(table="customers", name="region"))
+        self.assertIsNone(Dimension(name="order_id").reference)
+
+        copied = dimension.model_copy(update={"name": "country"})
+        self.assertEqual(copied.reference, "customers_country")
+        self.assertEqual(copied.model_dump(exclude_unset=True)["reference"], "customers_country")
+        self.assertEqual(dimension.reference, "customers_region")
+
+        metric = self.explore.metrics["orders_count"].model_copy()
+        metric.table = "payments"
+        self.assertEqual(metric.reference, "payments_count")
+        metric.name = None
+        self.assertIsNone(metric.reference)
+
+    def test_index_follows_copies_and_assignments(self):
+        self.assertIsNotNone(self.explore.get_field("orders_order_id"))
+        self.assertEqual(self.explore, self.explore.model_copy(deep=True))
+        shipped_at = Dimension(table="orders", name="shipped_at")
+
+        copied = self.explore.model_copy(update={"dimensions": {"orders_shipped_at": shipped_at}})
+        self.assertIs(copied.get_field("orders_shipped_at"), shipped_at)
+        self.assertIsNone(copied.get_field("orders_order_id"))
+        self.assertIsNotNone(copied.get_metric("orders_count"))
+        self.assertIsNone(self.explore.get_field("orders_shipped_at"))
+
+        deep_copy = self.explore.model_copy(deep=True)
+        self.assertIs(deep_copy.get_field("orders_order_id"), deep_copy.dimensions["orders_order_id"])
+
+        self.explore.dimensions["orders_shipped_at"] = shipped_at
+        self.assertIs(self.explore.get_field("orders_shipped_at"), shipped_at)
+        del self.explore.dimensions["orders_shipped_at"]
+        self.assertIsNone(self.explore.get_field("orders_shipped_at"))
+
+        self.explore.metrics = {}
+        self.assertIsNone(self.explore.get_metric("orders_count"))
+        self.assertIsNotNone(self.explore.get_dimension("orders_order_id"))
+
+    def test_get_field(self):
+        self.assertIs(self.explore.get_field("orders_order_id"), self.explore.dimensions["orders_order_id"])
+        self.assertIs(self.explore.get_field("orders_count"), self.explore.metrics["orders_count"])
+        self.assertIs(self.explore.get_field("orders_revenue"), self.explore.metrics["legacy_revenue"])
+        self.assertIs(self.explore.get_field("legacy_revenue"), self.explore.metrics["legacy_revenue"])
+        self.assertIsNone(self.explore.get_field("orders_missing"))
+
+    def test_get_field_by_kind(self):
+        self.assertIsNotNone(self.explore.get_dimension("orders_order_id"))
+        self.assertIsNone(self.explore.get_dimension("orders_count"))
+        self.assertIsNotNone(self.explore.get_metric("orders_count"))
+        self.assertIsNone(self.explore.get_metric("orders_order_id"))
+
+    def test_find_unknown_fields(self):
+        unknown_fields = self.explore.find_unknown_fields(
+            dimensions=["orders_order_id", "orders_count", "orders_status"],
+            metrics=["orders_revenue", "customers_region"],
+        )
+
+        self.assertEqual(unknown_fields, ["orders_count", "orders_status", "customers_region"])
+
+    def test_explore_without_fields(self):
+        explore = GetExploreV1Results(name="empty")
+
+        self.assertIsNone(explore.get_field("orders_order_id"))
+        self.assertEqual(explore.find_unknown_fields(dimensions=["orders_order_id"]), ["orders_order_id"])
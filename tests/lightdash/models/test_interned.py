@@ -0,0 +1,84 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    GetExploreV1Response,
+)
+from lightdash_ai_tools.lightdash.models.interned import InternedStr
+from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
+    OrganizationMemberModel,
+)
+from tests.lightdash.models.test_slim_explore import build_response
+from tests.lightdash.services.test_list_organization_members_v1 import (
+    build_members,
+)
+
+
+def fresh(value: str) -> str:
+    """Copy of a string that isn't the same object."""
+    return "".join(list(value))
+
+
+class Labels(BaseModel):
+    label: Optional[InternedStr] = None
+    groups: Optional[List[InternedStr]] = None
+
+
+class TestInternedStr(unittest.TestCase):
+    def test_interns_python_values(self):
+        first = Labels.model_validate({"label": fresh("orders"), "groups": [fresh("kpis")]})
+        second = Labels.model_validate({"label": fresh("orders"), "groups": [fresh("kpis")]})
+
+        self.assertIs(first.label, second.label)
+        self.assertIs(first.groups[0], second.groups[0])
+
+    def test_validates_json_as_plain_strings(self):
+        labels = Labels.model_validate_json('{"label": "orders", "groups": ["kpis"]}')
+
+        self.assertEqual(labels, Labels(label="orders", groups=["kpis"]))
+        self.assertEqual(labels.model_dump_json(), '{"label":"orders","groups":["kpis"]}')
+        self.assertEqual(Labels.model_json_schema()["properties"]["label"]["anyOf"][0], {"type": "string"})
+
+    def test_rejects_non_strings(self):
+        with self.assertRaises(ValueError):
+            Labels.model_validate({"label": 3})
+
+    def test_explore_fields_share_strings(self):
+        document = build_response(20)
+        for field in [*document["results"]["dimensions"].values(), *document["results"]["metrics"].values()]:
+            for key in ("table", "tableLabel", "fieldType", "type"):
+                if field.get(key) is not None:
+                    field[key] = fresh(field[key])
+
+        explore = GetExploreV1Response.model_validate(document).results
+        fields = [*explore.dimensions.values(), *explore.metrics.values()]
+
+        for key in ("table", "tableLabel", "fieldType", "type"):
+            values = [getattr(field, key) for field in fields if getattr(field, key) is not None]
+            self.assertEqual(len({id(value) for value in values}), len(set(values)), key)
+
+    def test_member_fields_share_strings(self):
+        members = [
+            OrganizationMemberModel.model_validate({**member, "role": fresh(member["role"]), "organizationUuid": fresh("org-1")})
+            for member in build_members(20)
+        ]
+
+        self.assertEqual(len({id(member.role) for member in members}), 2)
+        self.assertEqual(len({id(member.organizationUuid) for member in members}), 1)
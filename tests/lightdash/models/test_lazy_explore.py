@@ -0,0 +1,82 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import (
+    GetExploreV1,
+    GetLazyExploreV1,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+EXPLORE_PATH = "/api/v1/projects/project-1/explores/orders"
+
+
+def build_response(num_fields: int) -> dict:
+    return {
+        "status": "ok",
+        "results": {
+            "name": "orders",
+            "label": "Orders",
+            "baseTable": "orders",
+            "lineageGraph": {"orders": []},
+            "tables": {"orders": {"name": "orders", "label": "Orders", "sqlTable": "orders"}},
+            "joinedTables": [{"table": "customers", "type": "left", "sqlOn": "orders.customer_id = customers.id"}],
+            "dimensions": {
+                f"orders_dimension_{index}": {"name": f"dimension_{index}", "table": "orders", "type": "string"}
+                for index in range(num_fields)
+            },
+            "metrics": {"orders_count": {"name": "count", "table": "orders", "type": "count"}},
+        },
+    }
+
+
+class TestLazyExplore(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeLightdashClient(routes={EXPLORE_PATH: build_response(100)})
+
+    def test_field_ids_without_validation(self):
+        explore = GetLazyExploreV1(lightdash_client=self.client).call("project-1", "orders").results
+
+        self.assertEqual(explore.label, "Orders")
+        self.assertEqual(len(explore.field_ids()), 101)
+        self.assertIn("orders_count", explore.metrics)
+        self.assertEqual(explore.dimensions.validated_count, 0)
+        self.assertEqual(explore.metrics.validated_count, 0)
+
+    def test_fields_validated_on_first_access(self):
+        explore = GetLazyExploreV1(lightdash_client=self.client).call("project-1", "orders").results
+
+        dimension = explore.dimensions["orders_dimension_7"]
+        self.assertEqual(dimension.reference, "orders_dimension_7")
+        self.assertIs(explore.dimensions["orders_dimension_7"], dimension)
+        self.assertEqual(explore.dimensions.validated_count, 1)
+        self.assertEqual(explore.tables["orders"].sqlTable, "orders")
+        self.assertEqual(explore.joinedTables[0].table, "customers")
+
+    def test_invalid_field(self):
+        response = build_response(1)
+        response["results"]["dimensions"]["orders_dimension_0"]["index"] = "first"
+        explore = GetLazyExploreV1(lightdash_client=self.client)._parse_response(json.dumps(response).encode("utf-8")).results
+
+        self.assertEqual(explore.field_ids(), ["orders_dimension_0", "orders_count"])
+        with self.assertRaises(ValueError):
+            explore.dimensions["orders_dimension_0"]
+
+    def test_to_results_matches_eager_parsing(self):
+        lazy = GetLazyExploreV1(lightdash_client=self.client).call("project-1", "orders").results
+        eager = GetExploreV1(lightdash_client=self.client).call("project-1", "orders").results
+
+        self.assertEqual(lazy.to_results(), eager)
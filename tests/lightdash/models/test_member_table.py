@@ -0,0 +1,114 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.models.member_table import (
+    DictionaryColumn,
+    MemberTable,
+)
+from lightdash_ai_tools.lightdash.services.list_organization_members_v1 import (
+    ListOrganizationMembersV1Service,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+from tests.lightdash.services.test_list_organization_members_v1 import (
+    MEMBERS_PATH,
+    build_members,
+)
+
+
+class TestDictionaryColumn(unittest.TestCase):
+    def test_encodes_distinct_values(self):
+        column = DictionaryColumn(["viewer", "admin", "viewer", "editor"])
+
+        self.assertEqual(column.dictionary, ["viewer", "admin", "editor"])
+        self.assertEqual(list(column.codes), [0, 1, 0, 2])
+        self.assertEqual(column[3], "editor")
+        self.assertEqual(column.bitmap("viewer"), 0b0101)
+        self.assertEqual(column.bitmap(["admin", "editor"]), 0b1010)
+        self.assertEqual(column.bitmap("owner"), 0)
+
+    def test_widens_codes_beyond_256_values(self):
+        values = [f"value-{index % 300}" for index in range(600)]
+        column = DictionaryColumn(values)
+
+        self.assertEqual(column.codes.typecode, "I")
+        self.assertEqual([column[index] for index in range(600)], values)
+        self.assertEqual(column.bitmap("value-299"), (1 << 299) | (1 << 599))
+
+
+class TestMemberTable(unittest.TestCase):
+    def setUp(self):
+        client = FakeLightdashClient(routes={MEMBERS_PATH: paginated(build_members(250))})
+        self.service = ListOrganizationMembersV1Service(lightdash_client=client)
+        self.members = self.service.get_all_members(page_size=100)
+        self.table = self.service.get_member_table(page_size=100)
+
+    def expected(self, predicate) -> list:
+        return [member.userUuid for member in self.members if predicate(member)]
+
+    def test_count(self):
+        self.assertEqual(len(self.table), 250)
+        self.assertEqual(self.table.count(), 250)
+        self.assertEqual(
+            self.table.count(role="admin", is_active=True),
+            len(self.expected(lambda member: member.role == "admin" and member.isActive)),
+        )
+        self.assertEqual(self.table.count(organization_uuid="org-2"), 0)
+
+    def test_filter(self):
+        self.assertEqual(
+            self.table.filter(role=["admin", "viewer"], is_active=False),
+            self.expected(lambda member: not member.isActive),
+        )
+        self.assertEqual(
+            self.table.filter(role="admin", is_pending=True),
+            self.expected(lambda member: member.role == "admin" and member.isPending),
+        )
+        self.assertEqual(self.table.filter(is_pending=False), [])
+
+    def test_select_combined_bitmaps(self):
+        mask = self.table.where(role="admin") | self.table.where(is_active=False)
+
+        self.assertEqual(
+            self.table.select(mask),
+            self.expected(lambda member: member.role == "admin" or not member.isActive),
+        )
+
+    def test_count_by_role(self):
+        self.assertEqual(
+            self.table.count_by_role(is_active=True),
+            {
+                "admin": len(self.expected(lambda member: member.role == "admin" and member.isActive)),
+                "viewer": len(self.expected(lambda member: member.role == "viewer" and member.isActive)),
+            },
+        )
+
+    def test_from_models(self):
+        table = MemberTable(self.members)
+
+        self.assertEqual(table.filter(role="admin"), self.table.filter(role="admin"))
+
+    def test_async(self):
+        table = asyncio.run(self.service.aget_member_table(page_size=100))
+
+        self.assertEqual(table.count(is_active=True), self.table.count(is_active=True))
+
+    def test_empty(self):
+        table = MemberTable([])
+
+        self.assertEqual(table.count(role="admin"), 0)
+        self.assertEqual(table.filter(), [])
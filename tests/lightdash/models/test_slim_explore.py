@@ -0,0 +1,133 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import (
+    GetExploreV1,
+    GetSlimExploreV1,
+)
+from lightdash_ai_tools.lightdash.cache import ApiResponseCache
+from lightdash_ai_tools.lightdash.memory import estimate_size
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    Dimension,
+    GetExploreV1Results,
+)
+from lightdash_ai_tools.lightdash.models.slim_explore import (
+    ExploreParseProfile,
+    slim_explore_response_model,
+)
+from lightdash_ai_tools.lightdash.services.project_catalog import ProjectCatalogService
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+EXPLORE_PATH = "/api/v1/projects/project-1/explores/orders"
+SOURCE_CONTENT = "      - name: column\n        description: A column of the table.\n" * 20
+
+
+def build_response(num_fields: int) -> dict:
+    return {
+        "status": "ok",
+        "results": {
+            "name": "orders",
+            "label": "Orders",
+            "compiledSql": "SELECT 1",
+            "lineageGraph": {"orders": [{"type": "model", "name": f"stg_{index}"} for index in range(50)]},
+            "tables": {
+                "orders": {
+                    "name": "orders",
+                    "sqlTable": "orders",
+                    "source": {"path": "models/orders.yml", "content": SOURCE_CONTENT * 10},
+                    "lineageGraph": {"orders": []},
+                },
+            },
+            "joinedTables": [{"table": "customers", "sqlOn": "1 = 1", "compiledSqlOn": "SELECT 1"}],
+            "dimensions": {
+                f"orders_dimension_{index}": {
+                    "name": f"dimension_{index}",
+                    "table": "orders",
+                    "label": f"Dimension {index}",
+                    "sql": f"${{TABLE}}.column_{index}",
+                    "compiledSql": f"CAST(\"orders\".column_{index} AS STRING)" * 5,
+                    "source": {"path": "models/orders.yml", "content": SOURCE_CONTENT},
+                    "urls": [{"label": "Open", "url": "https://example.com"}],
+                }
+                for index in range(num_fields)
+            },
+            "metrics": {"orders_count": {"name": "count", "table": "orders", "compiledSql": "COUNT(*)"}},
+        },
+    }
+
+
+class TestSlimExplore(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeLightdashClient(routes={EXPLORE_PATH: build_response(200)})
+
+    def test_drops_heavy_keys(self):
+        explore = GetSlimExploreV1(lightdash_client=self.client).call("project-1", "orders").results
+
+        self.assertIsInstance(explore, GetExploreV1Results)
+        self.assertIsNone(explore.lineageGraph)
+        self.assertIsNone(explore.compiledSql)
+        self.assertIsNone(explore.tables["orders"].source.content)
+        self.assertEqual(explore.tables["orders"].source.path, "models/orders.yml")
+        self.assertFalse(explore.tables["orders"].model_extra)
+        self.assertIsNone(explore.joinedTables[0].compiledSqlOn)
+        self.assertEqual(explore.joinedTables[0].sqlOn, "1 = 1")
+
+        dimension = explore.dimensions["orders_dimension_3"]
+        self.assertIsInstance(dimension, Dimension)
+        self.assertIsNone(dimension.compiledSql)
+        self.assertFalse(dimension.model_extra)
+        self.assertEqual(dimension.sql, "${TABLE}.column_3")
+        self.assertEqual(dimension.reference, "orders_dimension_3")
+        self.assertNotIn("compiledSql", dimension.model_dump())
+
+    def test_reduces_retained_memory(self):
+        body = json.dumps(build_response(200)).encode("utf-8")
+        full = GetExploreV1(lightdash_client=self.client)._parse_response(body)
+        slim = GetSlimExploreV1(lightdash_client=self.client)._parse_response(body)
+
+        self.assertLess(estimate_size(slim), estimate_size(full) / 2)
+
+    def test_custom_profile(self):
+        profile = ExploreParseProfile(field_keys=frozenset({"compiledSql", "sql"}), explore_keys=frozenset({"tables"}))
+        explore = GetSlimExploreV1(lightdash_client=self.client, profile=profile).call("project-1", "orders").results
+
+        self.assertIsNone(explore.tables)
+        self.assertIsNone(explore.dimensions["orders_dimension_0"].sql)
+        self.assertEqual(explore.lineageGraph["orders"][0]["name"], "stg_0")
+        self.assertIs(slim_explore_response_model(profile), slim_explore_response_model(profile))
+
+    def test_profiles_cached_apart(self):
+        self.client.cache = ApiResponseCache()
+        slim = GetSlimExploreV1(lightdash_client=self.client).call("project-1", "orders").results
+        full = GetExploreV1(lightdash_client=self.client).call("project-1", "orders").results
+        custom = GetSlimExploreV1(lightdash_client=self.client, profile=ExploreParseProfile(field_keys=frozenset())).call("project-1", "orders").results
+
+        self.assertIsNone(slim.dimensions["orders_dimension_0"].compiledSql)
+        self.assertIsNotNone(full.dimensions["orders_dimension_0"].compiledSql)
+        self.assertIsNotNone(custom.dimensions["orders_dimension_0"].compiledSql)
+        self.assertEqual(len(self.client.requests), 3)
+
+    def test_catalog_with_profile(self):
+        routes = {
+            "/api/v1/projects/project-1/explores": {"status": "ok", "results": [{"name": "orders", "type": "default"}]},
+            EXPLORE_PATH: build_response(10),
+        }
+        client = FakeLightdashClient(routes=routes)
+        catalog = ProjectCatalogService(lightdash_client=client, explore_profile=ExploreParseProfile()).build("project-1")
+
+        self.assertEqual(catalog.get_field("orders", "orders_dimension_1").label, "Dimension 1")
+        self.assertIsNone(catalog.get_explore("orders").lineageGraph)
@@ -0,0 +1,39 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import GetExploreV1
+from lightdash_ai_tools.lightdash.services.cache_warmer import CacheWarmer
+from tests.lightdash.fake_organization import build_organization_client
+
+
+class TestCacheWarmer(unittest.TestCase):
+    def test_awarm(self):
+        client = build_organization_client()
+        progress = []
+        warmer = CacheWarmer(lightdash_client=client, max_concurrency=2, on_progress=progress.append)
+
+        summary = asyncio.run(warmer.awarm())
+
+        self.assertEqual(summary.projects, 1)
+        self.assertEqual(summary.fetched, 7)
+        self.assertEqual(summary.failed, 1)
+        self.assertEqual(len(progress), 8)
+        self.assertEqual([item.resource for item in progress if item.error], ["projects/project-1/explores/broken"])
+
+        requests_before = len(client.requests)
+        GetExploreV1(lightdash_client=client).call("project-1", "orders")
+        self.assertEqual(len(client.requests), requests_before)
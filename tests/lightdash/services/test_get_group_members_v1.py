@@ -0,0 +1,104 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.common.tools.get_group_members import GetGroupMembers
+from lightdash_ai_tools.lightdash.services.get_group_members_v1 import (
+    GetGroupMembersV1Service,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+GROUP_UUID = "group-1"
+GROUP_PATH = f"/api/v1/groups/{GROUP_UUID}"
+
+
+def group_with_members(count: int):
+    """Handler serving a group's members by offset, the way Lightdash does"""
+    members = [
+        {"userUuid": f"user-{index}", "firstName": "First", "lastName": f"Last {index}", "role": "member"}
+        for index in range(count)
+    ]
+
+    def handler(parameters):
+        limit = int(parameters.get("includeMembers", 0))
+        offset = int(parameters.get("offset", 0))
+        page = members[offset:offset + limit]
+        return {
+            "status": "ok",
+            "results": {
+                "organizationUuid": "organization-1",
+                "name": "Group",
+                "uuid": GROUP_UUID,
+                "memberUuids": [member["userUuid"] for member in page],
+                "members": page,
+            },
+        }
+
+    return handler
+
+
+def build_client(count: int, latency: float = 0.0) -> FakeLightdashClient:
+    return FakeLightdashClient(routes={GROUP_PATH: group_with_members(count)}, latency=latency)
+
+
+class TestGetGroupMembersV1Service(unittest.TestCase):
+    def test_get_all_members_fans_out(self):
+        client = build_client(1050, latency=0.01)
+        members = GetGroupMembersV1Service(lightdash_client=client).get_all_members(GROUP_UUID, page_size=100, max_concurrency=4)
+
+        self.assertEqual([member.userUuid for member in members], [f"user-{index}" for index in range(1050)])
+        self.assertEqual(client.max_in_flight, 4)
+        self.assertEqual(client.requests[0][1], {"includeMembers": 100, "offset": 0})
+        self.assertIn({"includeMembers": 100, "offset": 1000}, [parameters for _, parameters in client.requests])
+
+    def test_aget_all_members_exact_multiple(self):
+        client = build_client(300)
+        members = asyncio.run(GetGroupMembersV1Service(lightdash_client=client).aget_all_members(GROUP_UUID, page_size=100, max_concurrency=2))
+
+        self.assertEqual(len({member.userUuid for member in members}), 300)
+
+    def test_get_all_members_with_max_results(self):
+        client = build_client(1050)
+        members = GetGroupMembersV1Service(lightdash_client=client).get_all_members(GROUP_UUID, page_size=100, max_results=150)
+
+        self.assertEqual(len(members), 150)
+        self.assertEqual(
+            [parameters for _, parameters in client.requests],
+            [{"includeMembers": 100, "offset": 0}, {"includeMembers": 100, "offset": 100}],
+        )
+
+    def test_aiter_members(self):
+        async def collect():
+            service = GetGroupMembersV1Service(lightdash_client=build_client(250))
+            return [member.userUuid async for member in service.aiter_members(GROUP_UUID, page_size=100)]
+
+        self.assertEqual(asyncio.run(collect()), [f"user-{index}" for index in range(250)])
+
+
+class TestGetGroupMembers(unittest.TestCase):
+    def test_call_truncates(self):
+        output = GetGroupMembers(lightdash_client=build_client(250)).call(group_uuid=GROUP_UUID, max_members=120)
+
+        self.assertEqual(len(output.members), 120)
+        self.assertTrue(output.truncated)
+        self.assertEqual(output.members[0].name, "First Last 0")
+
+    def test_acall_returns_every_member(self):
+        output = asyncio.run(GetGroupMembers(lightdash_client=build_client(30)).acall(group_uuid=GROUP_UUID, max_members=100))
+
+        self.assertEqual(len(output.members), 30)
+        self.assertFalse(output.truncated)
+
@@ -0,0 +1,95 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.services.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1Service,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+
+GROUPS_PATH = "/api/v1/org/groups"
+
+
+def build_groups(count: int) -> list:
+    return [
+        {
+            "organizationUuid": "org-1",
+            "name": f"Group {index}",
+            "uuid": f"group-{index}",
+            "createdByUserUuid": "user-1" if index % 2 else "user-2",
+        }
+        for index in range(count)
+    ]
+
+
+def build_client(count: int, latency: float = 0.0) -> FakeLightdashClient:
+    return FakeLightdashClient(routes={GROUPS_PATH: paginated(build_groups(count))}, latency=latency)
+
+
+class TestListGroupsInOrganizationV1Service(unittest.TestCase):
+    def test_get_all_groups(self):
+        client = build_client(120)
+        groups = ListGroupsInOrganizationV1Service(lightdash_client=client).get_all_groups(page_size=50)
+
+        self.assertEqual([group.uuid for group in groups], [f"group-{index}" for index in range(120)])
+        self.assertEqual(len(client.requests), 3)
+
+    def test_get_all_groups_fans_out(self):
+        client = build_client(300, latency=0.01)
+        service = ListGroupsInOrganizationV1Service(lightdash_client=client)
+
+        groups = service.get_all_groups(page_size=25, max_concurrency=4)
+
+        self.assertEqual([group.uuid for group in groups], [f"group-{index}" for index in range(300)])
+        self.assertEqual(client.max_in_flight, 4)
+
+    def test_get_all_groups_async_fans_out(self):
+        client = build_client(300, latency=0.01)
+        service = ListGroupsInOrganizationV1Service(lightdash_client=client)
+
+        groups = asyncio.run(service.get_all_groups_async(page_size=25, max_concurrency=4))
+
+        self.assertEqual([group.uuid for group in groups], [f"group-{index}" for index in range(300)])
+        self.assertEqual(client.max_in_flight, 4)
+        self.assertEqual(client.requests[0][1], {"page": 1, "pageSize": 25})
+
+    def test_aiter_groups_stops_early(self):
+        async def first_groups(service, count):
+            groups = []
+            async for group in service.aiter_groups(page_size=10, prefetch=True):
+                groups.append(group)
+                if len(groups) == count:
+                    break
+            return groups
+
+        client = build_client(100)
+        groups = asyncio.run(first_groups(ListGroupsInOrganizationV1Service(lightdash_client=client), 5))
+
+        self.assertEqual([group.uuid for group in groups], [f"group-{index}" for index in range(5)])
+        self.assertLessEqual(len(client.requests), 2)
+
+    def test_max_results_stops_early(self):
+        client = build_client(1000)
+        service = ListGroupsInOrganizationV1Service(lightdash_client=client)
+
+        groups = service.get_all_groups(page_size=100, max_results=150)
+        self.assertEqual([group.uuid for group in groups], [f"group-{index}" for index in range(150)])
+        self.assertEqual(len(client.requests), 2)
+
+        client.requests.clear()
+        groups = asyncio.run(service.get_all_groups_async(max_results=30))
+        self.assertEqual(len(groups), 30)
+        self.assertEqual(client.requests, [(GROUPS_PATH, {"page": 1, "pageSize": 30})])
@@ -0,0 +1,106 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+import unittest
+
+from lightdash_ai_tools.lightdash.services.list_organization_members_v1 import (
+    ListOrganizationMembersV1Service,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+
+MEMBERS_PATH = "/api/v1/org/users"
+
+
+def build_members(count: int) -> list:
+    return [
+        {
+            "userUuid": f"user-{index}",
+            "userCreatedAt": "2025-01-01T00:00:00Z",
+            "userUpdatedAt": "2025-01-01T00:00:00Z",
+            "firstName": f"First {index}",
+            "lastName": f"Last {index}",
+            "organizationUuid": "org-1",
+            "role": "admin" if index % 10 == 0 else "viewer",
+            "isActive": index % 3 != 0,
+            "email": f"user-{index}@example.com",
+        }
+        for index in range(count)
+    ]
+
+
+def build_client(count: int, latency: float = 0.0) -> FakeLightdashClient:
+    return FakeLightdashClient(routes={MEMBERS_PATH: paginated(build_members(count))}, latency=latency)
+
+
+class TestListOrganizationMembersV1Service(unittest.TestCase):
+    def test_get_all_members(self):
+        client = build_client(250)
+        members = ListOrganizationMembersV1Service(lightdash_client=client).get_all_members(page_size=100)
+
+        self.assertEqual([member.userUuid for member in members], [f"user-{index}" for index in range(250)])
+        self.assertEqual(len(client.requests), 3)
+
+    def test_get_all_members_fans_out(self):
+        client = build_client(1000, latency=0.02)
+        service = ListOrganizationMembersV1Service(lightdash_client=client)
+
+        started_at = time.perf_counter()
+        members = service.get_all_members(page_size=50, max_concurrency=5)
+        elapsed = time.perf_counter() - started_at
+
+        self.assertEqual([member.userUuid for member in members], [f"user-{index}" for index in range(1000)])
+        self.assertEqual(len(client.requests), 20)
+        self.assertEqual(client.max_in_flight, 5)
+        self.assertLess(elapsed, 20 * 0.02)
+
+    def test_aget_all_members_fans_out(self):
+        client = build_client(1000, latency=0.02)
+        service = ListOrganizationMembersV1Service(lightdash_client=client)
+
+        started_at = time.perf_counter()
+        members = asyncio.run(service.aget_all_members(page_size=50, max_concurrency=5))
+        elapsed = time.perf_counter() - started_at
+
+        self.assertEqual([member.userUuid for member in members], [f"user-{index}" for index in range(1000)])
+        self.assertEqual(len(client.requests), 20)
+        self.assertEqual(client.max_in_flight, 5)
+        # 1 + ceil(19 / 5) sequential rounds instead of 20
+        self.assertLess(elapsed, 20 * 0.02)
+
+    def test_iter_members(self):
+        for prefetch in (False, True):
+            client = build_client(250)
+            members = ListOrganizationMembersV1Service(lightdash_client=client).iter_members(page_size=100, prefetch=prefetch)
+
+            first = next(members)
+            self.assertEqual(first.userUuid, "user-0")
+            if prefetch:
+                # The second page is requested in the background.
+                deadline = time.monotonic() + 1
+                while len(client.requests) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.001)
+            self.assertEqual(len(client.requests), 2 if prefetch else 1)
+            self.assertEqual(len(list(members)), 249)
+            self.assertEqual(len(client.requests), 3)
+
+    def test_aiter_members(self):
+        async def collect(service, prefetch):
+            return [member.userUuid async for member in service.aiter_members(page_size=100, prefetch=prefetch)]
+
+        for prefetch in (False, True):
+            client = build_client(250)
+            user_uuids = asyncio.run(collect(ListOrganizationMembersV1Service(lightdash_client=client), prefetch))
+            self.assertEqual(user_uuids, [f"user-{index}" for index in range(250)])
@@ -0,0 +1,99 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.services.list_organization_projects_v1 import (
+    ListOrganizationProjectsV1Service,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+PROJECTS_PATH = "/api/v1/org/projects"
+
+
+def build_projects(count: int) -> list:
+    return [
+        {
+            "warehouseType": "bigquery",
+            "upstreamProjectUuid": None,
+            "createdByUserUuid": None,
+            "type": "DEFAULT",
+            "name": f"Project {index}",
+            "projectUuid": f"project-{index}",
+        }
+        for index in range(count)
+    ]
+
+
+def paged_projects(projects, honor_page=True, honor_page_size=True):
+    """Handler listing projects without reporting the page count"""
+
+    def handler(parameters):
+        if not honor_page_size:
+            return {"status": "ok", "results": projects}
+        page = int(parameters.get("page", 1)) if honor_page else 1
+        page_size = int(parameters["pageSize"])
+        start = (page - 1) * page_size
+        return {"status": "ok", "results": projects[start:start + page_size]}
+
+    return handler
+
+
+def build_client(count: int, latency: float = 0.0, **kwargs) -> FakeLightdashClient:
+    return FakeLightdashClient(routes={PROJECTS_PATH: paged_projects(build_projects(count), **kwargs)}, latency=latency)
+
+
+class TestListOrganizationProjectsV1Service(unittest.TestCase):
+    def test_get_all_projects_fans_out(self):
+        client = build_client(1050, latency=0.01)
+        projects = ListOrganizationProjectsV1Service(lightdash_client=client).get_all_projects(page_size=100, max_concurrency=4)
+
+        self.assertEqual([project.projectUuid for project in projects], [f"project-{index}" for index in range(1050)])
+        self.assertEqual(client.max_in_flight, 4)
+        # 11 pages, then at most one window of speculative requests past the last page
+        self.assertLessEqual(len(client.requests), 11 + 3)
+        self.assertEqual(client.requests[0][1], {"page": 1, "pageSize": 100})
+
+    def test_aget_all_projects_exact_multiple(self):
+        client = build_client(300)
+        projects = asyncio.run(ListOrganizationProjectsV1Service(lightdash_client=client).aget_all_projects(page_size=100, max_concurrency=2))
+
+        self.assertEqual(len(projects), 300)
+        self.assertEqual(len({project.projectUuid for project in projects}), 300)
+
+    def test_server_ignoring_page_size(self):
+        client = build_client(250, honor_page_size=False)
+        projects = ListOrganizationProjectsV1Service(lightdash_client=client).get_all_projects(page_size=100)
+
+        self.assertEqual(len(projects), 250)
+        self.assertEqual(len(client.requests), 1)
+
+    def test_server_ignoring_page(self):
+        client = build_client(250, honor_page=False)
+        projects = ListOrganizationProjectsV1Service(lightdash_client=client).get_all_projects(page_size=50, max_concurrency=4)
+
+        # The repeated first page isn't mistaken for more projects.
+        self.assertEqual([project.projectUuid for project in projects], [f"project-{index}" for index in range(50)])
+        # Speculative pages still queued once the repeat is spotted are cancelled.
+        self.assertLessEqual(len(client.requests), 1 + 4)
+
+    def test_iter_projects(self):
+        client = build_client(250)
+        projects = ListOrganizationProjectsV1Service(lightdash_client=client).iter_projects(page_size=100)
+
+        self.assertEqual(next(projects).projectUuid, "project-0")
+        self.assertEqual(len(client.requests), 1)
+        self.assertEqual(len(list(projects)), 249)
+        self.assertEqual(len(client.requests), 3)
@@ -0,0 +1,113 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import tempfile
+import unittest
+
+from lightdash_ai_tools.lightdash.services.organization_crawler import (
+    GROUPS_TASK,
+    MEMBERS_TASK,
+    PROJECTS_TASK,
+    OrganizationCrawler,
+)
+from lightdash_ai_tools.lightdash.storage.crawl_store import CrawlStore
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+from tests.lightdash.services.test_list_groups_in_organization_v1 import (
+    GROUPS_PATH,
+    build_groups,
+)
+from tests.lightdash.services.test_list_organization_members_v1 import (
+    MEMBERS_PATH,
+    build_members,
+)
+from tests.lightdash.services.test_list_organization_projects_v1 import (
+    PROJECTS_PATH,
+    build_projects,
+    paged_projects,
+)
+
+
+class Crash(Exception):
+    pass
+
+
+def build_client(crash_at_member_page=None) -> FakeLightdashClient:
+    members = paginated(build_members(250))
+
+    def flaky_members(parameters):
+        if parameters["page"] == crash_at_member_page:
+            raise Crash()
+        return members(parameters)
+
+    routes = {
+        MEMBERS_PATH: flaky_members,
+        GROUPS_PATH: paginated(build_groups(30)),
+        PROJECTS_PATH: paged_projects(build_projects(2)),
+    }
+    for index in range(2):
+        routes[f"/api/v1/projects/project-{index}/access"] = {
+            "status": "ok",
+            "results": [{
+                "role": "viewer",
+                "projectUuid": f"project-{index}",
+                "userUuid": "user-1",
+                "email": "user-1@example.com",
+            }],
+        }
+    return FakeLightdashClient(routes=routes)
+
+
+class TestOrganizationCrawler(unittest.TestCase):
+    def test_resumes_after_crash(self):
+        with tempfile.TemporaryDirectory() as directory:
+            client = build_client(crash_at_member_page=3)
+            crawler = OrganizationCrawler(lightdash_client=client, directory=directory, page_size=100)
+            with self.assertRaises(Crash):
+                crawler.crawl()
+            self.assertEqual(crawler.store.task_state(MEMBERS_TASK).next_page, 3)
+
+            # Bytes written after the last checkpoint are dropped on resume.
+            with open(crawler.store.items_path(MEMBERS_TASK), "a", encoding="utf-8") as items_file:
+                items_file.write('{"partial": ')
+
+            client = build_client()
+            progress = []
+            summary = OrganizationCrawler(
+                lightdash_client=client,
+                directory=directory,
+                on_progress=progress.append,
+            ).crawl()
+
+            self.assertEqual(client.requests[0], (MEMBERS_PATH, {"page": 3, "pageSize": 100}))
+            self.assertEqual(summary.resumed_tasks, 1)
+            self.assertEqual(summary.items, 50 + 30 + 2 + 2)
+            self.assertEqual(progress[0].task_items, 250)
+            self.assertGreaterEqual(summary.items_per_second, 0)
+
+            store = CrawlStore(directory)
+            members = list(store.read_items(MEMBERS_TASK))
+            self.assertEqual([member["userUuid"] for member in members], [f"user-{index}" for index in range(250)])
+            self.assertEqual(members[0]["email"], "user-0@example.com")
+            self.assertEqual(len(list(store.read_items(GROUPS_TASK))), 30)
+            self.assertEqual(len(list(store.read_items(PROJECTS_TASK))), 2)
+            self.assertEqual(stat.S_IMODE(os.stat(store.items_path(MEMBERS_TASK)).st_mode), 0o600)
+            self.assertEqual(stat.S_IMODE(os.stat(store.checkpoint_path).st_mode), 0o600)
+
+            # A complete crawl has nothing left to fetch.
+            client = build_client()
+            summary = OrganizationCrawler(lightdash_client=client, directory=directory).crawl()
+            self.assertEqual(summary.skipped_tasks, summary.tasks)
+            self.assertEqual(client.requests, [])
@@ -0,0 +1,91 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.services.organization_member_directory import (
+    OrganizationMemberDirectory,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+from tests.lightdash.services.test_list_organization_members_v1 import (
+    MEMBERS_PATH,
+    build_members,
+)
+
+
+class MutableMembers:
+    """Handler serving the current state of a changing organization"""
+
+    def __init__(self, members):
+        self.members = members
+
+    def __call__(self, parameters):
+        return paginated(self.members)(parameters)
+
+
+class TestOrganizationMemberDirectory(unittest.TestCase):
+    def test_refresh_applies_changes(self):
+        organization = MutableMembers(build_members(250))
+        client = FakeLightdashClient(routes={MEMBERS_PATH: organization})
+        directory = OrganizationMemberDirectory(lightdash_client=client)
+
+        stats = directory.refresh()
+        self.assertEqual((stats.added, stats.updated, stats.removed, stats.unchanged), (250, 0, 0, 0))
+        self.assertEqual(len(directory), 250)
+        unchanged_member = directory.get("user-1")
+
+        members = build_members(252)
+        members[5] = {**members[5], "userUpdatedAt": "2025-02-01T00:00:00Z", "email": "renamed@example.com"}
+        members[6] = {**members[6], "role": "editor"}
+        del members[3]
+        organization.members = members
+
+        stats = asyncio.run(directory.arefresh())
+        self.assertEqual((stats.added, stats.updated, stats.removed, stats.unchanged), (2, 2, 1, 247))
+        self.assertEqual(stats.changed, 5)
+        self.assertNotIn("user-3", directory)
+        self.assertIs(directory.get("user-1"), unchanged_member)
+        self.assertEqual(directory.get("user-6").role, "editor")
+        self.assertEqual(directory.find_by_email("RENAMED@example.com").userUuid, "user-5")
+        self.assertIsNone(directory.find_by_email("user-5@example.com"))
+        self.assertIsNone(directory.find_by_email("user-3@example.com"))
+        self.assertEqual(directory.find_by_email("user-251@example.com").userUuid, "user-251")
+
+    def test_refresh_picks_up_invitation_changes(self):
+        members = build_members(3)
+        members[1] = {**members[1], "isPending": True, "isInviteExpired": False}
+        members[2] = {**members[2], "isPending": True, "isInviteExpired": False}
+        organization = MutableMembers(members)
+        client = FakeLightdashClient(routes={MEMBERS_PATH: organization})
+        directory = OrganizationMemberDirectory(lightdash_client=client)
+        directory.refresh()
+
+        members = [dict(member) for member in members]
+        members[1]["isPending"] = False
+        members[2]["isInviteExpired"] = True
+        organization.members = members
+
+        stats = directory.refresh()
+        self.assertEqual((stats.updated, stats.unchanged), (2, 1))
+        self.assertFalse(directory.get("user-1").isPending)
+        self.assertTrue(directory.get("user-2").isInviteExpired)
+
+    def test_refresh_if_older_than(self):
+        client = FakeLightdashClient(routes={MEMBERS_PATH: MutableMembers(build_members(10))})
+        directory = OrganizationMemberDirectory(lightdash_client=client)
+
+        self.assertIsNotNone(directory.refresh_if_older_than(60))
+        self.assertIsNone(directory.refresh_if_older_than(60))
+        self.assertEqual(len(client.requests), 1)
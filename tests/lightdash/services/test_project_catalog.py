@@ -0,0 +1,113 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from lightdash_ai_tools.common.tools.get_explore import GetExplore
+from lightdash_ai_tools.lightdash.services.project_catalog import ProjectCatalogService
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+PROJECT_UUID = "project-1"
+
+
+def build_explore(name: str) -> dict:
+    return {
+        "status": "ok",
+        "results": {
+            "name": name,
+            "label": name.title(),
+            "baseTable": name,
+            "dimensions": {
+                f"{name}_id": {"name": "id", "table": name, "label": "ID", "type": "string"},
+            },
+            "metrics": {
+                f"{name}_count": {"name": "count", "table": name, "label": "Count", "type": "count"},
+            },
+            "joinedTables": [{"table": "customers", "sqlOn": "1 = 1", "type": "left"}],
+        },
+    }
+
+
+def build_client(explore_names):
+    routes = {
+        f"/api/v1/projects/{PROJECT_UUID}/explores": {
+            "status": "ok",
+            "results": [{"name": name, "type": "default"} for name in explore_names],
+        },
+    }
+    for name in explore_names:
+        routes[f"/api/v1/projects/{PROJECT_UUID}/explores/{name}"] = build_explore(name)
+    return FakeLightdashClient(routes=routes)
+
+
+class TestProjectCatalogService(unittest.TestCase):
+    def test_build(self):
+        client = build_client(["orders", "payments", "customers"])
+        catalog = ProjectCatalogService(lightdash_client=client).build(PROJECT_UUID, max_concurrency=2)
+
+        self.assertEqual([explore.name for explore in catalog.list_explores()], ["orders", "payments", "customers"])
+        self.assertEqual(catalog.get_explore("payments").label, "Payments")
+        self.assertEqual(catalog.get_field("orders", "orders_count").name, "count")
+        self.assertEqual(len(catalog.get_joined_tables("orders")), 1)
+        self.assertIsNone(catalog.get_explore("unknown"))
+        self.assertEqual(len(client.requests), 4)
+
+    def test_abuild(self):
+        client = build_client(["orders", "payments"])
+        catalog = asyncio.run(ProjectCatalogService(lightdash_client=client).abuild(PROJECT_UUID, max_concurrency=1))
+
+        self.assertEqual(sorted(catalog.explore_details), ["orders", "payments"])
+        self.assertEqual(sorted(catalog.search_fields("count")), ["orders", "payments"])
+
+    def test_tool_answers_from_catalog(self):
+        client = build_client(["orders"])
+        catalog = ProjectCatalogService(lightdash_client=client).build(PROJECT_UUID)
+        client.requests.clear()
+
+        explore = GetExplore(lightdash_client=client, catalog=catalog).call(PROJECT_UUID, "orders")
+
+        self.assertEqual(explore.name, "orders")
+        self.assertEqual(client.requests, [])
+
+    def test_build_summaries(self):
+        client = build_client(["orders", "payments"])
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        summaries = ProjectCatalogService(lightdash_client=client).build_summaries(PROJECT_UUID, executor=executor)
+
+        self.assertEqual(sorted(summaries), ["orders", "payments"])
+        self.assertEqual([field.field_id for field in summaries["orders"].metrics], ["orders_count"])
+        self.assertEqual(executor.submit(len, "still running").result(), 13)
+        executor.shutdown()
+
+    def test_build_summaries_on_its_own_pool(self):
+        client = build_client(["orders", "payments"])
+
+        summaries = ProjectCatalogService(lightdash_client=client).build_summaries(PROJECT_UUID, max_workers=1)
+
+        self.assertEqual(summaries["payments"].to_model().label, "Payments")
+        self.assertEqual(len(client.requests), 3)
+
+    def test_build_in_processes(self):
+        client = build_client(["orders", "payments", "customers"])
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            catalog = ProjectCatalogService(lightdash_client=client).build_in_processes(PROJECT_UUID, max_concurrency=2, executor=executor)
+
+        self.assertEqual([explore.name for explore in catalog.list_explores()], ["orders", "payments", "customers"])
+        self.assertEqual(catalog.get_explore("payments").label, "Payments")
+        self.assertEqual(catalog.get_field("orders", "orders_count").name, "count")
+        self.assertEqual(catalog.get_joined_tables("orders")[0].table, "customers")
+        self.assertEqual(len(client.requests), 4)
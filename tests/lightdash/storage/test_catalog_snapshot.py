@@ -0,0 +1,89 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import (
+    GetExploreV1Results,
+    Metric,
+)
+from lightdash_ai_tools.lightdash.models.get_explores_v1 import GetExploresV1Results
+from lightdash_ai_tools.lightdash.models.project_catalog import ProjectCatalog
+from lightdash_ai_tools.lightdash.storage.catalog_snapshot import (
+    CatalogSnapshot,
+    write_catalog_snapshot,
+)
+
+
+def build_catalog() -> ProjectCatalog:
+    explore_details = {}
+    for name in ["payments", "orders", "customers"]:
+        explore_details[name] = GetExploreV1Results(
+            name=name,
+            label=name.title(),
+            baseTable=name,
+            dimensions={
+                f"{name}_{column}": {"name": column, "table": name, "type": "string", "hidden": column == "secret"}
+                for column in ["id", "created_at", "secret"]
+            },
+            metrics={
+                f"{name}_count": {"name": "count", "table": name, "type": "count", "description": "Number of rows"},
+            },
+            joinedTables=[{"table": "regions", "type": "left", "sqlOn": "${regions.id} = 1"}],
+        )
+    explores = [GetExploresV1Results(name=name, type="default") for name in explore_details]
+    return ProjectCatalog(project_uuid="project-1", explores=explores, explore_details=explore_details)
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "catalog.bin")
+        write_catalog_snapshot(build_catalog(), self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookup(self):
+        with CatalogSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.project_uuid, "project-1")
+            self.assertEqual(len(snapshot), 3)
+            self.assertEqual(snapshot.explore_names(), ["customers", "orders", "payments"])
+            self.assertNotIn("unknown", snapshot)
+
+            explore = snapshot.get_explore("orders")
+            self.assertEqual(explore.label, "Orders")
+            self.assertEqual(explore.type, "default")
+            self.assertEqual(len(explore.dimensions()), 3)
+            self.assertEqual([metric.reference for metric in explore.metrics()], ["orders_count"])
+            self.assertEqual(explore.joined_tables()[0].table, "regions")
+
+            field = snapshot.get_field("orders", "orders_secret")
+            self.assertTrue(field.hidden)
+            self.assertIsNone(snapshot.get_field("orders", "orders_unknown"))
+
+    def test_to_model(self):
+        with CatalogSnapshot(self.path) as snapshot:
+            metric = snapshot.get_field("payments", "payments_count").to_model()
+        self.assertIsInstance(metric, Metric)
+        self.assertEqual(metric.description, "Number of rows")
+        self.assertEqual(metric.reference, "payments_count")
+
+    def test_invalid_file(self):
+        with open(self.path, "r+b") as snapshot_file:
+            snapshot_file.write(b"NOTACATALOG")
+        with self.assertRaises(ValueError):
+            CatalogSnapshot(self.path)
@@ -0,0 +1,210 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+import httpx
+
+from lightdash_ai_tools.lightdash.api.get_project_v1 import GetProjectV1
+from lightdash_ai_tools.lightdash.cache import ApiResponseCache
+from lightdash_ai_tools.lightdash.memory import estimate_size
+from lightdash_ai_tools.lightdash.models.get_explore_v1 import GetExploreV1Results
+from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
+    OrganizationMemberModel,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient
+
+PROJECT_PATH = "/api/v1/projects/project-1"
+MISSING_PROJECT_PATH = "/api/v1/projects/missing"
+
+
+def not_found(parameters):
+    request = httpx.Request("GET", f"https://lightdash.example.com{MISSING_PROJECT_PATH}")
+    response = httpx.Response(404, request=request)
+    raise httpx.HTTPStatusError("Not Found", request=request, response=response)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestApiResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ApiResponseCache(ttl=60, negative_ttl=5, max_entries=2, clock=self.clock)
+        self.client = FakeLightdashClient(
+            cache=self.cache,
+            routes={
+                PROJECT_PATH: {
+                    "status": "ok",
+                    "results": {"name": "Project", "projectUuid": "project-1", "organizationUuid": "org-1"},
+                },
+                MISSING_PROJECT_PATH: not_found,
+            },
+        )
+
+    def test_positive_entries(self):
+        api = GetProjectV1(lightdash_client=self.client)
+        first = api.call("project-1")
+        second = api.call(project_uuid="project-1")
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.client.requests), 1)
+        self.assertEqual(self.cache.metrics.hits, 1)
+        self.assertEqual(self.cache.metrics.misses, 1)
+
+    def test_negative_entries(self):
+        api = GetProjectV1(lightdash_client=self.client)
+        for _ in range(3):
+            with self.assertRaises(httpx.HTTPStatusError) as context:
+                api.call("missing")
+            self.assertEqual(context.exception.response.status_code, 404)
+
+        self.assertEqual(len(self.client.requests), 1)
+        self.assertEqual(self.cache.negative_metrics.misses, 1)
+        self.assertEqual(self.cache.negative_metrics.hits, 2)
+        self.assertEqual(self.cache.metrics.hits, 0)
+
+        self.clock.now = 6
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(api.acall("missing"))
+        self.assertEqual(len(self.client.requests), 2)
+        self.assertEqual(self.cache.negative_metrics.expirations, 1)
+
+    def test_eviction(self):
+        cache = ApiResponseCache(max_entries=2)
+        for index in range(3):
+            cache.set(("endpoint", index), "endpoint", index)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(("endpoint", 0)))
+        self.assertEqual(cache.get(("endpoint", 2)).unwrap(), 2)
+        self.assertEqual(cache.metrics.evictions, 1)
+
+
+def build_explore(num_fields: int) -> GetExploreV1Results:
+    return GetExploreV1Results(
+        name="orders",
+        dimensions={
+            f"orders_field_{index}": {"name": f"field_{index}", "table": "orders", "sql": "x" * 200}
+            for index in range(num_fields)
+        },
+    )
+
+
+class TestByteBudget(unittest.TestCase):
+    def test_estimate_size(self):
+        small, large = build_explore(10), build_explore(1000)
+        self.assertGreater(estimate_size(large), 50 * estimate_size(small))
+
+        members = [
+            OrganizationMemberModel(
+                userUuid=f"user-{index}",
+                userCreatedAt="2025-01-01",
+                userUpdatedAt="2025-01-01",
+                firstName=f"First {index}",
+                lastName=f"Last {index}",
+                organizationUuid="org-1",
+                role="admin",
+                email=f"user-{index}@example.com",
+            )
+            for index in range(100)
+        ]
+        self.assertGreater(estimate_size(members), 50 * estimate_size(members[0]))
+
+    def test_evicts_by_bytes(self):
+        small_size = estimate_size(build_explore(10))
+        cache = ApiResponseCache(max_entries=None, max_bytes=small_size * 6)
+        for index in range(5):
+            cache.set(("GetExploreV1", index), "GetExploreV1", build_explore(10))
+        cache.set(("ListOrganizationMembersV1", 1), "ListOrganizationMembersV1", ["member"] * 10)
+        self.assertEqual(len(cache), 6)
+        self.assertEqual(set(cache.bytes_by_endpoint()), {"GetExploreV1", "ListOrganizationMembersV1"})
+
+        cache.set(("GetExploreV1", "large"), "GetExploreV1", build_explore(25))
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+        self.assertGreater(cache.metrics.evictions, 0)
+        self.assertIsNotNone(cache.get(("GetExploreV1", "large")))
+        self.assertEqual(sum(cache.bytes_by_endpoint().values()), cache.current_bytes)
+
+        cache.set(("GetExploreV1", "huge"), "GetExploreV1", build_explore(1000))
+        self.assertIsNone(cache.get(("GetExploreV1", "huge")))
+        self.assertEqual(cache.metrics.rejections, 1)
+
+    def test_sizes_only_with_a_budget(self):
+        sized = []
+
+        def sizer(value):
+            sized.append(value)
+            return 1
+
+        cache = ApiResponseCache(sizer=sizer)
+        cache.set(("GetExploreV1", 1), "GetExploreV1", build_explore(10))
+        self.assertEqual(sized, [])
+        self.assertEqual(cache.current_bytes, 0)
+
+        cache.max_bytes = 100
+        cache.set(("GetExploreV1", 2), "GetExploreV1", build_explore(10))
+        self.assertEqual(len(sized), 1)
+
+    def test_calibrates_body_lengths_per_endpoint(self):
+        walked = []
+
+        def sizer(value):
+            walked.append(value)
+            return 4 * len(value)
+
+        cache = ApiResponseCache(max_entries=None, max_bytes=1_000_000, sizer=sizer, calibration_interval=3)
+        for index in range(4):
+            cache.set(("GetExploreV1", index), "GetExploreV1", "x" * 100, size=50)
+        cache.set(("GetGroupV1", 1), "GetGroupV1", "y" * 10, size=20)
+        cache.set(("GetGroupV1", 2), "GetGroupV1", "y" * 10, size=30)
+
+        # One in three explores is walked, the second group is weighed by the ratio of the first one.
+        self.assertEqual(len(walked), 3)
+        self.assertEqual(cache.bytes_by_endpoint(), {"GetExploreV1": 4 * 400, "GetGroupV1": 40 + 60})
+
+    def test_weighs_responses_by_retained_size(self):
+        walked = []
+
+        def sizer(value):
+            walked.append(value)
+            return estimate_size(value)
+
+        cache = ApiResponseCache(max_bytes=10_000_000, sizer=sizer)
+        routes = {}
+        for project_uuid, name in (("project-1", "Project"), ("project-2", "Project with a longer name")):
+            routes[f"/api/v1/projects/{project_uuid}"] = {
+                "status": "ok",
+                "results": {"name": name, "projectUuid": project_uuid, "organizationUuid": "org-1"},
+            }
+        client = FakeLightdashClient(cache=cache, routes=routes)
+        api_call = GetProjectV1(lightdash_client=client)
+
+        first = api_call.call("project-1")
+        first_body = api_call.last_response_size
+        self.assertEqual(cache.current_bytes, estimate_size(first))
+        api_call.call("project-2")
+
+        self.assertEqual(walked, [first])
+        self.assertEqual(
+            cache.current_bytes,
+            estimate_size(first) + round(api_call.last_response_size * estimate_size(first) / first_body),
+        )
+        self.assertGreater(cache.current_bytes, first_body + api_call.last_response_size)
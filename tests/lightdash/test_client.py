@@ -0,0 +1,62 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from lightdash_ai_tools.lightdash.client import LightdashClient, RequestType
+
+
+class TestLightdashClient(unittest.TestCase):
+    def test_pooled_http_client(self):
+        client = LightdashClient(base_url="https://lightdash.example.com/", token="token")
+        http_client = client._get_http_client()
+        self.assertIs(client._get_http_client(), http_client)
+
+        client.close()
+        self.assertTrue(http_client.is_closed)
+        self.assertIsNot(client._get_http_client(), http_client)
+        client.close()
+
+    def test_call_shares_http_client_across_threads(self):
+        requested_urls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            self.assertEqual(request.headers["Authorization"], "ApiKey token")
+            return httpx.Response(200, json={"page": request.url.params["page"]})
+
+        client = LightdashClient(base_url="https://lightdash.example.com/", token="token")
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(
+                lambda page: client.call(RequestType.GET, "/api/v1/org/users", parameters={"page": page}),
+                range(1, 9),
+            ))
+
+        self.assertEqual(responses, [{"page": str(page)} for page in range(1, 9)])
+        self.assertEqual(len(requested_urls), 8)
+        client.close()
+
+    def test_call_raw_returns_undecoded_body(self):
+        body = b'{"status": "ok", "results": []}'
+        client = LightdashClient(base_url="https://lightdash.example.com/", token="token")
+        client._http_client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+
+        self.assertEqual(client.call_raw(RequestType.GET, "/api/v1/org/projects"), body)
+        self.assertEqual(client.call(RequestType.GET, "/api/v1/org/projects"), {"status": "ok", "results": []})
+        client.close()
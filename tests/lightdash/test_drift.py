@@ -0,0 +1,165 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.api.get_explore_v1 import (
+    GetExploreV1,
+    GetSlimExploreV1,
+)
+from lightdash_ai_tools.lightdash.api.list_groups_in_organization_v1 import (
+    ListGroupsInOrganizationV1,
+)
+from lightdash_ai_tools.lightdash.api.list_organization_members_v1 import (
+    ListOrganizationMembersV1,
+)
+from lightdash_ai_tools.lightdash.drift import DriftMonitor
+from lightdash_ai_tools.lightdash.models.list_organization_members_v1 import (
+    OrganizationMemberModel,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+from tests.lightdash.models.test_slim_explore import EXPLORE_PATH, build_response
+from tests.lightdash.services.test_list_groups_in_organization_v1 import (
+    GROUPS_PATH,
+    build_groups,
+)
+from tests.lightdash.services.test_list_organization_members_v1 import (
+    MEMBERS_PATH,
+    build_members,
+)
+
+
+def build_client(members: list, monitor: DriftMonitor) -> FakeLightdashClient:
+    return FakeLightdashClient(
+        routes={MEMBERS_PATH: paginated(members), GROUPS_PATH: paginated(build_groups(5))},
+        drift_monitor=monitor,
+    )
+
+
+class TestDriftMonitor(unittest.TestCase):
+    def test_matching_responses_do_not_drift(self):
+        monitor = DriftMonitor(sample_rate=1.0)
+        client = build_client(build_members(5), monitor)
+
+        ListOrganizationMembersV1(lightdash_client=client).call()
+        ListGroupsInOrganizationV1(lightdash_client=client).call()
+
+        self.assertEqual(monitor.metrics.checked, 2)
+        self.assertEqual(monitor.metrics.drifted, 0)
+        self.assertEqual(monitor.reports, [])
+
+    def test_reports_unknown_keys_and_coerced_values(self):
+        members = build_members(3)
+        members[1]["nickname"] = "nick"
+        members[2]["isActive"] = "true"
+        found = []
+        monitor = DriftMonitor(sample_rate=1.0, on_drift=found.append)
+        client = build_client(members, monitor)
+
+        response = asyncio.run(ListOrganizationMembersV1(lightdash_client=client).acall())
+
+        self.assertTrue(response.results.data[2].isActive)
+        self.assertEqual(monitor.metrics.drifted, 1)
+        self.assertEqual(found, monitor.reports)
+        drift = found[0]
+        self.assertEqual(drift.endpoint, "ListOrganizationMembersV1")
+        self.assertEqual(drift.model, "ListOrganizationMembersV1Response")
+        self.assertEqual(
+            [(error["type"], error["loc"]) for error in drift.errors],
+            [
+                ("extra_forbidden", ("results", "data", 1, "nickname")),
+                ("bool_type", ("results", "data", 2, "isActive")),
+            ],
+        )
+        self.assertNotIn("input", drift.errors[0])
+
+    def test_samples_responses(self):
+        monitor = DriftMonitor(sample_rate=0.25, seed=7)
+        client = build_client(build_members(1), monitor)
+
+        for _ in range(200):
+            ListOrganizationMembersV1(lightdash_client=client).call()
+
+        metrics = monitor.metrics
+        self.assertEqual(metrics.responses, 200)
+        self.assertGreater(metrics.checked, 20)
+        self.assertLess(metrics.checked, 80)
+
+    def test_disabled_sampling_checks_nothing(self):
+        members = build_members(1)
+        members[0]["nickname"] = "nick"
+        monitor = DriftMonitor(sample_rate=0.0)
+
+        ListOrganizationMembersV1(lightdash_client=build_client(members, monitor)).call()
+
+        self.assertEqual(monitor.metrics.checked, 0)
+
+    def test_keeps_most_recent_reports(self):
+        members = build_members(1)
+        members[0]["nickname"] = "nick"
+        monitor = DriftMonitor(sample_rate=1.0, max_reports=2)
+        client = build_client(members, monitor)
+
+        for _ in range(3):
+            ListOrganizationMembersV1(lightdash_client=client).call()
+
+        self.assertEqual(monitor.metrics.drifted, 3)
+        self.assertEqual(len(monitor.reports), 2)
+
+    def test_checks_decoded_documents(self):
+        monitor = DriftMonitor(sample_rate=1.0)
+        member = {**build_members(1)[0], "nickname": "nick"}
+
+        drift = monitor.check("ListOrganizationMembersV1", OrganizationMemberModel, member)
+
+        self.assertEqual(drift.errors[0]["loc"], ("nickname",))
+
+    def test_slim_explore_is_not_monitored(self):
+        monitor = DriftMonitor(sample_rate=1.0)
+        client = FakeLightdashClient(routes={EXPLORE_PATH: build_response(10)}, drift_monitor=monitor)
+
+        GetSlimExploreV1(lightdash_client=client).call("project-1", "orders")
+        GetExploreV1(lightdash_client=client).call("project-1", "orders")
+
+        self.assertEqual(monitor.metrics.responses, 1)
+
+    def test_trusted_endpoints_parse_on_the_fast_path(self):
+        members = build_members(5)
+        trusting = build_client(members, DriftMonitor(sample_rate=0.0, trusted_endpoints=["ListOrganizationMembersV1"]))
+        trusted_call = ListOrganizationMembersV1(lightdash_client=trusting)
+        untrusted_call = ListOrganizationMembersV1(lightdash_client=build_client(members, DriftMonitor(sample_rate=0.0)))
+
+        self.assertTrue(trusted_call.trusted)
+        self.assertFalse(untrusted_call.trusted)
+        self.assertFalse(ListGroupsInOrganizationV1(lightdash_client=trusting).trusted)
+        self.assertFalse(GetSlimExploreV1(lightdash_client=trusting).trusted)
+        self.assertEqual(trusted_call.call(), untrusted_call.call())
+        self.assertEqual(asyncio.run(trusted_call.acall()), untrusted_call.call())
+
+    def test_trusted_endpoints_are_still_checked(self):
+        members = build_members(2)
+        members[1]["nickname"] = "nick"
+        monitor = DriftMonitor(sample_rate=1.0, trusted_endpoints=["ListOrganizationMembersV1"])
+
+        response = ListOrganizationMembersV1(lightdash_client=build_client(members, monitor)).call()
+
+        self.assertEqual(len(response.results.data), 2)
+        self.assertEqual(monitor.metrics.drifted, 1)
+        self.assertEqual(monitor.reports[0].errors[0]["loc"], ("results", "data", 1, "nickname"))
+
+    def test_invalid_sample_rate(self):
+        with self.assertRaises(ValueError):
+            DriftMonitor(sample_rate=1.5)
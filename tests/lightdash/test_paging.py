@@ -0,0 +1,141 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from lightdash_ai_tools.lightdash.cache import ApiResponseCache
+from lightdash_ai_tools.lightdash.client import RequestType
+from lightdash_ai_tools.lightdash.paging import AdaptivePageSizer
+from lightdash_ai_tools.lightdash.services.list_organization_members_v1 import (
+    ENDPOINT,
+    ListOrganizationMembersV1Service,
+)
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, paginated
+from tests.lightdash.services.test_list_organization_members_v1 import (
+    MEMBERS_PATH,
+    build_members,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def build_client(count: int, seconds_per_item: float, page_sizer: AdaptivePageSizer, clock: FakeClock):
+    handler = paginated(build_members(count))
+
+    def slow_handler(parameters):
+        clock.now += seconds_per_item * int(parameters["pageSize"])
+        return handler(parameters)
+
+    return FakeLightdashClient(routes={MEMBERS_PATH: slow_handler}, page_sizer=page_sizer)
+
+
+def assert_contiguous(test: unittest.TestCase, client: FakeLightdashClient) -> None:
+    offset = 0
+    for _, parameters in client.requests:
+        test.assertEqual((parameters["page"] - 1) * parameters["pageSize"], offset)
+        offset += parameters["pageSize"]
+
+
+class TestAdaptivePageSizer(unittest.TestCase):
+    def test_record(self):
+        sizer = AdaptivePageSizer(initial_page_size=100, min_page_size=25, max_page_size=300, max_page_bytes=1000)
+
+        self.assertEqual(sizer.record("endpoint", 100, 100, elapsed=0.1, num_bytes=100), 200)
+        self.assertEqual(sizer.record("endpoint", 200, 200, elapsed=0.1, num_bytes=100), 300)
+        self.assertEqual(sizer.record("endpoint", 300, 300, elapsed=0.7, num_bytes=100), 300)
+        self.assertEqual(sizer.record("endpoint", 300, 300, elapsed=2.0, num_bytes=100), 150)
+        self.assertEqual(sizer.record("endpoint", 150, 150, elapsed=0.1, num_bytes=2000), 75)
+        self.assertEqual(sizer.record("endpoint", 50, 50, elapsed=5.0, num_bytes=100), 25)
+        self.assertEqual(sizer.page_size_for("endpoint"), 25)
+        self.assertEqual(sizer.page_size_for("other"), 100)
+
+        # Pages of unknown length, e.g. already decoded documents, are only judged by latency.
+        self.assertEqual(sizer.record("unknown", 100, 100, elapsed=0.1, num_bytes=None), 200)
+
+    def test_grows_on_fast_instance(self):
+        clock = FakeClock()
+        sizer = AdaptivePageSizer(initial_page_size=25, max_page_size=800, target_latency=1.0, clock=clock)
+        client = build_client(1000, seconds_per_item=0.004, page_sizer=sizer, clock=clock)
+
+        members = list(ListOrganizationMembersV1Service(lightdash_client=client).iter_members())
+
+        self.assertEqual([member.userUuid for member in members], [f"user-{index}" for index in range(1000)])
+        assert_contiguous(self, client)
+        self.assertEqual(sizer.page_sizes(), {ENDPOINT: 200})
+        self.assertLess(len(client.requests), 1000 // 25)
+
+    def test_shrinks_on_slow_instance(self):
+        clock = FakeClock()
+        sizer = AdaptivePageSizer(initial_page_size=400, target_latency=1.0, clock=clock)
+        client = build_client(1000, seconds_per_item=0.01, page_sizer=sizer, clock=clock)
+        service = ListOrganizationMembersV1Service(lightdash_client=client)
+
+        async def collect():
+            return [member.userUuid async for member in service.aiter_members()]
+
+        self.assertEqual(asyncio.run(collect()), [f"user-{index}" for index in range(1000)])
+        assert_contiguous(self, client)
+        self.assertEqual(client.requests[0][1]["pageSize"], 400)
+        self.assertEqual(sizer.page_size_for(ENDPOINT), 100)
+
+        # The remembered size is reused, including by the concurrent listing.
+        client.requests.clear()
+        asyncio.run(service.aget_all_members())
+        self.assertEqual({parameters["pageSize"] for _, parameters in client.requests}, {100})
+
+    def test_ignores_cached_pages(self):
+        clock = FakeClock()
+        sizer = AdaptivePageSizer(initial_page_size=100, target_latency=1.0, clock=clock)
+        client = build_client(500, seconds_per_item=0.007, page_sizer=sizer, clock=clock)
+        client.cache = ApiResponseCache()
+        service = ListOrganizationMembersV1Service(lightdash_client=client)
+        list(service.iter_members())
+        self.assertEqual(sizer.page_sizes(), {ENDPOINT: 100})
+        client.requests.clear()
+
+        # Cached pages arrive instantly but say nothing about the server, so they don't grow the pages.
+        self.assertEqual(len(list(service.iter_members())), 500)
+        self.assertEqual(client.requests, [])
+        self.assertEqual(sizer.page_sizes(), {ENDPOINT: 100})
+
+    def test_explicit_page_size(self):
+        clock = FakeClock()
+        sizer = AdaptivePageSizer(clock=clock)
+        client = build_client(250, seconds_per_item=0.0, page_sizer=sizer, clock=clock)
+
+        ListOrganizationMembersV1Service(lightdash_client=client).get_all_members(page_size=50)
+
+        self.assertEqual(len(client.requests), 5)
+        self.assertEqual(sizer.page_sizes(), {})
+
+    def test_shrinks_on_heavy_bodies(self):
+        clock = FakeClock()
+        client = build_client(400, seconds_per_item=0.0, page_sizer=AdaptivePageSizer(clock=clock), clock=clock)
+        body_length = len(client.call_raw(RequestType.GET, MEMBERS_PATH, parameters={"page": 1, "pageSize": 100}))
+        sizer = AdaptivePageSizer(initial_page_size=100, min_page_size=25, max_page_bytes=body_length - 1, clock=clock)
+        client.page_sizer = sizer
+        client.requests.clear()
+
+        members = list(ListOrganizationMembersV1Service(lightdash_client=client).iter_members())
+
+        self.assertEqual(len(members), 400)
+        assert_contiguous(self, client)
+        self.assertEqual([parameters["pageSize"] for _, parameters in client.requests[:2]], [100, 50])
@@ -0,0 +1,89 @@
+# Copyright 2025 yu-iskw
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from lightdash_ai_tools.cli import build_parser, main
+from lightdash_ai_tools.lightdash.storage.catalog_snapshot import CatalogSnapshot
+from tests.lightdash.fake_lightdash_client import FakeLightdashClient, failing
+from tests.lightdash.fake_organization import (
+    build_organization_client,
+    project_routes,
+)
+
+ORDERS = {"status": "ok", "results": {"name": "orders"}}
+
+
+def run_warm(client: FakeLightdashClient, *arguments: str):
+    """Run the warm command with `client`, returning its exit code, its error output and the mocked close."""
+    stderr = io.StringIO()
+    with mock.patch("lightdash_ai_tools.cli.build_client_from_env", return_value=client), \
+            mock.patch.object(FakeLightdashClient, "close") as close, \
+            contextlib.redirect_stdout(io.StringIO()), \
+            contextlib.redirect_stderr(stderr):
+        exit_code = main(["warm", *arguments, "--quiet"])
+    return exit_code, stderr.getvalue(), close
+
+
+class TestWarmCommand(unittest.TestCase):
+    def test_requires_snapshot_dir(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            build_parser().parse_args(["warm"])
+
+    def test_writes_snapshots_and_closes_client(self):
+        client = build_organization_client("project-1", "project-2")
+        for project_uuid in ("project-1", "project-2"):
+            client.routes.update(project_routes(project_uuid, {"orders": ORDERS}))
+
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            exit_code, _, close = run_warm(client, snapshot_dir, "--concurrency", "4")
+            for project_uuid in ("project-1", "project-2"):
+                with CatalogSnapshot(os.path.join(snapshot_dir, f"{project_uuid}.ldcat")) as snapshot:
+                    self.assertEqual(snapshot.project_uuid, project_uuid)
+                    self.assertEqual(snapshot.explore_names(), ["orders"])
+
+        self.assertEqual(exit_code, 0)
+        close.assert_called_once_with()
+
+    def test_failing_project_does_not_abort_the_others(self):
+        client = build_organization_client("project-1", "project-2")
+        client.routes.update(project_routes("project-1", {"orders": ORDERS}))
+        client.routes.update(project_routes("project-2", {"orders": failing(403)}))
+
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            exit_code, stderr, close = run_warm(client, snapshot_dir)
+            self.assertTrue(os.path.exists(os.path.join(snapshot_dir, "project-1.ldcat")))
+            self.assertFalse(os.path.exists(os.path.join(snapshot_dir, "project-2.ldcat")))
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Failed to build the catalog of project project-2: HTTPStatusError", stderr)
+        self.assertIn("Failed to snapshot 1 of 2 projects", stderr)
+        close.assert_called_once_with()
+
+    def test_failing_project_listing(self):
+        client = build_organization_client()
+        client.routes["/api/v1/org/projects"] = failing(500)
+
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            exit_code, stderr, close = run_warm(client, snapshot_dir)
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Failed to list the projects to snapshot: HTTPStatusError", stderr)
+        close.assert_called_once_with()